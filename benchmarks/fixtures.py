@@ -0,0 +1,287 @@
+"""Synthetic Tuva-shaped DuckDB database and dbt manifest for benchmarking.
+
+The fixture reproduces the schemas, table names and column shapes the server is
+queried against (core, chronic_conditions, hcc_suspecting, ...), with
+deterministic pseudo-random values so runs at the same size are comparable.
+"""
+
+import json
+from pathlib import Path
+
+import duckdb
+
+# `rows` is the size of the largest fact table (core.medical_claim). Other tables
+# are scaled from it the way they roughly are in the Tuva demo project.
+PATIENTS_PER_ROW = 0.05
+
+CONDITIONS = [
+    "Type 2 Diabetes Mellitus",
+    "Hypertension",
+    "Hyperlipidemia",
+    "Chronic Kidney Disease",
+    "Heart Failure",
+    "Asthma",
+    "COPD",
+    "Depression",
+    "Obesity",
+    "Atrial Fibrillation",
+]
+
+# schema -> {table: SELECT producing its rows}. `{rows}` and `{patients}` are
+# substituted with the scaled row counts; `h(x)` is a deterministic hash in [0, 1)
+# and `hi(x, n)` a deterministic INTEGER in [0, n).
+TABLES = {
+    "core": {
+        "patient": """
+            SELECT i AS person_id,
+                   'P' || i AS patient_id,
+                   CASE WHEN h(i) < 0.5 THEN 'female' ELSE 'male' END AS sex,
+                   CASE WHEN h(i + 1) < 0.6 THEN 'white'
+                        WHEN h(i + 1) < 0.8 THEN 'black or african american'
+                        ELSE 'asian' END AS race,
+                   DATE '1940-01-01' + hi(i + 2, 25000) AS birth_date,
+                   CASE WHEN h(i + 3) < 0.03 THEN DATE '2023-01-01'
+                        + hi(i + 4, 700) END AS death_date,
+                   ['CA', 'NY', 'TX', 'FL', 'WA'][1 + hi(i + 5, 5)] AS state,
+                   lpad(CAST(hi(i + 6, 99999) AS VARCHAR), 5, '0') AS zip_code,
+                   'medicare' AS data_source,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients}) t(i)
+        """,
+        "member_months": """
+            SELECT p.i AS person_id,
+                   'M' || p.i AS member_id,
+                   strftime(DATE '2023-01-01' + INTERVAL (m.i) MONTH, '%Y%m') AS year_month,
+                   CASE WHEN h(p.i) < 0.7 THEN 'medicare' ELSE 'medicaid' END AS payer,
+                   'default' AS plan,
+                   'medicare' AS data_source,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients}) p(i), range(12) m(i)
+        """,
+        "encounter": """
+            SELECT i AS encounter_id,
+                   hi(i, {patients}) AS person_id,
+                   ['acute inpatient', 'emergency department', 'office visit',
+                    'outpatient surgery', 'home health'][1 + hi(i + 1, 5)]
+                       AS encounter_type,
+                   DATE '2023-01-01' + hi(i + 2, 700) AS encounter_start_date,
+                   DATE '2023-01-01' + hi(i + 2, 700)
+                       + hi(i + 3, 10) AS encounter_end_date,
+                   CAST(h(i + 4) * 20000 AS DECIMAL(18, 2)) AS paid_amount,
+                   CAST(h(i + 5) * 25000 AS DECIMAL(18, 2)) AS allowed_amount,
+                   'medicare' AS data_source,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({rows} // 4) t(i)
+        """,
+        "condition": """
+            SELECT 'C' || i AS condition_id,
+                   hi(i, {patients}) AS person_id,
+                   hi(i + 1, ({rows} // 4)) AS encounter_id,
+                   DATE '2023-01-01' + hi(i + 2, 700) AS recorded_date,
+                   'icd-10-cm' AS normalized_code_type,
+                   ['E11.9', 'I10', 'E78.5', 'N18.3', 'I50.9', 'J45.909', 'J44.9',
+                    'F32.9', 'E66.9', 'I48.91'][1 + hi(i + 3, 10)]
+                       AS normalized_code,
+                   'medicare' AS data_source,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({rows} // 2) t(i)
+        """,
+        "medical_claim": """
+            SELECT 'CL' || i AS claim_id,
+                   1 + hi(i, 5) AS claim_line_number,
+                   CASE WHEN h(i + 1) < 0.2 THEN 'institutional' ELSE 'professional' END
+                       AS claim_type,
+                   hi(i + 2, {patients}) AS person_id,
+                   hi(i + 3, ({rows} // 4)) AS encounter_id,
+                   DATE '2023-01-01' + hi(i + 4, 700) AS claim_start_date,
+                   DATE '2023-01-01' + hi(i + 4, 700) AS claim_end_date,
+                   lpad(CAST(99200 + hi(i + 5, 99) AS VARCHAR), 5, '0')
+                       AS hcpcs_code,
+                   CAST(h(i + 6) * 2000 AS DECIMAL(18, 2)) AS paid_amount,
+                   CAST(h(i + 7) * 2500 AS DECIMAL(18, 2)) AS allowed_amount,
+                   CASE WHEN h(i + 8) < 0.7 THEN 'medicare' ELSE 'medicaid' END AS payer,
+                   'medicare' AS data_source,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({rows}) t(i)
+        """,
+    },
+    "chronic_conditions": {
+        "tuva_chronic_conditions_long": """
+            SELECT hi(i, {patients}) AS person_id,
+                   {conditions}[1 + hi(i + 1, {n_conditions})] AS condition,
+                   DATE '2015-01-01' + hi(i + 2, 3000) AS first_diagnosis_date,
+                   DATE '2023-01-01' + hi(i + 3, 700) AS last_diagnosis_date,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients} * 2) t(i)
+        """,
+        "cms_chronic_conditions_long": """
+            SELECT hi(i, {patients}) AS person_id,
+                   'Chronic Conditions' AS chronic_condition_type,
+                   {conditions}[1 + hi(i + 1, {n_conditions})] AS condition,
+                   DATE '2015-01-01' + hi(i + 2, 3000) AS first_diagnosis_date,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients} * 2) t(i)
+        """,
+    },
+    "cms_hcc": {
+        "patient_risk_scores": """
+            SELECT i AS person_id,
+                   2023 AS payment_year,
+                   round(h(i) * 3, 3) AS v24_risk_score,
+                   round(h(i + 1) * 3, 3) AS v28_risk_score,
+                   round(h(i + 2) * 3, 3) AS blended_risk_score,
+                   round(h(i + 3) * 3, 3) AS normalized_risk_score,
+                   round(h(i + 4) * 3, 3) AS payment_risk_score,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients}) t(i)
+        """,
+    },
+    "hcc_suspecting": {
+        "list": """
+            SELECT hi(i, {patients}) AS person_id,
+                   CAST(18 + hi(i + 1, 170) AS VARCHAR) AS hcc_code,
+                   {conditions}[1 + hi(i + 2, {n_conditions})]
+                       AS hcc_description,
+                   ['Prior coding history', 'Comorbidity', 'Lab result'][
+                       1 + hi(i + 3, 3)] AS reason,
+                   DATE '2023-01-01' + hi(i + 4, 700) AS suspect_date,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients}) t(i)
+        """,
+    },
+    "readmissions": {
+        "readmission_summary": """
+            SELECT i AS encounter_id,
+                   hi(i, {patients}) AS person_id,
+                   DATE '2023-01-01' + hi(i + 1, 700) AS admit_date,
+                   DATE '2023-01-01' + hi(i + 1, 700)
+                       + hi(i + 2, 12) AS discharge_date,
+                   h(i + 3) < 0.15 AS unplanned_readmit_30_flag,
+                   hi(i + 4, 900) AS ms_drg_code,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({rows} // 20) t(i)
+        """,
+    },
+    "financial_pmpm": {
+        "pmpm_prep": """
+            SELECT p.i AS person_id,
+                   strftime(DATE '2023-01-01' + INTERVAL (m.i) MONTH, '%Y%m') AS year_month,
+                   CASE WHEN h(p.i) < 0.7 THEN 'medicare' ELSE 'medicaid' END AS payer,
+                   CAST(h(p.i * 12 + m.i) * 3000 AS DECIMAL(18, 2)) AS medical_paid,
+                   CAST(h(p.i * 12 + m.i + 1) * 500 AS DECIMAL(18, 2)) AS pharmacy_paid,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range({patients}) p(i), range(12) m(i)
+        """,
+    },
+    "quality_measures": {
+        "summary_counts": """
+            SELECT 'NQF' || lpad(CAST(i AS VARCHAR), 4, '0') AS measure_id,
+                   'Measure ' || i AS measure_name,
+                   '2023' AS measure_version,
+                   hi(i, {patients}) AS denominator_sum,
+                   CAST(h(i) * h(i + 1) * {patients} AS INTEGER) AS numerator_sum,
+                   CAST(h(i + 2) * {patients} / 10 AS INTEGER) AS exclusion_sum,
+                   round(h(i + 1), 4) AS performance_rate,
+                   TIMESTAMP '2024-06-01 00:00:00' AS tuva_last_run
+            FROM range(40) t(i)
+        """,
+    },
+}
+
+
+def build_fixture_database(path: str | Path, rows: int = 10_000) -> Path:
+    """Create a synthetic Tuva-shaped DuckDB database at `path` (replacing any existing one)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    params = {
+        "rows": rows,
+        "patients": max(1, int(rows * PATIENTS_PER_ROW)),
+        "conditions": "[" + ", ".join(f"'{c}'" for c in CONDITIONS) + "]",
+        "n_conditions": len(CONDITIONS),
+    }
+
+    with duckdb.connect(str(tmp_path)) as conn:
+        # Deterministic uniform value in [0, 1) for a row key
+        conn.execute("CREATE MACRO h(x) AS (hash(x) % 1000003) / 1000003.0")
+        conn.execute("CREATE MACRO hi(x, n) AS CAST(floor(h(x) * n) AS INTEGER)")
+        for schema, tables in TABLES.items():
+            conn.execute(f"CREATE SCHEMA {schema}")
+            for table, select in tables.items():
+                conn.execute(f"CREATE TABLE {schema}.{table} AS {select.format(**params)}")
+        conn.execute("DROP MACRO hi")
+        conn.execute("DROP MACRO h")
+        conn.execute("CHECKPOINT")
+
+    tmp_path.replace(path)
+    return path
+
+
+def build_fixture_manifest(path: str | Path) -> Path:
+    """Write a dbt manifest whose models mirror the fixture tables.
+
+    Every mart model depends on the matching `core` staging models, which depend on
+    a source, so lineage lookups have a few levels to walk.
+    """
+    nodes: dict[str, dict] = {}
+    sources: dict[str, dict] = {}
+    parent_map: dict[str, list[str]] = {}
+
+    def add_model(name: str, package_path: list[str], parents: list[str]) -> str:
+        unique_id = f"model.the_tuva_project.{name}"
+        nodes[unique_id] = {
+            "resource_type": "model",
+            "name": name,
+            "fqn": ["the_tuva_project", *package_path, name],
+            "depends_on": {"nodes": parents},
+        }
+        parent_map[unique_id] = parents
+        return unique_id
+
+    core_models = []
+    for table in TABLES["core"]:
+        source_id = f"source.the_tuva_project.raw.{table}"
+        sources[source_id] = {
+            "resource_type": "source",
+            "name": table,
+            "fqn": ["the_tuva_project", "raw", table],
+        }
+        parent_map[source_id] = []
+        staging = add_model(f"core__stg_{table}", ["core", "staging"], [source_id])
+        core_models.append(add_model(f"core__{table}", ["core", "final"], [staging]))
+
+        test_id = f"test.the_tuva_project.not_null_core__{table}"
+        nodes[test_id] = {
+            "resource_type": "test",
+            "name": f"not_null_core__{table}",
+            "fqn": ["the_tuva_project", "core", f"not_null_core__{table}"],
+            "depends_on": {"nodes": [core_models[-1]]},
+        }
+        parent_map[test_id] = [core_models[-1]]
+
+    for schema, tables in TABLES.items():
+        if schema == "core":
+            continue
+        for table in tables:
+            staging = add_model(
+                f"{schema}__stg_core__{table}", [schema, "staging"], core_models[:3]
+            )
+            add_model(f"{schema}__{table}", [schema, "final"], [staging])
+
+    child_map: dict[str, list[str]] = {unique_id: [] for unique_id in parent_map}
+    for child, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(child)
+
+    manifest = {
+        "nodes": nodes,
+        "sources": sources,
+        "parent_map": parent_map,
+        "child_map": child_map,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest))
+    return path
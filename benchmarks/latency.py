@@ -0,0 +1,306 @@
+"""Tool-latency microbenchmarks against a synthetic Tuva-shaped database.
+
+Drives the MCP tools through the FastMCP client and reports p50/p95/p99 latency,
+throughput and peak RSS per workload, saved as JSON so runs can be compared.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import typer
+
+from benchmarks.fixtures import build_fixture_database, build_fixture_manifest
+from osler.config import get_project_root
+
+app = typer.Typer(help="Tool-latency benchmarks for the osler MCP server.")
+
+FIXTURE_DIR = get_project_root() / "osler_data" / "benchmarks"
+RESULTS_DIR = get_project_root() / "benchmarks" / "results"
+
+# name -> (tool, arguments). `{i}` in a string argument is replaced by the iteration
+# number so repeated calls are not all answered from the result cache.
+WORKLOADS = {
+    "execute_query:point_lookup": (
+        "execute_query",
+        {"sql_query": "SELECT * FROM core.patient WHERE person_id = {i}"},
+    ),
+    "execute_query:aggregate": (
+        "execute_query",
+        {
+            "sql_query": """
+                SELECT payer, claim_type, COUNT(*) AS claims, SUM(paid_amount) AS paid
+                FROM core.medical_claim
+                WHERE claim_start_date >= DATE '2023-01-01' + {i}
+                GROUP BY payer, claim_type
+            """
+        },
+    ),
+    "execute_query:join": (
+        "execute_query",
+        {
+            "sql_query": """
+                SELECT c.condition, p.state, COUNT(DISTINCT c.person_id) AS patients
+                FROM chronic_conditions.tuva_chronic_conditions_long c
+                JOIN core.patient p ON p.person_id = c.person_id
+                WHERE p.person_id >= {i}
+                GROUP BY 1, 2
+                ORDER BY 3 DESC
+            """
+        },
+    ),
+    "execute_query:first_page": (
+        "execute_query",
+        {"sql_query": "SELECT * FROM core.medical_claim WHERE person_id >= {i}"},
+    ),
+    "get_table_info": (
+        "get_table_info",
+        {"table_name": "core.medical_claim", "show_sample": True},
+    ),
+    "get_database_schema": ("get_database_schema", {}),
+    "get_model_lineage": (
+        "get_model_lineage",
+        {
+            "table_name": "chronic_conditions__tuva_chronic_conditions_long",
+            "direction": "parent",
+            "depth": 3,
+        },
+    ),
+}
+
+
+# -------------------------------------------------------
+# Fixtures
+# -------------------------------------------------------
+def fixture_paths(rows: int) -> tuple[Path, Path]:
+    return (
+        FIXTURE_DIR / f"tuva_fixture_{rows}.duckdb",
+        FIXTURE_DIR / f"tuva_fixture_{rows}_manifest.json",
+    )
+
+
+def _build_fixture(rows: int) -> None:
+    db_path, manifest_path = fixture_paths(rows)
+    build_fixture_database(db_path, rows)
+    build_fixture_manifest(manifest_path)
+
+
+def ensure_fixture(rows: int, rebuild: bool = False) -> tuple[Path, Path]:
+    """Build the fixture for `rows` if needed, in a child process so it doesn't count
+    towards the benchmark's peak RSS."""
+    db_path, manifest_path = fixture_paths(rows)
+    if rebuild or not db_path.exists() or not manifest_path.exists():
+        print(f"Building {rows:,}-row fixture at {db_path}")
+        process = multiprocessing.get_context("spawn").Process(target=_build_fixture, args=(rows,))
+        process.start()
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(f"Fixture build failed with exit code {process.exitcode}")
+    return db_path, manifest_path
+
+
+# -------------------------------------------------------
+# Measurement
+# -------------------------------------------------------
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (which must be sorted)."""
+    if not samples:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in KB on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _format_arguments(arguments: dict, i: int) -> dict:
+    return {k: v.replace("{i}", str(i)) if isinstance(v, str) else v for k, v in arguments.items()}
+
+
+def _is_error(result) -> bool:
+    structured = result.structured_content or {}
+    return bool(result.is_error or structured.get("error"))
+
+
+async def measure(
+    call_tool, tool: str, arguments: dict, iterations: int, warmup: int, concurrency: int
+) -> dict:
+    """Call one tool `iterations` times from `concurrency` workers and summarize latency."""
+    for i in range(warmup):
+        await call_tool(tool, _format_arguments(arguments, i))
+
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(warmup, warmup + iterations))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                result = await call_tool(tool, _format_arguments(arguments, i))
+                errors += _is_error(result)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_s = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "tool": tool,
+        "iterations": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+        "throughput_per_s": round(len(latencies) / wall_s, 2) if wall_s else 0.0,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+async def run_workloads(names: list[str], iterations: int, warmup: int, concurrency: int) -> dict:
+    # Imported here so the server picks up the OSLER_* settings made by `run`
+    from benchmarks.utils import mcp_session
+
+    results = {}
+    async with mcp_session() as client:
+
+        async def call_tool(tool: str, arguments: dict):
+            return await client.call_tool(tool, arguments, raise_on_error=False)
+
+        for name in names:
+            tool, arguments = WORKLOADS[name]
+            results[name] = await measure(
+                call_tool, tool, arguments, iterations, warmup, concurrency
+            )
+            stats = results[name]
+            print(
+                f"{name:<32} p50 {stats['p50_ms']:>9.2f}ms  p95 {stats['p95_ms']:>9.2f}ms  "
+                f"p99 {stats['p99_ms']:>9.2f}ms  {stats['throughput_per_s']:>8.1f}/s  "
+                f"errors {stats['errors']}"
+            )
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=get_project_root(),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# -------------------------------------------------------
+# Commands
+# -------------------------------------------------------
+@app.command()
+def fixture(
+    rows: int = typer.Option(10_000, help="Rows in the largest fact table (core.medical_claim)"),
+):
+    """Build (or rebuild) the synthetic fixture database and manifest."""
+    db_path, manifest_path = ensure_fixture(rows, rebuild=True)
+    print(f"Wrote {db_path} and {manifest_path}")
+
+
+@app.command()
+def run(
+    rows: int = typer.Option(10_000, help="Fixture size, e.g. 10000, 1000000, 10000000"),
+    iterations: int = typer.Option(50, help="Measured calls per workload"),
+    warmup: int = typer.Option(5, help="Unmeasured calls per workload"),
+    concurrency: int = typer.Option(1, help="Concurrent callers sharing one MCP session"),
+    workload: list[str] = typer.Option(None, help="Workloads to run (default: all)"),
+    cache_mb: int = typer.Option(64, help="Server result cache size; 0 disables it"),
+    output: Path = typer.Option(None, help="Where to write the JSON results"),
+):
+    """Benchmark the MCP tools against the fixture and save the results as JSON."""
+    names = workload or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        raise typer.BadParameter(f"Unknown workloads: {', '.join(unknown)}")
+
+    db_path, manifest_path = ensure_fixture(rows)
+    os.environ["OSLER_DB_PATH"] = str(db_path)
+    os.environ["OSLER_DBT_MANIFEST"] = str(manifest_path)
+    os.environ["OSLER_RESULT_CACHE_MB"] = str(cache_mb)
+    # Per-request server logging would dominate the fast tools
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+
+    results = asyncio.run(run_workloads(names, iterations, warmup, concurrency))
+
+    import duckdb
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "duckdb": duckdb.__version__,
+            "platform": platform.platform(),
+            "rows": rows,
+            "iterations": iterations,
+            "warmup": warmup,
+            "concurrency": concurrency,
+            "cache_mb": cache_mb,
+        },
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "workloads": results,
+    }
+
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"latency_{rows}_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Peak RSS {report['peak_rss_mb']} MB. Results saved to: {output}")
+
+
+@app.command()
+def compare(
+    baseline: Path = typer.Argument(..., help="Earlier results JSON"),
+    current: Path = typer.Argument(..., help="New results JSON"),
+    metric: str = typer.Option("p95_ms", help="Latency metric to compare"),
+    threshold: float = typer.Option(0.2, help="Allowed relative slowdown before failing"),
+):
+    """Compare two result files and exit non-zero if any workload regressed."""
+    before = json.loads(baseline.read_text())["workloads"]
+    after = json.loads(current.read_text())["workloads"]
+
+    regressions = []
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name][metric], after[name][metric]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<32} {old:>10.2f} -> {new:>10.2f} ms  ({change:+.1%}){flag}")
+
+    if regressions:
+        print(f"{len(regressions)} workload(s) regressed by more than {threshold:.0%} on {metric}")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
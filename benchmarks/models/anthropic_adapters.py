@@ -6,15 +6,16 @@ from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
 from benchmarks.schema import FastMCPToolSchema, ModelResponse, ToolCallEvent
-from benchmarks.utils import call_tool
+from benchmarks.utils import MAX_PARALLEL_TOOL_CALLS, call_tools
 
 load_dotenv()
 
 
 class BaseAsyncClaudeAdapter:
-    def __init__(self, client, model: str):
+    def __init__(self, client, model: str, max_parallel_tool_calls: int = MAX_PARALLEL_TOOL_CALLS):
         self.client = client
         self.model = model
+        self.max_parallel_tool_calls = max_parallel_tool_calls
 
     def convert_fastmcp_tools_schema_to_adapter(self, mcp_tools: list[FastMCPToolSchema]) -> list:
         claude_tools = []
@@ -32,6 +33,7 @@ class BaseAsyncClaudeAdapter:
     async def run(self, prompt: str, tools: list):
         start_time = time.perf_counter()
         tool_calls = []
+        tool_batch_ms = []
         messages = [{"role": "user", "content": prompt}]
 
         adapter_mcp_tools = self.convert_fastmcp_tools_schema_to_adapter(tools)
@@ -49,50 +51,40 @@ class BaseAsyncClaudeAdapter:
                 # Add assistant message to conversation
                 messages.append({"role": "assistant", "content": response.content})
 
-                # Process tool calls
+                # Execute the turn's tool calls concurrently via MCP
+                outcomes, batch_ms = await call_tools(
+                    [(tool_use.name, tool_use.input) for tool_use in tool_use_blocks],
+                    max_concurrency=self.max_parallel_tool_calls,
+                )
+                tool_batch_ms.append(batch_ms)
+
+                # Reassemble results in the order the model requested them
                 tool_results = []
-                for tool_use in tool_use_blocks:
-                    tool_start = time.perf_counter()
-
-                    # Execute tool via MCP
-                    try:
-                        result = await call_tool(tool_name=tool_use.name, arguments=tool_use.input)
-                        tool_latency = int((time.perf_counter() - tool_start) * 1000)
-
-                        # Track successful tool call
-                        tool_calls.append(
-                            ToolCallEvent(
-                                tool_name=tool_use.name,
-                                arguments=tool_use.input,
-                                model=self.model,
-                                latency_ms=tool_latency,
-                            )
+                for tool_use, (result, tool_latency) in zip(tool_use_blocks, outcomes):
+                    tool_calls.append(
+                        ToolCallEvent(
+                            tool_name=tool_use.name,
+                            arguments=tool_use.input,
+                            model=self.model,
+                            latency_ms=tool_latency,
                         )
+                    )
 
+                    if isinstance(result, Exception):
                         tool_results.append(
                             {
                                 "type": "tool_result",
                                 "tool_use_id": tool_use.id,
-                                "content": str(result),
+                                "content": f"Error: {str(result)}",
+                                "is_error": True,
                             }
                         )
-                    except Exception as e:
-                        # Track failed tool call
-                        tool_latency = int((time.perf_counter() - tool_start) * 1000)
-                        tool_calls.append(
-                            ToolCallEvent(
-                                tool_name=tool_use.name,
-                                arguments=tool_use.input,
-                                model=self.model,
-                                latency_ms=tool_latency,
-                            )
-                        )
+                    else:
                         tool_results.append(
                             {
                                 "type": "tool_result",
                                 "tool_use_id": tool_use.id,
-                                "content": f"Error: {str(e)}",
-                                "is_error": True,
+                                "content": str(result),
                             }
                         )
 
@@ -117,6 +109,7 @@ class BaseAsyncClaudeAdapter:
                 tool_calls=tool_calls,
                 total_runtime_ms=total_runtime,
                 error=None,
+                tool_batch_ms=tool_batch_ms,
             )
 
         except Exception as e:
@@ -125,11 +118,11 @@ class BaseAsyncClaudeAdapter:
 
 
 class AsyncClaudeAdapter(BaseAsyncClaudeAdapter):
-    def __init__(self, model):
+    def __init__(self, model, max_parallel_tool_calls: int = MAX_PARALLEL_TOOL_CALLS):
         # Anthropic client has a default 10-minute timeout, so we need to force
         # the time limit to be 10 minutes. If longer responses are needed, streaming
         # is required. See: https://github.com/anthropics/anthropic-sdk-python#long-requests
         timeout = httpx.Timeout(600.0, read=None, write=60.0, connect=10.0)
 
         client = AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"], timeout=timeout)
-        super().__init__(client, model)
+        super().__init__(client, model, max_parallel_tool_calls)
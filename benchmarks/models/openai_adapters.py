@@ -6,15 +6,16 @@ from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
 from benchmarks.schema import FastMCPToolSchema, ModelResponse, ToolCallEvent
-from benchmarks.utils import call_tool
+from benchmarks.utils import MAX_PARALLEL_TOOL_CALLS, call_tools
 
 load_dotenv()
 
 
 class BaseAsyncOpenAIAdapter:
-    def __init__(self, client, model: str):
+    def __init__(self, client, model: str, max_parallel_tool_calls: int = MAX_PARALLEL_TOOL_CALLS):
         self.client = client
         self.model = model
+        self.max_parallel_tool_calls = max_parallel_tool_calls
 
     def convert_fastmcp_tools_schema_to_adapter(self, mcp_tools: list[FastMCPToolSchema]) -> list:
         openai_tools = []
@@ -35,6 +36,7 @@ class BaseAsyncOpenAIAdapter:
     async def run(self, prompt: str, tools: list):
         start_time = time.perf_counter()
         tool_calls = []
+        tool_batch_ms = []
         messages = [{"role": "user", "content": prompt}]
 
         adapter_mcp_tools = self.convert_fastmcp_tools_schema_to_adapter(tools)
@@ -49,61 +51,51 @@ class BaseAsyncOpenAIAdapter:
                 assistant_message = response.choices[0].message
                 messages.append(assistant_message)
 
-                # Process tool calls
-                if assistant_message.tool_calls:
-                    for tool_call in assistant_message.tool_calls:
-                        tool_start = time.perf_counter()
-
-                        # Parse arguments
-                        try:
-                            arguments = json.loads(tool_call.function.arguments)
-                        except json.JSONDecodeError:
-                            arguments = {}
-
-                        # Execute tool via MCP
-                        try:
-                            result = await call_tool(
-                                tool_name=tool_call.function.name, arguments=arguments
-                            )
-                            tool_latency = int((time.perf_counter() - tool_start) * 1000)
-
-                            # Track successful tool call
-                            tool_calls.append(
-                                ToolCallEvent(
-                                    tool_name=tool_call.function.name,
-                                    arguments=arguments,
-                                    model=self.model,
-                                    latency_ms=tool_latency,
-                                )
-                            )
-
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "name": tool_call.function.name,
-                                    "content": str(result),
-                                }
-                            )
-                        except Exception as e:
-                            # Track failed tool call
-                            tool_latency = int((time.perf_counter() - tool_start) * 1000)
-                            tool_calls.append(
-                                ToolCallEvent(
-                                    tool_name=tool_call.function.name,
-                                    arguments=arguments,
-                                    model=self.model,
-                                    latency_ms=tool_latency,
-                                )
-                            )
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "name": tool_call.function.name,
-                                    "content": f"Error: {str(e)}",
-                                }
+                # Execute the turn's tool calls concurrently via MCP
+                requested = assistant_message.tool_calls or []
+                arguments_list = []
+                for tool_call in requested:
+                    # Parse arguments
+                    try:
+                        arguments_list.append(json.loads(tool_call.function.arguments))
+                    except json.JSONDecodeError:
+                        arguments_list.append({})
+
+                if requested:
+                    outcomes, batch_ms = await call_tools(
+                        [
+                            (tool_call.function.name, arguments)
+                            for tool_call, arguments in zip(requested, arguments_list)
+                        ],
+                        max_concurrency=self.max_parallel_tool_calls,
+                    )
+                    tool_batch_ms.append(batch_ms)
+
+                    # Reassemble results in the order the model requested them
+                    for tool_call, arguments, (result, tool_latency) in zip(
+                        requested, arguments_list, outcomes
+                    ):
+                        tool_calls.append(
+                            ToolCallEvent(
+                                tool_name=tool_call.function.name,
+                                arguments=arguments,
+                                model=self.model,
+                                latency_ms=tool_latency,
                             )
+                        )
+
+                        if isinstance(result, Exception):
+                            content = f"Error: {str(result)}"
+                        else:
+                            content = str(result)
+                        messages.append(
+                            {
+                                "role": "tool",
+                                "tool_call_id": tool_call.id,
+                                "name": tool_call.function.name,
+                                "content": content,
+                            }
+                        )
 
                 # Continue conversation
                 response = await self.client.chat.completions.create(
@@ -122,6 +114,7 @@ class BaseAsyncOpenAIAdapter:
                 tool_calls=tool_calls,
                 total_runtime_ms=total_runtime,
                 error=None,
+                tool_batch_ms=tool_batch_ms,
             )
 
         except Exception as e:
@@ -130,14 +123,20 @@ class BaseAsyncOpenAIAdapter:
 
 
 class AsyncOpenAIAdapter(BaseAsyncOpenAIAdapter):
-    def __init__(self, model):
+    def __init__(self, model, max_parallel_tool_calls: int = MAX_PARALLEL_TOOL_CALLS):
         client = AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
-        super().__init__(client, model)
+        super().__init__(client, model, max_parallel_tool_calls)
 
 
 class AsyncOpenAIOSSAdapter(BaseAsyncOpenAIAdapter):
-    def __init__(self, model, base_url=None, api_key=None):
+    def __init__(
+        self,
+        model,
+        base_url=None,
+        api_key=None,
+        max_parallel_tool_calls: int = MAX_PARALLEL_TOOL_CALLS,
+    ):
         base_url = base_url or "http://localhost:11434/v1"
         api_key = api_key or os.environ.get("GPT_OSS_API_KEY", "ollama")
         client = AsyncOpenAI(api_key=api_key, base_url=base_url)
-        super().__init__(client, model)
+        super().__init__(client, model, max_parallel_tool_calls)
@@ -1,11 +1,16 @@
 import asyncio
+import os
+import random
 
 from benchmarks.models.openai_adapters import AsyncOpenAIOSSAdapter
 from benchmarks.utils import (
-    append_response_to_csv,
+    QUESTION_INDEX_FIELD,
     csv_to_benchmark_queries,
     get_mcp_tools,
-    initialize_response_to_csv,
+    load_completed_responses,
+    mcp_session,
+    read_question_sheet,
+    write_responses_to_csv,
 )
 from src.osler.config import get_project_root
 
@@ -17,8 +22,43 @@ MODEL_NAME = "gpt-oss-20b-ctx32k:latest"
 # MODEL_NAME = "claude-sonnet-4-5-20250929"
 # MODEL_NAME = "qwen2.5:7b-ctx32k"
 
+# Number of questions in flight at once. Keep at 1 for a single local model; raise it
+# with OSLER_EVAL_CONCURRENCY for hosted APIs
+MAX_CONCURRENCY = int(os.getenv("OSLER_EVAL_CONCURRENCY", "1"))
+# Attempts per question before giving up; a rerun picks up anything left unanswered
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_S = 2.0
+
+
+async def run_with_retries(adapter, prompt: str, tools: list, label: str):
+    """Run one question, retrying failed attempts with exponential backoff."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            response = await adapter.run(prompt=prompt, tools=tools)
+        except Exception as e:
+            print(f"{label}: attempt {attempt} raised {e}")
+            response = None
+
+        # Adapters return False when the model call fails
+        if response:
+            return response
+
+        if attempt < MAX_ATTEMPTS:
+            delay = RETRY_BACKOFF_S * 2 ** (attempt - 1) + random.uniform(0, 1)
+            print(f"{label}: attempt {attempt} failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    print(f"{label}: giving up after {MAX_ATTEMPTS} attempts")
+    return None
+
 
 async def main():
+    # One MCP session for the whole run so tool latency excludes connection setup
+    async with mcp_session():
+        await run_eval()
+
+
+async def run_eval():
     # Step 1: Get MCP tools using utils
     all_tools = await get_mcp_tools()
 
@@ -38,23 +78,42 @@ async def main():
     # adapter = AsyncClaudeAdapter(model=MODEL_NAME)
     # adapter = AsyncQwenAdapter(model=MODEL_NAME)
 
-    # Step 5: Initialize streaming CSV and iterate over queries
-    original_rows, fieldnames = initialize_response_to_csv(csv_path, output_path)
+    # Step 5: Resume from any answers a previous run already checkpointed
+    original_rows, fieldnames = read_question_sheet(csv_path)
+    completed = load_completed_responses(output_path)
+    results = [completed.get(idx) for idx in range(len(original_rows))]
+    print(f"Resuming with {sum(r is not None for r in results)}/{len(results)} answered")
 
-    for idx, (benchmark_query, original_row) in enumerate(
-        zip(benchmark_queries, original_rows), start=1
-    ):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    write_lock = asyncio.Lock()
+
+    async def process(idx, benchmark_query, original_row):
         # Inject tool policy into the prompt
         full_prompt = f"{tool_policy}\n\n{benchmark_query.query}"
-        print(f"Processing query {idx}/{len(benchmark_queries)}")
-        print(f"Full prompt: {full_prompt}")
+        label = f"Query {idx + 1}/{len(benchmark_queries)}"
+
+        async with semaphore:
+            print(f"Processing {label}")
+            response = await run_with_retries(adapter, full_prompt, all_tools, label)
 
-        response = await adapter.run(prompt=full_prompt, tools=all_tools)
+        if response:
+            results[idx] = {QUESTION_INDEX_FIELD: idx, **original_row, **response.to_csv_row()}
+            # Checkpoint after every answer, always in question-sheet order
+            async with write_lock:
+                write_responses_to_csv([r for r in results if r], output_path, fieldnames)
 
-        # Write response to CSV immediately after receiving it
-        append_response_to_csv(response, original_row, output_path, fieldnames)
+    # Step 6: Answer the remaining questions concurrently
+    await asyncio.gather(
+        *(
+            process(idx, benchmark_query, original_row)
+            for idx, (benchmark_query, original_row) in enumerate(
+                zip(benchmark_queries, original_rows)
+            )
+            if results[idx] is None
+        )
+    )
 
-    print(f"All results saved to: {output_path}")
+    print(f"{sum(r is not None for r in results)}/{len(results)} results saved to: {output_path}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, ClassVar, Dict, Optional
 
 
@@ -37,6 +37,8 @@ class ModelResponse:
     tool_calls: list[ToolCallEvent]
     total_runtime_ms: int
     error: str | None = None
+    # Wall-clock time of each turn's batch of (concurrent) tool calls
+    tool_batch_ms: list[int] = field(default_factory=list)
 
     CSV_FIELDS: ClassVar[list[str]] = [
         "model",
@@ -45,6 +47,7 @@ class ModelResponse:
         "tool_arguments",
         "response_text",
         "total_runtime_s",
+        "tool_batch_s",
     ]
 
     @property
@@ -67,6 +70,7 @@ class ModelResponse:
             "tool_arguments": self.tool_arguments,
             "response_text": self.response_text,
             "total_runtime_s": self.total_runtime_ms / 1000,
+            "tool_batch_s": "; ".join(str(ms / 1000) for ms in self.tool_batch_ms),
         }
 
 
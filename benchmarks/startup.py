@@ -0,0 +1,104 @@
+"""Cold-start benchmark for the osler-mcp entry point.
+
+Launches `python -m osler.mcp_server` over stdio the way an MCP host does, and times
+how long the fresh process takes to answer `initialize` and its first `list_tools`,
+and optionally a first tool call. Results use the same JSON layout as
+`benchmarks.latency`, so `python -m benchmarks.latency compare` works on them too.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import typer
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+from benchmarks.latency import RESULTS_DIR, _git_commit, ensure_fixture, percentile
+
+app = typer.Typer(help="Cold-start benchmarks for the osler MCP server.")
+
+
+async def cold_start(env: dict[str, str], first_call: bool) -> dict[str, float]:
+    """Start one server process and return milliseconds to each milestone."""
+    transport = StdioTransport(
+        command=sys.executable, args=["-m", "osler.mcp_server"], env=env, keep_alive=False
+    )
+    start = time.perf_counter()
+    timings = {}
+    async with Client(transport) as client:  # returns once `initialize` is answered
+        timings["initialize"] = (time.perf_counter() - start) * 1000
+        await client.list_tools()
+        timings["list_tools"] = (time.perf_counter() - start) * 1000
+        if first_call:
+            await client.call_tool("get_database_schema", {})
+            timings["first_tool_call"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def _summarize(samples: list[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "runs": len(samples),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+
+@app.command()
+def run(
+    runs: int = typer.Option(10, help="Server processes to start"),
+    rows: int = typer.Option(10_000, help="Fixture size for the first tool call"),
+    first_call: bool = typer.Option(True, help="Also time a first get_database_schema call"),
+    warmup: bool = typer.Option(False, help="Start the server with OSLER_WARMUP=1"),
+    output: Path = typer.Option(None, help="Where to write the JSON results"),
+):
+    """Start the server `runs` times and report time to initialize / list_tools."""
+    db_path, manifest_path = ensure_fixture(rows)
+    env = {
+        **os.environ,
+        "OSLER_DB_PATH": str(db_path),
+        "OSLER_DBT_MANIFEST": str(manifest_path),
+        "OSLER_WARMUP": "1" if warmup else "0",
+    }
+
+    samples: dict[str, list[float]] = {}
+    for i in range(runs):
+        timings = asyncio.run(cold_start(env, first_call))
+        for milestone, ms in timings.items():
+            samples.setdefault(milestone, []).append(ms)
+        print(f"run {i + 1}/{runs}: " + ", ".join(f"{k} {v:.0f} ms" for k, v in timings.items()))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs,
+            "rows": rows,
+            "warmup": warmup,
+        },
+        "workloads": {milestone: _summarize(values) for milestone, values in samples.items()},
+    }
+    for milestone, stats in report["workloads"].items():
+        print(f"{milestone:<16} p50 {stats['p50_ms']:>8.1f} ms  p95 {stats['p95_ms']:>8.1f} ms")
+
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"startup_{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to: {output}")
+
+
+if __name__ == "__main__":
+    app()
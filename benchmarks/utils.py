@@ -1,23 +1,89 @@
+import asyncio
 import csv
+import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 from fastmcp import Client
 
 from benchmarks.schema import BenchmarkQueries, ModelResponse
 from osler.mcp_server import mcp
 
+# Default cap on tool calls from a single model turn running at once
+MAX_PARALLEL_TOOL_CALLS = 4
+# Position of the question in the sheet; the same question text can appear more than once
+QUESTION_INDEX_FIELD = "question_index"
+
+# Client session shared by everything running inside `mcp_session()`
+_active_client: ContextVar[Client | None] = ContextVar("_active_client", default=None)
+
+
+@asynccontextmanager
+async def mcp_session():
+    """Keep one MCP client session open for a whole run (or for one worker).
+
+    Tool calls made inside the block reuse this session instead of paying for a
+    new connection handshake each time, so reported tool latency measures server
+    work. Tasks started inside the block inherit the session.
+    """
+    async with Client(mcp) as client:
+        token = _active_client.set(client)
+        try:
+            yield client
+        finally:
+            _active_client.reset(token)
+
+
+@asynccontextmanager
+async def _client():
+    client = _active_client.get()
+    if client is not None and client.is_connected():
+        yield client
+        return
+
+    # No shared session open: fall back to a one-off connection
+    async with Client(mcp) as client:
+        yield client
+
 
 async def get_mcp_tools():
     """Connect to MCP server and retrieve tools."""
-    async with Client(mcp) as client:
+    async with _client() as client:
         return await client.list_tools()
 
 
 async def call_tool(tool_name: str, arguments: dict):
-    """Connect to MCP server and retrieve tools."""
-    async with Client(mcp) as client:
+    """Call an MCP tool, reusing the shared session when one is open."""
+    async with _client() as client:
         return await client.call_tool(name=tool_name, arguments=arguments)
 
 
+async def call_tools(
+    calls: list[tuple[str, dict]], max_concurrency: int = MAX_PARALLEL_TOOL_CALLS
+) -> tuple[list[tuple[object, int]], int]:
+    """Run one model turn's tool calls concurrently.
+
+    Returns one `(result_or_exception, latency_ms)` per call, in the order the
+    calls were given, plus the wall-clock time of the whole batch in ms. Latency
+    excludes time spent waiting for a free slot.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def timed_call(tool_name: str, arguments: dict) -> tuple[object, int]:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await call_tool(tool_name=tool_name, arguments=arguments)
+            except Exception as e:
+                result = e
+            return result, int((time.perf_counter() - start) * 1000)
+
+    batch_start = time.perf_counter()
+    outcomes = await asyncio.gather(*(timed_call(name, args) for name, args in calls))
+    return outcomes, int((time.perf_counter() - batch_start) * 1000)
+
+
 def csv_to_benchmark_queries(csv_path: str) -> list[BenchmarkQueries]:
     """
     Example: csv_to_json("/Users/wpang/Desktop/GitHub/osler-mcp/benchmarks/evals/tuva_health_demo_questions.csv")
@@ -33,33 +99,37 @@ def csv_to_benchmark_queries(csv_path: str) -> list[BenchmarkQueries]:
     return queries
 
 
-def initialize_response_to_csv(csv_path: str, output_path: str):
+def read_question_sheet(csv_path: str) -> tuple[list[dict], list[str]]:
+    """Read the question sheet rows and the fieldnames of the output CSV."""
     with open(csv_path, "r", encoding="utf-8") as infile:
         reader = csv.DictReader(infile)
         original_fieldnames = list(reader.fieldnames)
         original_rows = list(reader)
 
-    output_fieldnames = original_fieldnames + ModelResponse.CSV_FIELDS
-
-    with open(output_path, "w", encoding="utf-8", newline="") as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
-        writer.writeheader()
+    output_fieldnames = [QUESTION_INDEX_FIELD] + original_fieldnames + ModelResponse.CSV_FIELDS
 
     return original_rows, output_fieldnames
 
 
-def append_response_to_csv(
-    response: ModelResponse,
-    original_row: dict,
-    output_path: str,
-    fieldnames: list[str],
-):
-    with open(output_path, "a", encoding="utf-8", newline="") as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+def load_completed_responses(output_path: str) -> dict[int, dict]:
+    """Load rows already answered by a previous (possibly interrupted) run, keyed by the
+    question's row index in the sheet."""
+    if not os.path.exists(output_path):
+        return {}
 
-        row = {
-            **original_row,
-            **response.to_csv_row(),
+    with open(output_path, "r", encoding="utf-8") as f:
+        return {
+            int(row[QUESTION_INDEX_FIELD]): row
+            for row in csv.DictReader(f)
+            if row.get("response_text") and row.get(QUESTION_INDEX_FIELD)
         }
 
-        writer.writerow(row)
+
+def write_responses_to_csv(rows: list[dict], output_path: str, fieldnames: list[str]):
+    """Atomically rewrite the output CSV so it always reflects a consistent checkpoint."""
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, output_path)
@@ -0,0 +1,45 @@
+"""Microbenchmark for the SQL safety validator.
+
+Times `osler.validation.is_safe_query` cold (cache cleared) and memoized against the
+original sqlparse-based validator (the reference oracle in
+`benchmarks.validation_corpus`), over the hand-written and golden eval queries.
+"""
+
+import time
+
+import typer
+
+from benchmarks.validation_corpus import GOLDEN_QUERY_DIR, HANDWRITTEN, legacy_is_safe_query
+from osler.validation import is_safe_query
+
+app = typer.Typer(help="Microbenchmark for the SQL safety validator.")
+
+
+def _time(corpus: list[str], repeat: int, validate, clear_cache: bool = False) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if clear_cache:
+            is_safe_query.cache_clear()
+        for sql_query in corpus:
+            validate(sql_query)
+    return time.perf_counter() - start
+
+
+@app.command()
+def run(repeat: int = typer.Option(20, help="Passes over the query corpus")):
+    """Compare the legacy, single-pass and memoized validators."""
+    corpus = HANDWRITTEN + [p.read_text() for p in sorted(GOLDEN_QUERY_DIR.glob("*.sql"))]
+    calls = len(corpus) * repeat
+
+    timings = {
+        "legacy (sqlparse.parse)": _time(corpus, repeat, legacy_is_safe_query),
+        "single-pass, cold": _time(corpus, repeat, is_safe_query, clear_cache=True),
+        "single-pass, memoized": _time(corpus, repeat, is_safe_query),
+    }
+    print(f"{len(corpus)} queries x {repeat} passes")
+    for name, seconds in timings.items():
+        print(f"{name:<24} {seconds * 1000:>9.1f} ms total  {seconds / calls * 1e6:>8.1f} us/query")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,237 @@
+"""Queries for checking and timing the SQL safety validator.
+
+Holds the original sqlparse-based validator, kept as the reference oracle that
+`osler.validation.is_safe_query` must agree with, and the query corpora both the
+equivalence tests and `benchmarks.validation` run over.
+"""
+
+import random
+from pathlib import Path
+
+import sqlparse
+
+GOLDEN_QUERY_DIR = Path(__file__).resolve().parent / "evals/tuva_project_demo/golden_query"
+
+
+def legacy_is_safe_query(sql_query: str) -> tuple[bool, str]:
+    """The original sqlparse-based validator, kept verbatim as the reference oracle."""
+    try:
+        if not sql_query or not sql_query.strip():
+            return False, "Empty query"
+
+        parsed = sqlparse.parse(sql_query.strip())
+        if not parsed:
+            return False, "Invalid SQL syntax"
+
+        if len(parsed) > 1:
+            return False, "Multiple statements not allowed"
+
+        statement = parsed[0]
+        statement_type = statement.get_type()
+
+        if statement_type not in ("SELECT"):
+            return False, "Only SELECT queries allowed"
+
+        sql_upper = sql_query.strip().upper()
+
+        if statement_type == "SELECT":
+            dangerous_keywords = {
+                "INSERT",
+                "UPDATE",
+                "DELETE",
+                "DROP",
+                "CREATE",
+                "ALTER",
+                "TRUNCATE",
+                "REPLACE",
+                "MERGE",
+                "EXEC",
+                "EXECUTE",
+            }
+
+            for keyword in dangerous_keywords:
+                if f" {keyword} " in f" {sql_upper} ":
+                    return False, f"Write operation not allowed: {keyword}"
+
+            injection_patterns = [
+                ("1=1", "Classic injection pattern"),
+                ("OR 1=1", "Boolean injection pattern"),
+                ("AND 1=1", "Boolean injection pattern"),
+                ("OR '1'='1'", "String injection pattern"),
+                ("AND '1'='1'", "String injection pattern"),
+                ("WAITFOR", "Time-based injection"),
+                ("SLEEP(", "Time-based injection"),
+                ("BENCHMARK(", "Time-based injection"),
+                ("LOAD_FILE(", "File access injection"),
+                ("INTO OUTFILE", "File write injection"),
+                ("INTO DUMPFILE", "File write injection"),
+            ]
+
+            for pattern, description in injection_patterns:
+                if pattern in sql_upper:
+                    return False, f"Injection pattern detected: {description}"
+
+            suspicious_names = [
+                "PASSWORD",
+                "ADMIN",
+                "USER",
+                "LOGIN",
+                "AUTH",
+                "TOKEN",
+                "CREDENTIAL",
+                "SECRET",
+                "KEY",
+                "HASH",
+                "SALT",
+                "SESSION",
+                "COOKIE",
+            ]
+
+            for name in suspicious_names:
+                if name in sql_upper:
+                    return (
+                        False,
+                        f"Suspicious identifier detected: {name} (not medical data)",
+                    )
+
+        return True, "Safe"
+
+    except Exception as e:
+        return False, f"Validation error: {e}"
+
+
+HANDWRITTEN = [
+    "",
+    "   \n ",
+    "SELECT 1",
+    "select * from core.patient limit 5",
+    "SELECT 1;",
+    "SELECT 1; ",
+    "SELECT 1; -- trailing comment",
+    "SELECT 1; SELECT 2",
+    "SELECT 1;;",
+    "SELECT ';' AS semi",
+    "-- leading comment\nSELECT person_id FROM core.patient",
+    "/* block */ SELECT 1",
+    "(SELECT 1)",
+    "WITH x AS (SELECT 1 AS a) SELECT a FROM x",
+    "WITH RECURSIVE t(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM t WHERE n < 3) SELECT * FROM t",
+    "with a as (select 1), b as (select 2) select * from a, b",
+    "WITH x AS (SELECT 1) INSERT INTO t SELECT * FROM x",
+    "WITH x AS (SELECT 1)",
+    "INSERT INTO t VALUES (1)",
+    "UPDATE t SET a = 1",
+    "DELETE FROM t",
+    "DROP TABLE core.patient",
+    "CREATE TABLE t AS SELECT 1",
+    "PRAGMA table_info('core.patient')",
+    "DESCRIBE core.patient",
+    "SHOW TABLES",
+    "EXPLAIN SELECT 1",
+    "VALUES (1)",
+    "SELECT * FROM t WHERE 1=1",
+    "SELECT * FROM t WHERE a = 1 OR 1=1",
+    "SELECT * FROM t WHERE name = 'x' OR '1'='1'",
+    "SELECT SLEEP(5)",
+    "SELECT * FROM t INTO OUTFILE '/tmp/x'",
+    "SELECT password FROM users",
+    "SELECT user_id FROM t",
+    "SELECT monkey FROM t",
+    "SELECT * FROM t WHERE note = 'drop table'",
+    "SELECT * FROM t WHERE note = ' DROP '",
+    "SELECT dropped_at FROM t",
+    "SELECT a FROM t UNION SELECT b FROM u",
+    "SELECT replace(a, 'x', 'y') FROM t",
+    "SELECT a FROM t WHERE x IN (SELECT y FROM u WHERE z = 'DELETE ME')",
+    "SELECT 1 EXECUTE",
+    "SELECT 1 EXEC",
+    "SELECT\tDROP\tFROM t",
+    "SELECT a::int FROM t",
+    "SELECT 'ß' AS s",
+    "select 'seßion'",
+    "SELECT " + "(" * 40 + "1" + ")" * 40,
+    "SELECT [1, 2, 3][1]",
+    "GO",
+    "SELECT 1 GO SELECT 2",
+    "BEGIN; SELECT 1; COMMIT",
+    "SET threads = 4",
+    "FROM core.patient SELECT person_id",
+    # sqlparse groups a keyword glued to `::` or `.` into an identifier, not a statement
+    "SELECT::DELETE]",
+    "select::BEGIN",
+    "SELECT.x FROM t",
+    "DELETE::x",
+]
+
+FRAGMENTS = [
+    "SELECT",
+    "select",
+    "WITH",
+    "x AS (SELECT 1)",
+    "*",
+    "a,",
+    "b",
+    "FROM",
+    "core.patient",
+    "WHERE",
+    "a = 1",
+    "OR",
+    "AND",
+    "1=1",
+    "'1'='1'",
+    ";",
+    "--c\n",
+    "/*c*/",
+    "(",
+    ")",
+    "DROP",
+    "delete",
+    "Replace",
+    "token",
+    "keyset",
+    "GROUP BY 1",
+    "ORDER BY",
+    "LIMIT 5",
+    "'quoted ; text'",
+    '"Quoted"',
+    "\n",
+    "\t",
+    "UNION ALL",
+    "insert",
+    "::",
+    ".",
+]
+
+
+def fuzz_corpus(n: int = 2000, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        parts = [rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 10))]
+        sep = rng.choice([" ", "  ", "\n", ""])
+        corpus.append(sep.join(parts))
+    return corpus
+
+
+def cte_corpus(n: int = 1000, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    names = ["x", "cte_1", '"Quoted"', "data", "t(n)", '"q"(a, b)', "select", "1"]
+    bodies = ["(SELECT 1)", "(select a from t where b = 'c')", "(SELECT (1))", "(", "()"]
+    seps = [" ", "\n", " -- c\n", " /* c */ ", ""]
+    tails = ["SELECT * FROM x", "INSERT INTO t SELECT 1", "DELETE FROM t", "x", "(SELECT 1)", ""]
+    corpus = []
+    for _ in range(n):
+        ctes = []
+        for _ in range(rng.randint(1, 3)):
+            sep = rng.choice(seps)
+            as_kw = rng.choice(["AS", "as", "AS MATERIALIZED", "AS NOT MATERIALIZED"])
+            ctes.append(f"{rng.choice(names)}{sep}{as_kw}{sep}{rng.choice(bodies)}")
+        head = rng.choice(["WITH ", "with recursive ", "-- lead\nWITH ", "/* c */ WITH "])
+        sql = head + rng.choice([", ", ",", " ,\n"]).join(ctes) + rng.choice(seps)
+        corpus.append(sql + rng.choice(tails))
+    return corpus
+
+
+def corpus() -> list[str]:
+    golden = [p.read_text() for p in sorted(GOLDEN_QUERY_DIR.glob("*.sql"))]
+    return HANDWRITTEN + golden + fuzz_corpus() + cte_corpus()
@@ -1,10 +1,12 @@
+from pathlib import Path
 from typing import Annotated
 
+import duckdb
 import typer
 
 from osler import __version__
-from osler.config import SUPPORTED_DATASETS
-from osler.data_io import initialize_dataset
+from osler.config import DEFAULT_DATABASES_DIR, SUPPORTED_DATASETS, setup_logging
+from osler.data_io import export_snapshot, import_snapshot, initialize_dataset
 
 app = typer.Typer(
     name="osler",
@@ -20,6 +22,16 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+@app.callback()
+def main(
+    version: Annotated[
+        bool | None,
+        typer.Option("--version", callback=version_callback, is_eager=True, help="Show version."),
+    ] = None,
+):
+    setup_logging()
+
+
 @app.command("init")
 def dataset_init_cmd(
     dataset_name: Annotated[
@@ -32,9 +44,35 @@ def dataset_init_cmd(
             metavar="DATASET_NAME",
         ),
     ] = "tuva-project-demo",
+    full_refresh: Annotated[
+        bool,
+        typer.Option(
+            "--full-refresh",
+            help="Delete the database and dbt project and rebuild everything from scratch.",
+        ),
+    ] = False,
+    threads: Annotated[
+        int | None,
+        typer.Option("--threads", min=1, help="Number of dbt models to build concurrently."),
+    ] = None,
+    memory_limit: Annotated[
+        str | None,
+        typer.Option("--memory-limit", help="DuckDB memory limit for the build, e.g. '16GB'."),
+    ] = None,
+    duckdb_threads: Annotated[
+        int | None,
+        typer.Option("--duckdb-threads", min=1, help="DuckDB worker threads for the build."),
+    ] = None,
 ):
+    """Build the dataset, rebuilding only changed dbt models when a previous build exists."""
     dataset_key = dataset_name.lower()
-    initialization_successful = initialize_dataset(dataset_key)
+    initialization_successful = initialize_dataset(
+        dataset_key,
+        full_refresh=full_refresh,
+        threads=threads,
+        memory_limit=memory_limit,
+        duckdb_threads=duckdb_threads,
+    )
 
     if not initialization_successful:
         typer.secho(
@@ -45,6 +83,141 @@ def dataset_init_cmd(
         raise typer.Exit(code=1)
 
 
+@app.command("profile")
+def profile_cmd(
+    sql_query: Annotated[
+        str | None,
+        typer.Argument(help="SELECT query to profile. Omit to read it from --file."),
+    ] = None,
+    file: Annotated[
+        Path | None, typer.Option("--file", "-f", help="Read the query from a .sql file.")
+    ] = None,
+    dataset_name: Annotated[
+        str, typer.Option("--dataset", help="Dataset whose database to profile against.")
+    ] = "tuva-project-demo",
+    db_path: Annotated[
+        Path | None, typer.Option("--db-path", help="Profile against this DuckDB file instead.")
+    ] = None,
+    top_n: Annotated[int, typer.Option("--top", help="Number of hottest operators to list.")] = 5,
+):
+    """Run a SELECT under DuckDB's profiler and print the per-operator breakdown."""
+    from osler.database.duckdb_client import DuckDB
+    from osler.database.profiling import render_profile
+    from osler.validation import is_safe_query
+
+    if file is not None:
+        sql_query = file.read_text()
+    if not sql_query:
+        typer.secho("Pass a query or --file.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    is_safe, message = is_safe_query(sql_query)
+    if not is_safe:
+        typer.secho(f"Query rejected: {message}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    if db_path is None:
+        config = SUPPORTED_DATASETS.get(dataset_name.lower())
+        if config is None:
+            typer.secho(f"Unknown dataset: {dataset_name}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        db_path = DEFAULT_DATABASES_DIR / config["db_filename"]
+
+    backend = DuckDB(db_path, pool_size=1)
+    try:
+        profile = backend.profile_query(sql_query)
+    finally:
+        backend.close()
+    typer.echo(render_profile(profile, top_n=top_n))
+
+
+@app.command("stats")
+def stats_cmd(
+    dataset_name: Annotated[
+        str, typer.Option("--dataset", help="Dataset whose database to profile.")
+    ] = "tuva-project-demo",
+    db_path: Annotated[
+        Path | None, typer.Option("--db-path", help="Profile this DuckDB file instead.")
+    ] = None,
+    top_k: Annotated[
+        int, typer.Option("--top-k", min=0, help="Most frequent values to keep per column.")
+    ] = 5,
+):
+    """Precompute per-column statistics for every table (served by get_table_profile)."""
+    from osler.database.column_stats import write_column_stats
+
+    if db_path is None:
+        config = SUPPORTED_DATASETS.get(dataset_name.lower())
+        if config is None:
+            typer.secho(f"Unknown dataset: {dataset_name}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        db_path = DEFAULT_DATABASES_DIR / config["db_filename"]
+
+    try:
+        path = write_column_stats(db_path, top_k=top_k)
+    except (OSError, duckdb.Error) as e:
+        typer.secho(f"Column statistics FAILED: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Column statistics written to {path}")
+
+
+snapshot_app = typer.Typer(help="Export or import a built dataset as portable Parquet files.")
+app.add_typer(snapshot_app, name="snapshot")
+
+
+@snapshot_app.command("export")
+def snapshot_export_cmd(
+    output_dir: Annotated[Path, typer.Argument(help="Directory to write the snapshot to.")],
+    dataset_name: Annotated[
+        str, typer.Option("--dataset", help="Dataset whose database to export.")
+    ] = "tuva-project-demo",
+    db_path: Annotated[
+        Path | None, typer.Option("--db-path", help="Export this DuckDB file instead.")
+    ] = None,
+    file_size: Annotated[
+        str, typer.Option("--file-size", help="Approximate size of each Parquet file.")
+    ] = "256MB",
+    overwrite: Annotated[
+        bool, typer.Option("--overwrite", help="Replace OUTPUT_DIR if it already exists.")
+    ] = False,
+):
+    """Write the built warehouse as zstd Parquet with a checksummed manifest."""
+    try:
+        manifest_path = export_snapshot(
+            dataset_name.lower(), output_dir, db_path, file_size=file_size, overwrite=overwrite
+        )
+    except (OSError, ValueError) as e:
+        typer.secho(f"Snapshot export FAILED: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Snapshot written to {manifest_path.parent}")
+
+
+@snapshot_app.command("import")
+def snapshot_import_cmd(
+    snapshot_dir: Annotated[Path, typer.Argument(help="Directory written by `snapshot export`.")],
+    dataset_name: Annotated[
+        str, typer.Option("--dataset", help="Dataset to serve the snapshot as.")
+    ] = "tuva-project-demo",
+    as_views: Annotated[
+        bool,
+        typer.Option(
+            "--as-views",
+            help="Query the Parquet files in place instead of loading them (SNAPSHOT_DIR must stay).",
+        ),
+    ] = False,
+    verify: Annotated[
+        bool, typer.Option("--verify/--no-verify", help="Check file checksums before loading.")
+    ] = True,
+):
+    """Load an exported snapshot and publish it as the dataset's database."""
+    try:
+        db_path = import_snapshot(dataset_name.lower(), snapshot_dir, as_views, verify)
+    except (OSError, ValueError, duckdb.Error) as e:
+        typer.secho(f"Snapshot import FAILED: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Dataset '{dataset_name}' now serves {snapshot_dir} from {db_path}")
+
+
 @app.command("config")
 def config_cmd():
     pass
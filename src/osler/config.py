@@ -5,16 +5,19 @@ from pathlib import Path
 
 APP_NAME = "osler"
 
-# Setup basic logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)-8s] %(name)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[logging.StreamHandler(), logging.FileHandler("osler.log")],
-)
 logger = logging.getLogger(APP_NAME)
 
 
+def setup_logging() -> None:
+    """Log to stderr and osler.log. Called by the entry points, not on import."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)-8s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(), logging.FileHandler("osler.log")],
+    )
+
+
 # -------------------------------------------------------------------
 # Data directory rooted at project root (two levels up from this file)
 # -------------------------------------------------------------------
@@ -38,7 +41,8 @@ _PROJECT_ROOT = get_project_root()
 _PROJECT_DATA_DIR = _PROJECT_ROOT / "osler_data"
 
 DEFAULT_DATABASES_DIR = _PROJECT_DATA_DIR / "databases"
-print(f"DEFAULT_DATABASES_DIR: {DEFAULT_DATABASES_DIR}")
+# Git mirrors and resolved dbt packages, reused across `osler init` runs
+DEFAULT_CACHE_DIR = _PROJECT_DATA_DIR / "cache"
 
 SUPPORTED_DATASETS = {  # Contains a collection of dataset configs
     "tuva-project-demo": {
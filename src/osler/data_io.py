@@ -1,15 +1,55 @@
+import hashlib
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import duckdb
+
 from osler.config import (
+    DEFAULT_DATABASES_DIR,
     create_default_database_path,
-    delete_default_database_path,
     get_dataset_config,
     logger,
 )
-from osler.dbt.utils import clone_dbt_project, run_dbt_command
+from osler.database.catalog import quote_identifier
+from osler.database.column_stats import write_column_stats
+from osler.database.snapshots import (
+    discard_snapshot,
+    gc_snapshots,
+    new_snapshot,
+    publish_snapshot,
+)
+from osler.dbt.utils import (
+    clone_dbt_project,
+    dbt_state_path,
+    install_dbt_packages,
+    run_dbt_command,
+    save_dbt_state,
+    update_dbt_project,
+    write_dbt_profile,
+)
+
+
+def initialize_dataset(
+    dataset_name: str,
+    full_refresh: bool = False,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+    duckdb_threads: int | None = None,
+) -> bool:
+    """Initializes a dataset: downloads files and loads them into a database.
 
+    Every build writes a new database snapshot and only switches the dataset's
+    database path over to it once the build succeeds, so running servers keep
+    answering queries from the previous snapshot in the meantime.
 
-def initialize_dataset(dataset_name: str) -> bool:
-    """Initializes a dataset: downloads files and loads them into a database."""
-    delete_default_database_path()  # Make sure that default database path is empty
+    If the database and the previous dbt manifest already exist, only models that
+    changed since the last build (and everything downstream of them) are rebuilt.
+    Pass `full_refresh=True` to rebuild everything from scratch.
+    `threads`, `memory_limit` and `duckdb_threads` override the dbt profile's
+    build settings.
+    """
     default_database_path = create_default_database_path(
         dataset_name
     )  # TODO: Fix and see if this needs output
@@ -19,19 +59,284 @@ def initialize_dataset(dataset_name: str) -> bool:
         return False
 
     dataset_config = get_dataset_config(dataset_name)
-
     if not dataset_config:
         logger.error(f"Configuration for dataset '{dataset_name}' not found.")
         return False
 
+    if not dataset_config["dbt_project_name"]:
+        return True
+
     # For DBT Projects
+    db_path = DEFAULT_DATABASES_DIR / dataset_config["db_filename"]
+    state_path = None
+    if not full_refresh and db_path.exists():
+        # Compare against the manifest of the last published build, not target/:
+        # dbt rewrites that one on every run, including failed ones
+        state_path = dbt_state_path(dataset_name)
+        if state_path is None:
+            logger.info("No previous dbt manifest found, falling back to a full rebuild.")
+
+    snapshot = new_snapshot(db_path, copy_current=state_path is not None)
+    profiles_dir = write_dbt_profile(
+        dataset_name, threads, memory_limit, duckdb_threads, db_path=snapshot
+    )
+    try:
+        if state_path is not None:
+            _update_dataset(dataset_name, dataset_config, state_path, profiles_dir)
+        else:
+            _build_dataset(dataset_name, dataset_config, profiles_dir)
+    except BaseException:
+        discard_snapshot(snapshot)
+        raise
+
+    _write_column_stats(snapshot)
+    publish_snapshot(db_path, snapshot)
+    save_dbt_state(dataset_config["dbt_project_name"], dataset_name)
+    for old in gc_snapshots(db_path):
+        logger.info(f"Removed old database snapshot {old.parent.name}")
+    return True
+
+
+def _write_column_stats(snapshot: Path) -> None:
+    """Precompute column statistics for get_table_profile; a failure isn't fatal."""
+    try:
+        write_column_stats(snapshot)
+    except (OSError, duckdb.Error) as e:
+        logger.warning(f"Could not compute column statistics: {e}")
+
+
+def _build_dataset(dataset_name: str, dataset_config: dict, profiles_dir: Path) -> None:
+    """Clone the dbt project and build every model into a fresh database."""
     logger.info(f"Initializing '{dataset_name}'. This process can take sometime...")
-    if dataset_config["dbt_project_name"]:
-        dbt_project_path = clone_dbt_project(
-            dataset_config["github_repo"], dataset_config["dbt_project_name"]
+    dbt_project_path = clone_dbt_project(
+        dataset_config["github_repo"], dataset_config["dbt_project_name"]
+    )
+    install_dbt_packages(dbt_project_path, dataset_name)
+    run_dbt_command(["dbt", "build"], dbt_project_path, dataset_name, profiles_dir)
+    run_dbt_command(["dbt", "docs", "generate"], dbt_project_path, dataset_name, profiles_dir)
+
+
+def _update_dataset(
+    dataset_name: str, dataset_config: dict, state_path: Path, profiles_dir: Path
+) -> None:
+    """Rebuild only modified dbt models and their children into a copy of the database."""
+    logger.info(f"Updating '{dataset_name}' incrementally (use --full-refresh to rebuild)...")
+    dbt_project_path = update_dbt_project(
+        dataset_config["github_repo"], dataset_config["dbt_project_name"]
+    )
+    install_dbt_packages(dbt_project_path, dataset_name)
+    run_dbt_command(
+        ["dbt", "build", "--select", "state:modified+", "--state", str(state_path)],
+        dbt_project_path,
+        dataset_name,
+        profiles_dir,
+    )
+    run_dbt_command(["dbt", "docs", "generate"], dbt_project_path, dataset_name, profiles_dir)
+
+
+# --------------------------------------------------
+# Portable snapshots: the built warehouse as Parquet
+# --------------------------------------------------
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MANIFEST = "manifest.json"
+
+_USER_TABLES_QUERY = """
+SELECT schema_name, table_name
+FROM duckdb_tables()
+WHERE database_name = current_database() AND NOT internal AND NOT temporary
+ORDER BY schema_name, table_name
+"""
+_USER_VIEWS_QUERY = """
+SELECT schema_name, view_name, sql
+FROM duckdb_views()
+WHERE database_name = current_database() AND NOT internal AND NOT temporary
+ORDER BY schema_name, view_name
+"""
+
+
+def _sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _sql_string(value) -> str:
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _dataset_db_path(dataset_name: str) -> Path:
+    dataset_config = get_dataset_config(dataset_name)
+    if not dataset_config:
+        raise ValueError(f"Configuration for dataset '{dataset_name}' not found.")
+    return DEFAULT_DATABASES_DIR / dataset_config["db_filename"]
+
+
+def export_snapshot(
+    dataset_name: str,
+    output_dir: Path,
+    db_path: Path | None = None,
+    file_size: str = "256MB",
+    overwrite: bool = False,
+) -> Path:
+    """Write a built dataset to `output_dir` as zstd-compressed Parquet.
+
+    Every table becomes a directory of Parquet files of roughly `file_size` each;
+    views are kept as SQL. `manifest.json` lists tables, row counts, column types
+    and a SHA-256 for every file. Returns the manifest path.
+    """
+    db_path = Path(db_path) if db_path else _dataset_db_path(dataset_name)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database not found at {db_path}. Run `osler init` first.")
+    output_dir = Path(output_dir)
+    if output_dir.exists() and not overwrite:
+        raise FileExistsError(f"{output_dir} already exists")
+
+    # Written next to the target and renamed, so a partial export is never picked up
+    tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    tables = []
+    with duckdb.connect(str(db_path), read_only=True) as conn:
+        for schema, name in conn.execute(_USER_TABLES_QUERY).fetchall():
+            quoted_name = f"{quote_identifier(schema)}.{quote_identifier(name)}"
+            table_dir = tmp_dir / schema / name
+            table_dir.parent.mkdir(exist_ok=True)
+            conn.execute(
+                f"COPY {quoted_name} TO {_sql_string(table_dir)} "
+                f"(FORMAT PARQUET, COMPRESSION ZSTD, FILE_SIZE_BYTES {_sql_string(file_size)})"
+            )
+            columns = conn.execute(f"DESCRIBE {quoted_name}").fetchall()
+            files = sorted(table_dir.glob("*.parquet"))
+            tables.append(
+                {
+                    "schema": schema,
+                    "name": name,
+                    "rows": conn.execute(f"SELECT count(*) FROM {quoted_name}").fetchone()[0],
+                    "columns": [{"name": c[0], "type": c[1]} for c in columns],
+                    "files": [
+                        {
+                            "path": f.relative_to(tmp_dir).as_posix(),
+                            "bytes": f.stat().st_size,
+                            "sha256": _sha256(f),
+                        }
+                        for f in files
+                    ],
+                }
+            )
+        views = [
+            {"schema": schema, "name": name, "sql": sql}
+            for schema, name, sql in conn.execute(_USER_VIEWS_QUERY).fetchall()
+        ]
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "dataset": dataset_name,
+        "database": db_path.name,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "duckdb_version": duckdb.__version__,
+        "tables": tables,
+        "views": views,
+    }
+    with open(tmp_dir / SNAPSHOT_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(output_dir, ignore_errors=True)
+    tmp_dir.replace(output_dir)
+    logger.info(f"Exported {len(tables)} tables and {len(views)} views to {output_dir}")
+    return output_dir / SNAPSHOT_MANIFEST
+
+
+def read_snapshot_manifest(snapshot_dir: Path, verify: bool = True) -> dict:
+    """Load an exported snapshot's manifest, checking every file's checksum."""
+    snapshot_dir = Path(snapshot_dir)
+    with open(snapshot_dir / SNAPSHOT_MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format {manifest.get('format_version')!r} in {snapshot_dir}"
         )
-        run_dbt_command(["dbt", "deps"], dbt_project_path, dataset_name)
-        run_dbt_command(["dbt", "build"], dbt_project_path, dataset_name)
-        run_dbt_command(["dbt", "docs", "generate"], dbt_project_path, dataset_name)
 
-    return True
+    if verify:
+        for table in manifest["tables"]:
+            for entry in table["files"]:
+                path = snapshot_dir / entry["path"]
+                if not path.exists() or _sha256(path) != entry["sha256"]:
+                    raise ValueError(f"Checksum mismatch for {path}, the snapshot is corrupt")
+    return manifest
+
+
+def _create_views(conn, views: list[dict]) -> None:
+    """Replay exported view definitions.
+
+    Views are exported by name, so a view can come before a view it reads; those are
+    retried until a pass creates nothing new.
+    """
+    pending = views
+    while pending:
+        failed = []
+        for view in pending:
+            conn.execute(f"CREATE SCHEMA IF NOT EXISTS {quote_identifier(view['schema'])}")
+            try:
+                conn.execute(view["sql"])
+            except duckdb.CatalogException as e:
+                failed.append((view, e))
+        if len(failed) == len(pending):
+            raise failed[0][1]
+        pending = [view for view, _ in failed]
+
+
+def import_snapshot(
+    dataset_name: str, snapshot_dir: Path, as_views: bool = False, verify: bool = True
+) -> Path:
+    """Load an exported snapshot as the dataset's database and publish it.
+
+    By default the Parquet files are copied into DuckDB tables. With `as_views`,
+    tables become views over the Parquet files instead, which takes seconds but
+    needs `snapshot_dir` to stay where it is. Returns the dataset's database path.
+    """
+    if not create_default_database_path(dataset_name):
+        raise ValueError(f"Configuration for dataset '{dataset_name}' not found.")
+    snapshot_dir = Path(snapshot_dir).resolve()
+    manifest = read_snapshot_manifest(snapshot_dir, verify=verify)
+    db_path = _dataset_db_path(dataset_name)
+
+    snapshot = new_snapshot(db_path)
+    try:
+        with duckdb.connect(str(snapshot)) as conn:
+            for table in manifest["tables"]:
+                schema = quote_identifier(table["schema"])
+                quoted_name = f"{schema}.{quote_identifier(table['name'])}"
+                files = ", ".join(
+                    _sql_string(snapshot_dir / entry["path"]) for entry in table["files"]
+                )
+                # Parquet has no HUGEINT or ENUM, so restore the exported column types
+                columns = ", ".join(
+                    f"CAST({quote_identifier(c['name'])} AS {c['type']}) "
+                    f"AS {quote_identifier(c['name'])}"
+                    for c in table["columns"]
+                )
+                conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+                kind = "VIEW" if as_views else "TABLE"
+                conn.execute(
+                    f"CREATE {kind} {quoted_name} AS "
+                    f"SELECT {columns or '*'} FROM read_parquet([{files}])"
+                )
+                if not as_views:
+                    rows = conn.execute(f"SELECT count(*) FROM {quoted_name}").fetchone()[0]
+                    if rows != table["rows"]:
+                        raise ValueError(
+                            f"{table['schema']}.{table['name']}: expected {table['rows']} rows, "
+                            f"loaded {rows}"
+                        )
+            _create_views(conn, manifest["views"])
+    except BaseException:
+        discard_snapshot(snapshot)
+        raise
+
+    if not as_views:  # profiling would scan every Parquet file; use `osler stats` later
+        _write_column_stats(snapshot)
+    publish_snapshot(db_path, snapshot)
+    gc_snapshots(db_path)
+    logger.info(f"Imported {len(manifest['tables'])} tables from {snapshot_dir} into {db_path}")
+    return db_path
@@ -1,9 +1,115 @@
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from .catalog import Catalog
+from .profiling import QueryProfile
+
+
+@dataclass
+class QueryResult:
+    """A page of rows fetched from a backend."""
+
+    columns: list[str]
+    rows: list[tuple] = field(default_factory=list)
+    column_types: list[str] = field(default_factory=list)
+    offset: int = 0
+    has_more: bool = False
+    continuation_token: str | None = None
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a query runs past its deadline and is cancelled."""
+
+    def __init__(self, timeout: float):
+        super().__init__(f"Query exceeded the {timeout:g}s time limit and was cancelled")
+        self.timeout = timeout
+
+
+class Deadline:
+    """Calls `interrupt` if the `with` block is still running after `timeout` seconds.
+
+    If the block then fails (because it was interrupted), the error is re-raised as
+    a QueryTimeoutError. A timeout of None or 0 disables the deadline.
+    """
+
+    def __init__(self, timeout: float | None, interrupt):
+        self.timeout = timeout
+        self.expired = False
+        self._timer = None
+        if timeout:
+            self._timer = threading.Timer(timeout, self._expire, args=(interrupt,))
+            self._timer.daemon = True
+
+    def _expire(self, interrupt) -> None:
+        self.expired = True
+        interrupt()
+
+    def __enter__(self):
+        if self._timer is not None:
+            self._timer.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.expired and exc is not None:
+            raise QueryTimeoutError(self.timeout) from exc
+        return False
 
 
 class Database(ABC):
+    """Base class for query backends.
+
+    Backends must honour per-query deadlines: `execute_query` and `fetch_more` take
+    an optional `timeout` (falling back to `query_timeout`) and should run the query
+    inside `self.deadline(...)` with a callable that interrupts it. A per-call
+    `timeout` can shorten `query_timeout` but never extend it.
+    """
+
+    def __init__(self, query_timeout: float | None = None):
+        self.query_timeout = query_timeout
+        self.interrupted_queries = 0
+
+    def effective_timeout(self, timeout: float | None) -> float | None:
+        """The deadline for one call: `timeout` capped at the backend's `query_timeout`."""
+        if timeout is None:
+            return self.query_timeout
+        if timeout <= 0:
+            raise ValueError(f"timeout must be a positive number of seconds, got {timeout:g}")
+        if self.query_timeout:
+            return min(timeout, self.query_timeout)
+        return timeout
+
+    def deadline(self, timeout: float | None, interrupt) -> Deadline:
+        """Build a Deadline for one call, using the backend default if none is given."""
+
+        def _interrupt():
+            self.interrupted_queries += 1
+            interrupt()
+
+        return Deadline(self.effective_timeout(timeout), _interrupt)
+
+    @abstractmethod
+    def execute_query(
+        self, sql_query: str, max_rows: int = 50, timeout: float | None = None
+    ) -> QueryResult:
+        pass
+
+    @abstractmethod
+    def fetch_more(
+        self, continuation_token: str, max_rows: int = 50, timeout: float | None = None
+    ) -> QueryResult:
+        pass
+
+    @abstractmethod
+    def profile_query(self, sql_query: str, timeout: float | None = None) -> QueryProfile:
+        """Run a query under the profiler and return its per-operator breakdown."""
+        pass
+
     @abstractmethod
-    def execute_query(self, sql_query: str) -> str:
+    def catalog(self) -> Catalog:
+        """Every schema, table and column in the database."""
         pass
 
     @abstractmethod
@@ -11,5 +117,12 @@ class Database(ABC):
         pass
 
     @abstractmethod
-    def get_table_info(self, table_name: str, show_sample: bool = True) -> str:
+    def get_table_profile(self, table_name: str, output_format: str = "csv") -> str:
+        """Per-column statistics (null rate, distinct count, min/max, top values)."""
+        pass
+
+    @abstractmethod
+    def get_table_info(
+        self, table_name: str, show_sample: bool = True, output_format: str = "csv"
+    ) -> str:
         pass
@@ -0,0 +1,144 @@
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
+
+from sqlparse import lexer
+from sqlparse import tokens as T
+
+from .base import QueryResult
+
+
+@lru_cache(maxsize=1024)
+def normalized_tokens(sql_query: str) -> tuple[tuple, ...]:
+    """`(ttype, value)` tokens of a query with comments, whitespace and trailing
+    semicolons dropped, and keywords/unquoted identifiers lowercased.
+
+    String literals and quoted identifiers are left untouched.
+    """
+    tokens = []
+    for ttype, value in lexer.tokenize(sql_query):
+        if ttype in T.Whitespace or ttype in T.Comment:
+            continue
+        if ttype in T.Keyword or ttype in T.Name:
+            value = value.lower()
+        tokens.append((ttype, value))
+
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(sql_query: str) -> str:
+    """Normalize a query so that trivially different spellings share a cache key."""
+    return " ".join(value for _, value in normalized_tokens(sql_query))
+
+
+# Functions and clauses whose result changes between runs of the same query
+_VOLATILE = frozenset(
+    """
+    random setseed uuid gen_random_uuid nextval currval
+    now today current_date current_time current_timestamp localtime localtimestamp
+    get_current_time get_current_timestamp transaction_timestamp
+    sample tablesample
+    """.split()
+)
+
+
+@lru_cache(maxsize=1024)
+def is_cacheable(sql_query: str) -> bool:
+    """False if the query calls a volatile function (random(), now(), ...) or samples rows."""
+    return not any(
+        (ttype in T.Keyword or ttype in T.Name) and value.lower() in _VOLATILE
+        for ttype, value in lexer.tokenize(sql_query)
+    )
+
+
+def _estimate_size(result: QueryResult) -> int:
+    size = sys.getsizeof(result.rows) + sum(sys.getsizeof(c) for c in result.columns)
+    for row in result.rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row)
+    return size
+
+
+class ResultCache:
+    """In-process LRU cache of query results bounded by an approximate byte budget.
+
+    Entries are keyed on the normalized SQL plus a version stamp of the database,
+    so they go stale on their own once the database is rebuilt. Results are stored
+    with tuple rows and every caller gets its own copy, so callers can't change what
+    the next one is served.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[QueryResult, int]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def key(self, sql_query: str, version, max_rows: int) -> tuple:
+        return (normalize_sql(sql_query), version, max_rows)
+
+    def get(self, key: tuple) -> QueryResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[0]
+        return replace(
+            result,
+            columns=list(result.columns),
+            rows=list(result.rows),
+            column_types=list(result.column_types),
+        )
+
+    def put(self, key: tuple, result: QueryResult) -> None:
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+        result = replace(
+            result,
+            columns=tuple(result.columns),
+            rows=tuple(tuple(row) for row in result.rows),
+            column_types=tuple(result.column_types),
+        )
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
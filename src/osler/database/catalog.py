@@ -0,0 +1,82 @@
+from dataclasses import dataclass, field
+
+CATALOG_QUERY = """
+SELECT table_schema, table_name, column_name, data_type, is_nullable, column_default
+FROM information_schema.columns
+WHERE table_catalog = current_database()
+ORDER BY table_schema, table_name, ordinal_position
+"""
+
+
+def quote_identifier(name: str) -> str:
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+@dataclass
+class Column:
+    name: str
+    data_type: str
+    nullable: bool = True
+    default: str | None = None
+
+
+@dataclass
+class Table:
+    schema: str
+    name: str
+    columns: list[Column] = field(default_factory=list)
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.schema}.{self.name}"
+
+    @property
+    def quoted_name(self) -> str:
+        return f"{quote_identifier(self.schema)}.{quote_identifier(self.name)}"
+
+
+class Catalog:
+    """In-memory snapshot of every schema, table and column in a database."""
+
+    def __init__(self, tables: list[Table]):
+        self.tables = tables
+        self._by_name = {t.qualified_name.lower(): t for t in tables}
+        self._by_bare_name: dict[str, list[Table]] = {}
+        for t in tables:
+            self._by_bare_name.setdefault(t.name.lower(), []).append(t)
+
+    @classmethod
+    def load(cls, conn) -> "Catalog":
+        """Build the catalog with a single pass over information_schema.columns."""
+        tables: list[Table] = []
+        for schema, name, column, data_type, is_nullable, default in conn.execute(
+            CATALOG_QUERY
+        ).fetchall():
+            if not tables or tables[-1].schema != schema or tables[-1].name != name:
+                tables.append(Table(schema=schema, name=name))
+            tables[-1].columns.append(
+                Column(column, data_type, nullable=is_nullable == "YES", default=default)
+            )
+        return cls(tables)
+
+    @property
+    def schemas(self) -> list[str]:
+        return sorted({t.schema for t in self.tables})
+
+    def table_names(self) -> list[str]:
+        return [t.qualified_name for t in self.tables]
+
+    def find(self, table_name: str) -> Table | None:
+        """Look up a table by `schema.table`, or by bare name if it is unambiguous."""
+        key = table_name.strip().replace('"', "").lower()
+        if key in self._by_name:
+            return self._by_name[key]
+
+        matches = self._by_bare_name.get(key, [])
+        if len(matches) == 1:
+            return matches[0]
+        for t in matches:
+            if t.schema == "main":
+                return t
+        return None
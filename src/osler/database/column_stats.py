@@ -0,0 +1,119 @@
+import os
+from pathlib import Path
+
+import duckdb
+
+from .catalog import Catalog, Table, quote_identifier
+
+STATS_COLUMNS = [
+    "table_schema",
+    "table_name",
+    "column_name",
+    "column_type",
+    "row_count",
+    "null_rate",
+    "approx_distinct",
+    "min",
+    "max",
+    "avg",
+    "top_values",
+]
+_STATS_DDL = """
+CREATE TEMP TABLE column_stats (
+    table_schema VARCHAR, table_name VARCHAR, column_name VARCHAR, column_type VARCHAR,
+    row_count BIGINT, null_rate DOUBLE, approx_distinct BIGINT,
+    min VARCHAR, max VARCHAR, avg VARCHAR, top_values VARCHAR[]
+)
+"""
+# Top values are skipped for near-unique columns (ids, timestamps), where they say nothing
+_TOP_VALUES_MAX_DISTINCT_RATIO = 0.5
+_NO_TOP_VALUES_TYPES = ("BLOB", "STRUCT", "MAP", "UNION", "[]")
+
+
+def stats_path(db_path: str | Path) -> Path:
+    """Sidecar file holding the column statistics of the database `db_path` resolves to.
+
+    It sits next to the snapshot it describes, so it is replaced and garbage-collected
+    along with it.
+    """
+    resolved = Path(os.path.realpath(db_path))
+    return resolved.with_name(resolved.name + ".column_stats.parquet")
+
+
+def _wants_top_values(column_type: str, approx_distinct: int, row_count: int) -> bool:
+    if any(marker in column_type for marker in _NO_TOP_VALUES_TYPES):
+        return False
+    return approx_distinct <= max(row_count * _TOP_VALUES_MAX_DISTINCT_RATIO, 1)
+
+
+def compute_column_stats(conn, tables: list[Table], top_k: int = 5) -> list[tuple]:
+    """Per-column statistics for `tables`, one row per column in STATS_COLUMNS order.
+
+    Uses DuckDB's SUMMARIZE (HyperLogLog distinct counts) plus one approx_top_k pass
+    per table, so each table is scanned at most twice.
+    """
+    rows = []
+    for table in tables:
+        summary = conn.execute(f"SUMMARIZE {table.quoted_name}").fetchall()
+
+        # SUMMARIZE columns: name, type, min, max, approx_unique, avg, std, q25, q50, q75,
+        # count, null_percentage
+        candidates = [
+            s[0] for s in summary if top_k > 0 and _wants_top_values(s[1], s[4] or 0, s[10] or 0)
+        ]
+        top_values: dict[str, list[str]] = {}
+        if candidates:
+            selects = ", ".join(
+                f"approx_top_k({quote_identifier(name)}, {int(top_k)})::VARCHAR[]"
+                for name in candidates
+            )
+            values = conn.execute(f"SELECT {selects} FROM {table.quoted_name}").fetchone()
+            top_values = dict(zip(candidates, values))
+
+        for name, column_type, min_, max_, approx_unique, avg, *_, count, null_pct in summary:
+            rows.append(
+                (
+                    table.schema,
+                    table.name,
+                    name,
+                    column_type,
+                    count,
+                    float(null_pct or 0) / 100,
+                    # HyperLogLog can overshoot on small tables
+                    min(approx_unique, count) if approx_unique is not None else None,
+                    min_,
+                    max_,
+                    avg,
+                    top_values.get(name),
+                )
+            )
+    return rows
+
+
+def write_column_stats(db_path: str | Path, top_k: int = 5) -> Path:
+    """Profile every table in `db_path` and write the sidecar stats file."""
+    path = stats_path(db_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with duckdb.connect(str(db_path), read_only=True) as conn:
+        rows = compute_column_stats(conn, Catalog.load(conn).tables, top_k)
+        conn.execute(_STATS_DDL)
+        if rows:
+            conn.executemany(
+                f"INSERT INTO column_stats VALUES ({', '.join('?' * len(STATS_COLUMNS))})", rows
+            )
+        quoted_path = str(tmp_path).replace("'", "''")
+        conn.execute(f"COPY column_stats TO '{quoted_path}' (FORMAT PARQUET)")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_column_stats(path: str | Path) -> dict[str, list[tuple]]:
+    """Read a sidecar stats file into `{"schema.table" (lowercase): [rows]}`."""
+    stats: dict[str, list[tuple]] = {}
+    with duckdb.connect() as conn:
+        for row in conn.execute(
+            f"SELECT {', '.join(map(quote_identifier, STATS_COLUMNS))} FROM read_parquet(?)",
+            [str(path)],
+        ).fetchall():
+            stats.setdefault(f"{row[0]}.{row[1]}".lower(), []).append(row)
+    return stats
@@ -0,0 +1,112 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+
+import duckdb
+
+from .base import QueryResult
+from .pool import ConnectionPool
+
+
+class _OpenResult:
+    def __init__(self, conn, cursor, page: QueryResult, pending: list[tuple]):
+        self.conn = conn
+        self.cursor = cursor  # the relation being streamed from `conn`
+        self.columns = page.columns
+        self.column_types = page.column_types
+        self.pending = pending  # rows already fetched but not yet returned
+        self.offset = page.offset + len(page.rows)
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class OpenResultRegistry:
+    """Keeps partially-consumed query results open so they can be paged through.
+
+    Each open result owns a connection detached from the pool, and is closed once
+    fully read, after `ttl` seconds of inactivity, or when more than `max_open`
+    results are alive (oldest first).
+    """
+
+    def __init__(self, pool: ConnectionPool, max_open: int = 8, ttl: float = 300.0, deadline=None):
+        self.pool = pool
+        self.deadline = deadline
+        self.max_open = max_open
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._results: OrderedDict[str, _OpenResult] = OrderedDict()
+
+    def open(self, conn, cursor, page: QueryResult, pending: list[tuple]) -> str:
+        """Register a detached connection positioned after `page` and return its token."""
+        token = secrets.token_urlsafe(12)
+        evicted = []
+        with self._lock:
+            self._results[token] = _OpenResult(conn, cursor, page, pending)
+            evicted.extend(self._expire())
+            while len(self._results) > self.max_open:
+                evicted.append(self._results.popitem(last=False)[1])
+        for result in evicted:
+            self.pool.close_detached(result.conn)
+        return token
+
+    def fetch(self, token: str, max_rows: int, timeout: float | None = None) -> QueryResult:
+        """Fetch the next page of rows for a continuation token."""
+        with self._lock:
+            for result in self._expire():
+                self.pool.close_detached(result.conn)
+            result = self._results.get(token)
+            if result is not None:
+                self._results.move_to_end(token)
+        if result is None:
+            raise KeyError(f"Unknown or expired continuation token: {token}")
+
+        with result.lock:
+            deadline = nullcontext()
+            if self.deadline is not None:
+                deadline = self.deadline(timeout, result.conn.interrupt)
+            try:
+                with deadline:
+                    rows = result.cursor.fetchmany(max_rows + 1 - len(result.pending))
+            except duckdb.ConnectionException as e:
+                self._discard(token)
+                raise KeyError(f"Unknown or expired continuation token: {token}") from e
+            except BaseException:
+                self._discard(token)
+                raise
+            rows = result.pending + rows
+
+            page = QueryResult(
+                columns=result.columns,
+                rows=rows[:max_rows],
+                column_types=result.column_types,
+                offset=result.offset,
+            )
+            if len(rows) > max_rows:
+                result.pending = rows[max_rows:]
+                result.offset += max_rows
+                result.last_used = time.monotonic()
+                page.has_more = True
+                page.continuation_token = token
+            else:
+                self._discard(token)
+            return page
+
+    def close(self) -> None:
+        with self._lock:
+            results = list(self._results.values())
+            self._results.clear()
+        for result in results:
+            self.pool.close_detached(result.conn)
+
+    def _discard(self, token: str) -> None:
+        with self._lock:
+            result = self._results.pop(token, None)
+        if result is not None:
+            self.pool.close_detached(result.conn)
+
+    def _expire(self) -> list[_OpenResult]:
+        now = time.monotonic()
+        expired = [t for t, r in self._results.items() if now - r.last_used > self.ttl]
+        return [self._results.pop(t) for t in expired]
@@ -1,51 +1,180 @@
-import duckdb
+import threading
+import time
 
-from .base import Database
+from osler.formatting import render_result
+
+from .base import Database, QueryResult, QueryTimeoutError
+from .cache import ResultCache, is_cacheable
+from .catalog import Catalog
+from .column_stats import STATS_COLUMNS, compute_column_stats, load_column_stats, stats_path
+from .cursors import OpenResultRegistry
+from .pool import ConnectionPool, file_version
+from .profiling import QueryProfile, parse_plan
 
 
 class DuckDB(Database):
-    def __init__(self, db_path=None):
+    def __init__(
+        self,
+        db_path=None,
+        pool_size: int = 4,
+        pool_timeout: float = 30.0,
+        cache_bytes: int = 64 * 1024 * 1024,
+        query_timeout: float | None = None,
+    ):
+        super().__init__(query_timeout=query_timeout)
         self.db_path = db_path
+        self.pool = ConnectionPool(db_path, size=pool_size, timeout=pool_timeout)
+        self.open_results = OpenResultRegistry(self.pool, deadline=self.deadline)
+        self.result_cache = ResultCache(max_bytes=cache_bytes)
+        self._catalog: Catalog | None = None
+        self._catalog_version = None
+        self._catalog_lock = threading.Lock()
+        self._column_stats: dict[str, list[tuple]] = {}
+        self._column_stats_version = None
+        self._column_stats_lock = threading.Lock()
 
     def _conn(self):
-        return duckdb.connect(self.db_path)
+        return self.pool.connection()
+
+    def close(self) -> None:
+        self.open_results.close()
+        self.pool.close()
+
+    def execute_query(
+        self, sql_query: str, max_rows: int = 50, timeout: float | None = None
+    ) -> QueryResult:
+        """Run a query, fetching only the first `max_rows` rows.
+
+        If the result has more rows, the connection is kept open and a continuation
+        token is returned so the rest can be paged through with `fetch_more`. Results
+        that fit in a single page are served from the result cache when possible.
+        Queries running past `timeout` seconds are interrupted (QueryTimeoutError).
+        """
+        return self._execute_query(sql_query, max_rows, timeout)
+
+    def _execute_query(
+        self, sql_query: str, max_rows: int = 50, timeout: float | None = None
+    ) -> QueryResult:
+        # Also used for queries the backend runs on its own behalf (table samples),
+        # which shouldn't be counted as execute_query calls by metrics instrumentation
+        cache_key = None
+        if self.result_cache.enabled and is_cacheable(sql_query):
+            cache_key = self.result_cache.key(sql_query, file_version(self.db_path), max_rows)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-    def execute_query(self, sql_query: str) -> str:
-        conn = self._conn()
+        conn = self.pool.acquire()
         try:
-            df = conn.execute(sql_query).df()
-            if df.empty:
-                return "No results found"
-            if len(df) > 50:
-                return df.head(50).to_string(index=False) + f"\n... ({len(df)} rows)"
-            return df.to_string(index=False)
-        finally:
-            conn.close()
+            with self.deadline(timeout, conn.interrupt):
+                relation = conn.sql(sql_query)
+                rows = relation.fetchmany(max_rows + 1)  # one extra row tells us if there is more
+            page = QueryResult(
+                columns=relation.columns,
+                rows=rows[:max_rows],
+                column_types=[str(t) for t in relation.types],
+            )
+        except BaseException:
+            self.pool.release(conn)
+            raise
+
+        if len(rows) <= max_rows:
+            self.pool.release(conn)
+            if cache_key is not None:
+                self.result_cache.put(cache_key, page)
+            return page
+
+        self.pool.detach(conn)
+        page.has_more = True
+        page.continuation_token = self.open_results.open(conn, relation, page, rows[max_rows:])
+        return page
+
+    def fetch_more(
+        self, continuation_token: str, max_rows: int = 50, timeout: float | None = None
+    ) -> QueryResult:
+        return self.open_results.fetch(continuation_token, max_rows, timeout=timeout)
+
+    def profile_query(self, sql_query: str, timeout: float | None = None) -> QueryProfile:
+        """Run `sql_query` to completion under EXPLAIN ANALYZE and parse the operator tree."""
+        with self._conn() as conn, self.deadline(timeout, conn.interrupt):
+            start = time.perf_counter()
+            rows = conn.sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql_query}").fetchall()
+            elapsed = time.perf_counter() - start
+        return QueryProfile(sql=sql_query, total_seconds=elapsed, plan=parse_plan(rows[0][1]))
+
+    def catalog(self) -> Catalog:
+        """Return the schema catalog, rebuilding it if the database file changed."""
+        version = file_version(self.db_path)
+        with self._catalog_lock:
+            if self._catalog is None or self._catalog_version != version:
+                with self._conn() as conn:
+                    self._catalog = Catalog.load(conn)
+                self._catalog_version = version
+            return self._catalog
 
     def get_schema(self) -> list[str]:
-        conn = self._conn()
-        results = []
-        try:
-            schemas = conn.execute("SELECT schema_name FROM information_schema.schemata").fetchall()
-            for (schema,) in schemas:
-                tables = conn.execute(
-                    f"SELECT table_name FROM information_schema.tables WHERE table_schema = '{schema}'"
-                ).fetchall()
-                for (table,) in tables:
-                    results.append(f"{schema}.{table}")
-            return results
-        finally:
-            conn.close()
-
-    def get_table_info(self, table_name: str, show_sample: bool = True) -> str:
-        conn = self._conn()
-        try:
-            col_info = conn.execute(f"PRAGMA table_info({table_name})").df()
-            result = f"Table: {table_name}\n\nColumns:\n{col_info.to_string(index=False)}"
-
-            if show_sample:
-                sample = conn.execute(f"SELECT * FROM {table_name} LIMIT 3").df()
-                result += f"\n\nSample:\n{sample.to_string(index=False)}"
-            return result
-        finally:
-            conn.close()
+        return self.catalog().table_names()
+
+    def get_table_info(
+        self, table_name: str, show_sample: bool = True, output_format: str = "csv"
+    ) -> str:
+        table = self.catalog().find(table_name)
+        if table is None:
+            raise ValueError(f"Table not found: {table_name}")
+
+        col_info = QueryResult(
+            columns=["cid", "name", "type", "notnull", "dflt_value"],
+            rows=[
+                (cid, c.name, c.data_type, not c.nullable, c.default)
+                for cid, c in enumerate(table.columns)
+            ],
+        )
+        result = f"Table: {table_name}\n\nColumns:\n{render_result(col_info, output_format)}"
+
+        if show_sample:
+            sample = self._execute_query(f"SELECT * FROM {table.quoted_name} LIMIT 3")
+            result += f"\n\nSample:\n{render_result(sample, output_format)}"
+        return result
+
+    def column_stats(self) -> dict[str, list[tuple]]:
+        """Precomputed column statistics, reloaded when the sidecar file changes."""
+        path = stats_path(self.db_path)
+        version = file_version(path)
+        with self._column_stats_lock:
+            if version != self._column_stats_version:
+                self._column_stats = load_column_stats(path) if version else {}
+                self._column_stats_version = version
+            return self._column_stats
+
+    def get_table_profile(self, table_name: str, output_format: str = "csv") -> str:
+        table = self.catalog().find(table_name)
+        if table is None:
+            raise ValueError(f"Table not found: {table_name}")
+
+        rows = self.column_stats().get(table.qualified_name.lower())
+        note = ""
+        if rows is None:
+            # Profiling scans the whole table, so it is held to the query time limit
+            try:
+                with self._conn() as conn, self.deadline(None, conn.interrupt):
+                    rows = compute_column_stats(conn, [table])
+            except QueryTimeoutError as e:
+                return (
+                    f"Table: {table.qualified_name}\n\nNo precomputed statistics, and "
+                    f"computing them now took too long ({e}).\n"
+                    "Run `osler stats` to precompute statistics for every table."
+                )
+            note = "\n\n(Computed now; run `osler stats` to precompute statistics for every table.)"
+
+        row_count = rows[0][4] if rows else 0
+        stats = QueryResult(
+            columns=STATS_COLUMNS[2:4] + STATS_COLUMNS[5:],
+            rows=[
+                (r[2], r[3], round(r[5], 4), r[6], r[7], r[8], r[9], ", ".join(r[10] or []))
+                for r in rows
+            ],
+        )
+        return (
+            f"Table: {table.qualified_name} ({row_count:,} rows)\n\n"
+            f"Column statistics:\n{render_result(stats, output_format)}{note}"
+        )
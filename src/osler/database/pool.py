@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import duckdb
+
+
+def file_version(path) -> tuple[int, int, int] | None:
+    """Return a cheap version stamp (inode, size, mtime) for a database file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class ConnectionPool:
+    """Long-lived pool of read-only DuckDB connections to a single database file.
+
+    Every connection in the pool shares one DuckDB instance, so the catalog and
+    buffer cache stay warm between tool calls. Idle connections are health-checked
+    before being handed out, and the whole pool is reopened once the database file
+    is replaced on disk (e.g. after `osler init`).
+
+    If `db_path` is a symlink to a snapshot (see `osler.database.snapshots`), a swap
+    to a new snapshot moves new borrowers onto it straight away, while connections
+    already handed out finish on the old one.
+    """
+
+    def __init__(
+        self,
+        db_path,
+        size: int = 4,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.db_path = Path(db_path)
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._idle: list[tuple[duckdb.DuckDBPyConnection, float]] = []
+        self._in_use: dict[int, int] = {}  # id(conn) -> generation
+        self._detached: dict[int, duckdb.DuckDBPyConnection] = {}
+        self._generation = 0
+        self._generation_paths: dict[int, str] = {}  # generation -> resolved file
+        self._version = None
+        self._closed = False
+
+    # -------------------------------------------------------
+    # Borrowing
+    # -------------------------------------------------------
+    def acquire(self) -> duckdb.DuckDBPyConnection:
+        """Borrow a connection, waiting up to `timeout` seconds for one to free up."""
+        deadline = time.monotonic() + self.timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+
+                self._check_version()
+
+                # Connections from a file replaced in place must be returned before new
+                # ones are opened, otherwise DuckDB would hand back the cached old
+                # instance. A new snapshot lives at a new path, so there's no need to wait.
+                current_path = os.path.realpath(self.db_path)
+                draining = any(
+                    gen != self._generation and self._generation_paths.get(gen) == current_path
+                    for gen in self._in_use.values()
+                )
+
+                if not draining:
+                    while self._idle:
+                        conn, last_used = self._idle.pop()
+                        if self._is_healthy(conn, last_used):
+                            self._in_use[id(conn)] = self._generation
+                            return conn
+                        _close_quietly(conn)
+
+                    if len(self._in_use) < self.size:
+                        conn = self._open()
+                        self._in_use[id(conn)] = self._generation
+                        return conn
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a database connection"
+                    )
+                self._cond.wait(remaining)
+
+    def release(self, conn: duckdb.DuckDBPyConnection, discard: bool = False) -> None:
+        """Return a borrowed connection to the pool."""
+        with self._cond:
+            generation = self._in_use.pop(id(conn), None)
+            if discard or self._closed or generation != self._generation:
+                _close_quietly(conn)
+                self._forget_old_generations()
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def detach(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Take a borrowed connection out of the pool's accounting.
+
+        The caller becomes responsible for closing it via `close_detached`. Detached
+        connections are still closed by the pool when the database file is replaced.
+        """
+        with self._cond:
+            self._in_use.pop(id(conn), None)
+            self._detached[id(conn)] = conn
+            self._cond.notify()
+
+    def close_detached(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Close a connection previously handed out by `detach`."""
+        with self._cond:
+            self._detached.pop(id(conn), None)
+        _close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a `with` block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close every idle and detached connection and refuse new borrowers."""
+        with self._cond:
+            self._closed = True
+            self._reset()
+            self._cond.notify_all()
+
+    # -------------------------------------------------------
+    # Internals (callers must hold self._cond)
+    # -------------------------------------------------------
+    def _open(self) -> duckdb.DuckDBPyConnection:
+        if self._version is None:
+            self._version = file_version(self.db_path)
+        path = self._generation_paths.setdefault(self._generation, os.path.realpath(self.db_path))
+        return duckdb.connect(path, read_only=True)
+
+    def _check_version(self) -> None:
+        if self._version is None:
+            return
+        current = file_version(self.db_path)
+        if current != self._version:
+            old_path = self._generation_paths.get(self._generation)
+            self._generation += 1
+            self._version = None
+            # Paged results on a replaced snapshot can still be read to the end
+            self._reset(keep_detached=old_path != os.path.realpath(self.db_path))
+
+    def _reset(self, keep_detached: bool = False) -> None:
+        for conn, _ in self._idle:
+            _close_quietly(conn)
+        self._idle.clear()
+        if not keep_detached:
+            for conn in self._detached.values():
+                _close_quietly(conn)
+            self._detached.clear()
+
+    def _forget_old_generations(self) -> None:
+        live = set(self._in_use.values()) | {self._generation}
+        for generation in list(self._generation_paths):
+            if generation not in live:
+                del self._generation_paths[generation]
+
+    def _is_healthy(self, conn: duckdb.DuckDBPyConnection, last_used: float) -> bool:
+        if time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchall()
+            return True
+        except duckdb.Error:
+            return False
+
+
+def _close_quietly(conn: duckdb.DuckDBPyConnection) -> None:
+    try:
+        conn.close()
+    except duckdb.Error:
+        pass
@@ -0,0 +1,138 @@
+import json
+from dataclasses import dataclass, field
+
+# extra_info keys worth showing next to an operator, in display order
+_DETAIL_KEYS = ("Table", "Join Type", "Conditions", "Groups", "Aggregates", "Filters")
+# Operators that only wrap the plan and carry no useful timing
+_WRAPPER_OPERATORS = {"EXPLAIN_ANALYZE", "RESULT_COLLECTOR"}
+_MAX_DETAIL_CHARS = 80
+# Actual vs estimated cardinality ratio above which an estimate is flagged
+_MISESTIMATE_RATIO = 10
+
+
+@dataclass
+class PlanNode:
+    """One operator from a DuckDB EXPLAIN ANALYZE plan."""
+
+    name: str
+    timing: float  # seconds spent in this operator alone
+    cardinality: int
+    estimated_cardinality: int | None = None
+    details: str = ""
+    children: list["PlanNode"] = field(default_factory=list)
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    @property
+    def misestimated(self) -> bool:
+        if not self.estimated_cardinality:
+            return False
+        ratio = max(self.cardinality, 1) / max(self.estimated_cardinality, 1)
+        return ratio > _MISESTIMATE_RATIO or ratio < 1 / _MISESTIMATE_RATIO
+
+
+@dataclass
+class QueryProfile:
+    sql: str
+    total_seconds: float
+    plan: list[PlanNode]
+
+
+def _details(extra_info: dict) -> str:
+    parts = []
+    for key in _DETAIL_KEYS:
+        value = extra_info.get(key)
+        if not value:
+            continue
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        value = " ".join(str(value).split())
+        if len(value) > _MAX_DETAIL_CHARS:
+            value = value[: _MAX_DETAIL_CHARS - 3] + "..."
+        parts.append(f"{key}: {value}")
+    return "; ".join(parts)
+
+
+def _to_nodes(node: dict) -> list[PlanNode]:
+    children = [n for child in node.get("children", []) for n in _to_nodes(child)]
+    name = node.get("operator_name")
+    if not name or name in _WRAPPER_OPERATORS:
+        return children
+
+    extra_info = node.get("extra_info", {})
+    estimate = extra_info.get("Estimated Cardinality")
+    return [
+        PlanNode(
+            name=name.strip(),
+            timing=node.get("operator_timing", 0.0),
+            cardinality=node.get("operator_cardinality", 0),
+            estimated_cardinality=int(estimate) if str(estimate).isdigit() else None,
+            details=_details(extra_info),
+            children=children,
+        )
+    ]
+
+
+def parse_plan(plan_json: str) -> list[PlanNode]:
+    """Turn DuckDB's `EXPLAIN (ANALYZE, FORMAT JSON)` output into operator trees."""
+    return _to_nodes(json.loads(plan_json))
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+def render_profile(profile: QueryProfile, top_n: int = 5) -> str:
+    """Compact text rendering: summary, hottest operators, then the operator tree."""
+    nodes = [n for root in profile.plan for n in root.walk()]
+    operator_time = sum(n.timing for n in nodes) or 1e-9
+
+    lines = [f"Total time: {_ms(profile.total_seconds)} ({len(nodes)} operators)"]
+
+    hottest = sorted(nodes, key=lambda n: n.timing, reverse=True)[:top_n]
+    if hottest:
+        lines.append("")
+        lines.append(f"Hottest operators (share of {_ms(operator_time)} operator time):")
+        for rank, node in enumerate(hottest, 1):
+            line = (
+                f"{rank}. {node.name} {_ms(node.timing)} "
+                f"({node.timing / operator_time:.0%}), {node.cardinality:,} rows"
+            )
+            if node.details:
+                line += f" [{node.details}]"
+            lines.append(line)
+
+    misestimated = [n for n in nodes if n.misestimated]
+    if misestimated:
+        lines.append("")
+        lines.append("Cardinality misestimates (actual vs estimated rows):")
+        for node in misestimated:
+            lines.append(
+                f"- {node.name}: {node.cardinality:,} vs {node.estimated_cardinality:,}"
+                + (f" [{node.details}]" if node.details else "")
+            )
+
+    lines.append("")
+    lines.append("Operator tree (time, rows/estimated rows):")
+
+    def add(node: PlanNode, depth: int) -> None:
+        # Projections are everywhere in DuckDB plans; hide the ones that cost nothing
+        if node.name == "PROJECTION" and node.timing / operator_time < 0.01:
+            for child in node.children:
+                add(child, depth)
+            return
+
+        estimate = f"/{node.estimated_cardinality:,}" if node.estimated_cardinality else ""
+        line = f"{'  ' * depth}{node.name} {_ms(node.timing)}, {node.cardinality:,}{estimate} rows"
+        if node.details:
+            line += f" [{node.details}]"
+        lines.append(line)
+        for child in node.children:
+            add(child, depth + 1)
+
+    for root in profile.plan:
+        add(root, 0)
+    return "\n".join(lines)
@@ -0,0 +1,78 @@
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+# A dataset's database path (e.g. osler_data/databases/tuva_project_demo.duckdb) is a
+# symlink to the current immutable snapshot, snapshots/<timestamp>/<same file name>.
+# The file name is kept because DuckDB derives the catalog name from it.
+# Builds write a new snapshot and then swap the link, so readers never see a partial
+# database and keep using the snapshot they opened until they reconnect.
+SNAPSHOTS_DIRNAME = "snapshots"
+
+
+def snapshots_dir(db_path: str | Path) -> Path:
+    return Path(db_path).parent / SNAPSHOTS_DIRNAME
+
+
+def current_snapshot(db_path: str | Path) -> Path | None:
+    """The file `db_path` currently resolves to, or None if there is no database."""
+    db_path = Path(db_path)
+    if not db_path.exists():
+        return None
+    return db_path.resolve()
+
+
+def new_snapshot(db_path: str | Path, copy_current: bool = False) -> Path:
+    """Reserve a path for a new snapshot of `db_path`.
+
+    With `copy_current`, the current database is copied there first so an
+    incremental build can update it without touching the published snapshot.
+    """
+    db_path = Path(db_path)
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    snapshot = snapshots_dir(db_path) / stamp / db_path.name
+    snapshot.parent.mkdir(parents=True)
+
+    current = current_snapshot(db_path)
+    if copy_current and current is not None:
+        shutil.copy2(current, snapshot)
+    return snapshot
+
+
+def publish_snapshot(db_path: str | Path, snapshot: str | Path) -> None:
+    """Atomically point `db_path` at `snapshot`."""
+    db_path = Path(db_path)
+    snapshot = Path(snapshot)
+    if not snapshot.exists():
+        raise FileNotFoundError(f"Snapshot {snapshot} was not built")
+
+    tmp_link = db_path.with_name(db_path.name + ".tmp")
+    tmp_link.unlink(missing_ok=True)
+    os.symlink(os.path.relpath(snapshot, db_path.parent), tmp_link)
+    # rename(2) replaces the old link (or a pre-snapshot database file) in one step
+    os.replace(tmp_link, db_path)
+
+
+def discard_snapshot(snapshot: str | Path) -> None:
+    """Remove an unpublished snapshot, e.g. after a failed build."""
+    shutil.rmtree(Path(snapshot).parent, ignore_errors=True)
+
+
+def gc_snapshots(db_path: str | Path, keep: int = 2) -> list[Path]:
+    """Delete all but the `keep` newest snapshots of `db_path`, never the current one.
+
+    The previous snapshot is kept by default so servers still reading from it can
+    finish their queries; on POSIX systems open files stay readable after deletion.
+    """
+    db_path = Path(db_path)
+    current = current_snapshot(db_path)
+    snapshots = sorted(snapshots_dir(db_path).glob(f"*/{db_path.name}"), reverse=True)
+
+    removed = []
+    for snapshot in snapshots[keep:]:
+        if snapshot.resolve() == current:
+            continue
+        discard_snapshot(snapshot)
+        removed.append(snapshot)
+    return removed
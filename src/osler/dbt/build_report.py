@@ -0,0 +1,123 @@
+import json
+from collections import deque
+from dataclasses import dataclass, field
+
+# Error lines kept for the failure message; the rest of the log is not buffered
+_MAX_ERROR_LINES = 50
+
+
+@dataclass
+class NodeTiming:
+    unique_id: str
+    name: str
+    resource_type: str
+    status: str
+    seconds: float
+
+
+@dataclass
+class BuildLog:
+    """Incremental parser for dbt's `--log-format json` output.
+
+    Feed it one line at a time; it keeps per-node timings and recent errors only.
+    """
+
+    nodes: dict[str, NodeTiming] = field(default_factory=dict)
+    errors: deque = field(default_factory=lambda: deque(maxlen=_MAX_ERROR_LINES))
+
+    def feed(self, line: str) -> str | None:
+        """Parse one log line; returns a progress message when a node finishes."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            # Not every line is structured (e.g. tracebacks from a crashing adapter)
+            self.errors.append(line)
+            return None
+
+        info = event.get("info", {})
+        data = event.get("data", {})
+        if info.get("level") == "error" and info.get("msg"):
+            self.errors.append(info["msg"])
+
+        node_info = data.get("node_info")
+        if not node_info or "total" not in data:
+            return None
+        # Per-node result events (LogModelResult, LogTestResult, ...) carry index/total
+        status = str(data.get("status") or node_info.get("node_status", ""))
+        seconds = float(data.get("execution_time") or 0.0)
+        self.nodes[node_info["unique_id"]] = NodeTiming(
+            node_info["unique_id"],
+            node_info.get("node_name", node_info["unique_id"]),
+            node_info.get("resource_type", ""),
+            status,
+            seconds,
+        )
+        return (
+            f"[{data.get('index', len(self.nodes))}/{data['total']}] {status.upper()} "
+            f"{node_info.get('resource_type', 'node')} {node_info.get('node_name', '')} "
+            f"({seconds:.2f}s)"
+        )
+
+    def slowest(self, top_n: int = 10) -> list[NodeTiming]:
+        return sorted(self.nodes.values(), key=lambda n: n.seconds, reverse=True)[:top_n]
+
+    def critical_path(self, parents: dict[str, list[str]]) -> tuple[list[NodeTiming], float]:
+        """Longest chain of dependent nodes by summed execution time.
+
+        With unlimited threads the build can't finish faster than this chain.
+        Only nodes that ran in this build are considered.
+        """
+        best: dict[str, tuple[float, str | None]] = {}
+
+        def longest(unique_id: str) -> float:
+            # Iterative post-order so deep DAGs don't hit the recursion limit
+            stack = [(unique_id, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if node in best:
+                    continue
+                ran_parents = [p for p in parents.get(node, []) if p in self.nodes]
+                if not expanded:
+                    stack.append((node, True))
+                    stack.extend((p, False) for p in ran_parents if p not in best)
+                    continue
+                through = max(ran_parents, key=lambda p: best[p][0], default=None)
+                upstream = best[through][0] if through else 0.0
+                best[node] = (upstream + self.nodes[node].seconds, through)
+            return best[unique_id][0]
+
+        if not self.nodes:
+            return [], 0.0
+        end = max(self.nodes, key=longest)
+        path = []
+        node: str | None = end
+        while node is not None:
+            path.append(self.nodes[node])
+            node = best[node][1]
+        return path[::-1], best[end][0]
+
+
+def render_build_report(
+    log: BuildLog, parents: dict[str, list[str]] | None = None, top_n: int = 10
+) -> str:
+    """Summary of a finished build: total node time, slowest nodes and critical path."""
+    total = sum(n.seconds for n in log.nodes.values())
+    lines = [f"{len(log.nodes)} nodes, {total:.1f}s of node execution time"]
+
+    slowest = log.slowest(top_n)
+    if slowest:
+        lines.append("")
+        lines.append("Slowest nodes:")
+        for rank, node in enumerate(slowest, 1):
+            lines.append(f"{rank}. {node.name} ({node.resource_type}) {node.seconds:.2f}s")
+
+    if parents is not None:
+        path, length = log.critical_path(parents)
+        if path:
+            lines.append("")
+            lines.append(f"Critical path ({length:.1f}s, {len(path)} nodes):")
+            lines.extend(f"  {node.name} {node.seconds:.2f}s" for node in path)
+    return "\n".join(lines)
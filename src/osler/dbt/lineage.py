@@ -0,0 +1,96 @@
+import json
+import threading
+from collections import deque
+from pathlib import Path
+
+from osler.database.pool import file_version
+
+# `dbt ls` prefixes non-node resources with their type, e.g. "source:tuva.raw.patient"
+_LABEL_PREFIXES = {
+    "source": "source:",
+    "exposure": "exposure:",
+    "metric": "metric:",
+    "semantic_model": "semantic_model:",
+    "saved_query": "saved_query:",
+    "unit_test": "unit_test:",
+}
+_MANIFEST_SECTIONS = (
+    "nodes",
+    "sources",
+    "exposures",
+    "metrics",
+    "semantic_models",
+    "saved_queries",
+    "unit_tests",
+)
+
+
+class LineageIndex:
+    """Adjacency index over a dbt manifest's parent_map/child_map."""
+
+    def __init__(self, manifest: dict):
+        self.parents: dict[str, list[str]] = manifest.get("parent_map", {})
+        self.children: dict[str, list[str]] = manifest.get("child_map", {})
+        self.labels: dict[str, str] = {}
+        self.by_name: dict[str, list[str]] = {}
+        self.tests_by_parent: dict[str, list[str]] = {}
+
+        for section in _MANIFEST_SECTIONS:
+            for unique_id, node in manifest.get(section, {}).items():
+                resource_type = node.get("resource_type", "")
+                fqn = ".".join(node.get("fqn", [])) or unique_id
+                self.labels[unique_id] = _LABEL_PREFIXES.get(resource_type, "") + fqn
+
+                if resource_type in ("model", "seed", "snapshot"):
+                    self.by_name.setdefault(node["name"], []).append(unique_id)
+                elif resource_type == "test":
+                    for parent in node.get("depends_on", {}).get("nodes", []):
+                        self.tests_by_parent.setdefault(parent, []).append(unique_id)
+
+    def lineage(self, model_name: str, direction: str, depth: int) -> list[str]:
+        """Mirror `dbt ls -s <depth>+<model>` (parent) or `<model>+<depth>` (children)."""
+        if direction == "parent":
+            edges = self.parents
+        elif direction == "children":
+            edges = self.children
+        else:
+            raise ValueError(f"direction must be 'parent' or 'children', got {direction!r}")
+
+        selected: set[str] = set()
+        frontier = deque((unique_id, 0) for unique_id in self.by_name.get(model_name, []))
+        while frontier:
+            unique_id, level = frontier.popleft()
+            if unique_id in selected:
+                continue
+            selected.add(unique_id)
+            if level < depth:
+                frontier.extend((n, level + 1) for n in edges.get(unique_id, []))
+
+        # dbt's default "eager" indirect selection also picks up tests on any selected node
+        for unique_id in list(selected):
+            selected.update(self.tests_by_parent.get(unique_id, []))
+
+        return sorted(self.labels[u] for u in selected if u in self.labels)
+
+
+_index_cache: dict[Path, tuple[tuple, LineageIndex]] = {}
+_index_lock = threading.Lock()
+
+
+def load_lineage_index(manifest_path: Path) -> LineageIndex:
+    """Load (or reuse) the lineage index for a manifest, reloading it when it changes."""
+    version = file_version(manifest_path)
+    if version is None:
+        raise FileNotFoundError(
+            f"dbt manifest not found at {manifest_path}. Run `osler init` to build the project."
+        )
+
+    with _index_lock:
+        cached = _index_cache.get(manifest_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with open(manifest_path, encoding="utf-8") as f:
+            index = LineageIndex(json.load(f))
+        _index_cache[manifest_path] = (version, index)
+        return index
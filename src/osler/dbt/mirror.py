@@ -0,0 +1,82 @@
+import hashlib
+import shutil
+import subprocess
+from pathlib import Path
+
+from osler.config import DEFAULT_CACHE_DIR, logger
+
+# Files that pin a dbt project's package versions; their contents key the package cache
+_PACKAGE_SPEC_FILES = ("packages.yml", "dependencies.yml", "package-lock.yml")
+_PACKAGES_DIR = "dbt_packages"
+
+
+def _git(args: list[str], cwd: Path | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+def git_mirror_path(github_repo: str) -> Path:
+    """Location of the bare mirror for a repository URL."""
+    name = github_repo.rstrip("/").removesuffix(".git").rsplit("/", 1)[-1]
+    digest = hashlib.sha1(github_repo.encode()).hexdigest()[:12]
+    return DEFAULT_CACHE_DIR / "git" / f"{name}-{digest}.git"
+
+
+def ensure_git_mirror(github_repo: str) -> Path:
+    """Create or refresh a bare mirror of `github_repo` and return its path.
+
+    If the mirror exists but can't be updated (e.g. offline), the cached copy is used.
+    """
+    mirror_path = git_mirror_path(github_repo)
+
+    if mirror_path.exists():
+        try:
+            _git(["remote", "update", "--prune"], cwd=mirror_path)
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, "stderr", "") or str(e)
+            logger.warning(f"Could not update git mirror ({stderr.strip()}), using cached copy")
+        return mirror_path
+
+    mirror_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = mirror_path.with_name(mirror_path.name + ".tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    _git(["clone", "--mirror", github_repo, str(tmp_path)])
+    tmp_path.replace(mirror_path)
+    return mirror_path
+
+
+def packages_cache_key(dbt_project_path: Path) -> str | None:
+    """Hash of the project's package spec files, or None if it has no packages."""
+    digest = hashlib.sha256()
+    found = False
+    for name in _PACKAGE_SPEC_FILES:
+        path = Path(dbt_project_path) / name
+        if path.exists():
+            found = True
+            digest.update(name.encode() + b"\0" + path.read_bytes() + b"\0")
+    return digest.hexdigest()[:16] if found else None
+
+
+def restore_dbt_packages(dbt_project_path: Path, key: str) -> bool:
+    """Copy cached packages for `key` into the project. Returns False on a cache miss."""
+    cached = DEFAULT_CACHE_DIR / "dbt_packages" / key
+    if not cached.exists():
+        return False
+
+    target = Path(dbt_project_path) / _PACKAGES_DIR
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(cached, target, symlinks=True)
+    return True
+
+
+def store_dbt_packages(dbt_project_path: Path, key: str) -> None:
+    """Save the project's installed packages in the cache under `key`."""
+    installed = Path(dbt_project_path) / _PACKAGES_DIR
+    if not installed.exists():
+        return
+
+    cached = DEFAULT_CACHE_DIR / "dbt_packages" / key
+    tmp_path = cached.with_name(key + ".tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    shutil.copytree(installed, tmp_path, symlinks=True)
+    shutil.rmtree(cached, ignore_errors=True)
+    tmp_path.replace(cached)
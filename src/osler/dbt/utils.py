@@ -1,25 +1,51 @@
+import os
 import shutil
 import subprocess
+from pathlib import Path
 
 import typer
+import yaml
 
 from osler.config import get_project_root, logger
+from osler.dbt.build_report import BuildLog, render_build_report
+from osler.dbt.lineage import load_lineage_index
+from osler.dbt.mirror import (
+    ensure_git_mirror,
+    packages_cache_key,
+    restore_dbt_packages,
+    store_dbt_packages,
+)
 
 _PROJECT_ROOT = get_project_root()
 _DBT_PROJECT_ROOT = _PROJECT_ROOT / "dbt_projects"
+# Manifests from the last successful build, kept outside the project's target/
+# directory (which dbt overwrites) for `state:modified+` comparisons
+_DBT_STATE_ROOT = _DBT_PROJECT_ROOT / ".state"
+# profiles.yml with the `osler init` build options applied
+_DBT_PROFILES_DIR = _DBT_PROJECT_ROOT / ".profiles"
+
+
+def _mirror(github_repo: str) -> Path:
+    try:
+        return ensure_git_mirror(github_repo)
+    except (OSError, subprocess.CalledProcessError) as e:
+        typer.echo(f"❌ git mirror of {github_repo} failed: {getattr(e, 'stderr', '') or e}")
+        raise typer.Exit(1)
 
 
 def clone_dbt_project(github_repo: str, dbt_project_name: str) -> str:
-    """Clones DBT project into _DBT_PROJECT_ROOT"""
+    """Clones DBT project into _DBT_PROJECT_ROOT from the local git mirror"""
 
     dbt_project_path = _DBT_PROJECT_ROOT / dbt_project_name
 
     if dbt_project_path.exists():
         shutil.rmtree(dbt_project_path)
 
+    mirror_path = _mirror(github_repo)
     try:
+        # Cloning from a local mirror hardlinks objects instead of downloading them
         subprocess.run(
-            ["git", "clone", github_repo, dbt_project_name], cwd=_DBT_PROJECT_ROOT, check=True
+            ["git", "clone", str(mirror_path), dbt_project_name], cwd=_DBT_PROJECT_ROOT, check=True
         )
     except subprocess.CalledProcessError as e:
         typer.echo(f"❌ git clone failed with exit code {e.returncode}")
@@ -28,53 +54,166 @@ def clone_dbt_project(github_repo: str, dbt_project_name: str) -> str:
     return dbt_project_path
 
 
-def run_dbt_command(cmd: list[str], cwd: str, dataset_name: str) -> None:
-    """Run a dbt command and handle errors."""
+def update_dbt_project(github_repo: str, dbt_project_name: str) -> Path:
+    """Fast-forward an existing clone of the DBT project, cloning it if needed."""
+    dbt_project_path = _DBT_PROJECT_ROOT / dbt_project_name
+
+    if (dbt_project_path / ".git").exists():
+        mirror_path = _mirror(github_repo)
+        try:
+            # Older clones point at the upstream URL; pull from the mirror instead
+            for args in (["remote", "set-url", "origin", str(mirror_path)], ["pull", "--ff-only"]):
+                subprocess.run(
+                    ["git", *args],
+                    cwd=dbt_project_path,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+            return dbt_project_path
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"git pull failed ({e.stderr.strip()}), re-cloning {dbt_project_name}")
+
+    return clone_dbt_project(github_repo, dbt_project_name)
+
+
+def dbt_state_path(dataset_name: str) -> Path | None:
+    """State directory holding the manifest of the last published build, if any."""
+    state_path = _DBT_STATE_ROOT / dataset_name
+    return state_path if (state_path / "manifest.json").exists() else None
+
+
+def save_dbt_state(dbt_project_name: str, dataset_name: str) -> Path | None:
+    """Keep the manifest of a build that was just published for the next incremental build.
+
+    Only call this after a successful build: dbt rewrites target/manifest.json while
+    parsing, even when the build then fails, and comparing against the manifest of a
+    failed build would leave its models out of `state:modified+`.
+    Returns None if the project has no manifest.
+    """
+    manifest_path = _DBT_PROJECT_ROOT / dbt_project_name / "target" / "manifest.json"
+    if not manifest_path.exists():
+        return None
+
+    state_path = _DBT_STATE_ROOT / dataset_name
+    state_path.mkdir(parents=True, exist_ok=True)
+    tmp_path = state_path / "manifest.json.tmp"
+    shutil.copy2(manifest_path, tmp_path)
+    os.replace(tmp_path, state_path / "manifest.json")
+    return state_path
+
+
+def install_dbt_packages(dbt_project_path: Path, dataset_name: str) -> None:
+    """Run `dbt deps`, reusing cached packages when the package spec is unchanged."""
+    key = packages_cache_key(dbt_project_path)
+    if key is not None and restore_dbt_packages(dbt_project_path, key):
+        logger.info("✅ dbt packages restored from cache")
+        return
+
+    run_dbt_command(["dbt", "deps"], dbt_project_path, dataset_name)
+    if key is not None:
+        store_dbt_packages(dbt_project_path, key)
+
+
+def write_dbt_profile(
+    dataset_name: str,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+    duckdb_threads: int | None = None,
+    db_path: Path | None = None,
+) -> Path:
+    """Write a copy of profiles.yml with build settings applied and return its directory.
+
+    `threads` is the number of dbt models built concurrently; `memory_limit` and
+    `duckdb_threads` are passed to DuckDB as connection settings. `db_path`
+    redirects the build into another database file, e.g. a new snapshot.
+    """
+    with open(_DBT_PROJECT_ROOT / "profiles.yml", encoding="utf-8") as f:
+        profiles = yaml.safe_load(f)
+
+    for output in profiles[dataset_name]["outputs"].values():
+        if db_path is not None:
+            output["path"] = str(db_path)
+        if threads is not None:
+            output["threads"] = threads
+        settings = output.setdefault("settings", {})
+        if memory_limit is not None:
+            settings["memory_limit"] = memory_limit
+        if duckdb_threads is not None:
+            settings["threads"] = duckdb_threads
+        if not settings:
+            del output["settings"]
+
+    _DBT_PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_DBT_PROFILES_DIR / "profiles.yml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(profiles, f, sort_keys=False)
+    return _DBT_PROFILES_DIR
+
+
+def run_dbt_command(
+    cmd: list[str], cwd: str, dataset_name: str, profiles_dir: Path | None = None
+) -> BuildLog:
+    """Run a dbt command, streaming its progress, and handle errors.
+
+    dbt's structured JSON logs are parsed as they arrive, so node progress is
+    logged live and only per-node timings and recent errors are kept in memory.
+    After a `dbt build`, the slowest nodes and the critical path are logged.
+    """
+    full_cmd = cmd + [
+        "--profiles-dir",
+        str(profiles_dir) if profiles_dir else "../",
+        "--profile",
+        dataset_name,
+        "--log-format",
+        "json",
+    ]
+    build_log = BuildLog()
     try:
-        add_profiles_specification_to_cmd = cmd + [
-            "--profiles-dir",
-            "../",
-            "--profile",
-            dataset_name,
-        ]
-        result = subprocess.run(
-            add_profiles_specification_to_cmd, capture_output=True, cwd=cwd, check=True, text=True
-        )
-        logger.info(f"✅ dbt {cmd[1:]} completed successfully")
-        return result
-    except subprocess.CalledProcessError as e:
-        logger.info(f"❌ {' '.join(cmd)} failed with exit code {e.returncode}")
-        if e.stderr:
-            logger.error(e.stderr)
-        raise typer.Exit(1)
+        with subprocess.Popen(
+            full_cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as process:
+            for line in process.stdout:
+                progress = build_log.feed(line)
+                if progress:
+                    logger.info(progress)
     except FileNotFoundError:
         logger.info("❌ dbt command not found. Please ensure dbt is installed.")
         raise typer.Exit(1)
 
+    if process.returncode != 0:
+        logger.info(f"❌ {' '.join(cmd)} failed with exit code {process.returncode}")
+        if build_log.errors:
+            logger.error("\n".join(build_log.errors))
+        raise typer.Exit(1)
+
+    logger.info(f"✅ dbt {cmd[1:]} completed successfully")
+    if cmd[1:2] == ["build"] and build_log.nodes:
+        try:
+            parents = load_lineage_index(Path(cwd) / "target" / "manifest.json").parents
+        except FileNotFoundError:
+            parents = None
+        logger.info("dbt build report:\n" + render_build_report(build_log, parents))
+    return build_log
+
+
+def dbt_manifest_path(dataset_name: str = "tuva-project-demo") -> Path:
+    """manifest.json from the dataset's last dbt build; catalog.json sits next to it."""
+    default_manifest = _DBT_PROJECT_ROOT / dataset_name / "target" / "manifest.json"
+    # OSLER_DBT_MANIFEST points lineage at another manifest, e.g. a benchmark fixture
+    return Path(os.getenv("OSLER_DBT_MANIFEST", default_manifest))
+
 
 def get_dbt_model_lineage(table_name, direction, depth):
-    dataset_name = "tuva-project-demo"
-    cwd = _DBT_PROJECT_ROOT / dataset_name
-
-    if direction == "parent":
-        lineage_arg = f"{depth}+{table_name}"
-    elif direction == "children":
-        lineage_arg = f"{table_name}+{depth}"
-
-    cmd = ["dbt", "ls", "-s", lineage_arg]
-
-    result = run_dbt_command(cmd, cwd, dataset_name)
-
-    lines = result.stdout.strip().split("\n")
-    models = [
-        line
-        for line in lines
-        if not line.startswith("0")
-        and "Running with dbt" not in line
-        and "target not specified" not in line
-        and "Registered adapter" not in line
-        and "Found" not in line
-    ]
+    """Return the upstream or downstream models of `table_name` from the dbt manifest."""
+    manifest_path = dbt_manifest_path()
+
+    index = load_lineage_index(manifest_path)
+    models = index.lineage(table_name, direction, depth)
     models_lst = "\n".join(models)
 
     return models_lst
@@ -0,0 +1,53 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when more calls are waiting for a worker than the queue allows."""
+
+
+class BackendExecutor:
+    """Runs blocking backend work on a bounded thread pool, off the event loop.
+
+    At most `max_workers` calls run at once; up to `max_queued` more wait their turn,
+    and anything beyond that is rejected with `ServerBusyError` instead of piling up.
+    DuckDB releases the GIL while executing, so workers scale across cores.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queued: int = 32):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="osler-backend"
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Calls currently running or queued."""
+        return self._pending
+
+    def _done(self, future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, func, *args, **kwargs):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queued:
+                raise ServerBusyError(
+                    f"Server busy: {self._pending} calls already running or queued, "
+                    "try again shortly"
+                )
+            self._pending += 1
+
+        future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        # Counted until the job itself finishes: a cancelled caller stops waiting, but
+        # a job that already started keeps its worker busy until it returns
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
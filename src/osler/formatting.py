@@ -0,0 +1,168 @@
+import csv
+import datetime
+import decimal
+import io
+import json
+import math
+import uuid
+from typing import Any, TypedDict
+
+from osler.database.base import QueryResult
+
+OUTPUT_FORMATS = ("csv", "tsv", "markdown", "json", "table")
+
+
+class ColumnSchema(TypedDict):
+    name: str
+    type: str
+
+
+class QueryOutput(TypedDict):
+    """Structured content returned by the execute_query tool."""
+
+    result: str
+    columns: list[ColumnSchema]
+    rows: list[list[Any]]
+    row_count: int
+    offset: int
+    has_more: bool
+    continuation_token: str | None
+    error: bool
+
+
+# -------------------------------------------------------
+# Value conversion
+# -------------------------------------------------------
+def to_json_value(value: Any) -> Any:
+    """Convert a DuckDB Python value into something JSON can represent."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is None or isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, bytes | bytearray):
+        return value.hex()
+    if isinstance(value, dict):
+        return {str(k): to_json_value(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_json_value(v) for v in value]
+    return str(value)
+
+
+def _text(value: Any, null: str) -> str:
+    if value is None:
+        return null
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    return str(value)
+
+
+# -------------------------------------------------------
+# Renderers
+# -------------------------------------------------------
+def _render_delimited(result: QueryResult, delimiter: str) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(result.columns)
+    writer.writerows([_text(v, "") for v in row] for row in result.rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _render_markdown(result: QueryResult) -> str:
+    def cell(value: Any) -> str:
+        return _text(value, "NULL").replace("|", "\\|").replace("\n", " ")
+
+    lines = [
+        "| " + " | ".join(cell(c) for c in result.columns) + " |",
+        "|" + "---|" * len(result.columns),
+    ]
+    lines.extend("| " + " | ".join(cell(v) for v in row) + " |" for row in result.rows)
+    return "\n".join(lines)
+
+
+def _render_json(result: QueryResult) -> str:
+    records = [
+        dict(zip(result.columns, (to_json_value(v) for v in row), strict=False))
+        for row in result.rows
+    ]
+    return json.dumps(records, separators=(",", ":"), ensure_ascii=False)
+
+
+def _render_table(result: QueryResult) -> str:
+    cells = [[_text(v, "NULL") for v in row] for row in result.rows]
+    widths = [len(c) for c in result.columns]
+    for row in cells:
+        for i, value in enumerate(row):
+            widths[i] = max(widths[i], len(value))
+
+    lines = [" ".join(c.rjust(w) for c, w in zip(result.columns, widths, strict=False))]
+    lines.extend(" ".join(v.rjust(w) for v, w in zip(row, widths, strict=False)) for row in cells)
+    return "\n".join(lines)
+
+
+_RENDERERS = {
+    "csv": lambda result: _render_delimited(result, ","),
+    "tsv": lambda result: _render_delimited(result, "\t"),
+    "markdown": _render_markdown,
+    "json": _render_json,
+    "table": _render_table,
+}
+
+
+def render_result(result: QueryResult, output_format: str = "csv") -> str:
+    """Render a page of results as text in one of OUTPUT_FORMATS."""
+    renderer = _RENDERERS.get(output_format)
+    if renderer is None:
+        raise ValueError(
+            f"Unsupported output format: {output_format}. Use one of {', '.join(OUTPUT_FORMATS)}"
+        )
+
+    if not result.rows:
+        return "No results found"
+
+    text = renderer(result)
+    if result.has_more:
+        start, end = result.offset + 1, result.offset + len(result.rows)
+        text += (
+            f"\n... (showing rows {start}-{end}, more rows available; "
+            f"pass continuation_token='{result.continuation_token}' to fetch the next page)"
+        )
+    return text
+
+
+def to_query_output(result: QueryResult, output_format: str = "csv") -> QueryOutput:
+    """Build the execute_query structured content: rendered text plus typed rows."""
+    types = result.column_types or [""] * len(result.columns)
+    return QueryOutput(
+        result=render_result(result, output_format),
+        columns=[ColumnSchema(name=n, type=t) for n, t in zip(result.columns, types, strict=False)],
+        rows=[[to_json_value(v) for v in row] for row in result.rows],
+        row_count=len(result.rows),
+        offset=result.offset,
+        has_more=result.has_more,
+        continuation_token=result.continuation_token,
+        error=False,
+    )
+
+
+def error_output(message: str) -> QueryOutput:
+    """Wrap an error message in the execute_query structured content shape."""
+    return QueryOutput(
+        result=message,
+        columns=[],
+        rows=[],
+        row_count=0,
+        offset=0,
+        has_more=False,
+        continuation_token=None,
+        error=True,
+    )
@@ -1,28 +1,162 @@
 import os
+import threading
+import time
 from pathlib import Path
 
-import sqlparse
 from mcp.server.fastmcp import FastMCP
-
-from osler.database.duckdb_client import DuckDB
-from osler.dbt.utils import get_dbt_model_lineage
+from mcp.types import TextContent
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from osler.config import get_project_root, logger, setup_logging
+from osler.database.base import Database, QueryResult, QueryTimeoutError
+from osler.executor import BackendExecutor
+from osler.formatting import (
+    OUTPUT_FORMATS,
+    QueryOutput,
+    error_output,
+    render_result,
+    to_query_output,
+)
+from osler.metrics import Metrics
+from osler.query_stats import SLOW_COLUMNS, STAT_COLUMNS, QueryStats
+
+# Hosts start the server on demand, so the time to answer `initialize` matters. DuckDB,
+# sqlparse and the dbt helpers are imported on first use, and the backend is only
+# created by the first tool call (or by the warm-up thread, see main()).
 
 # ---------------------------------------------------------
-# Initialize backend
+# Backend
 # ---------------------------------------------------------
 _backend_name = os.getenv("OSLER_BACKEND", "duckdb")
+if _backend_name != "duckdb":
+    raise ValueError(f"Unsupported backend: {_backend_name}")
+
+_pool_size = int(os.getenv("OSLER_POOL_SIZE", "4"))
+_backend: Database | None = None
+_backend_lock = threading.Lock()
+
+
+def _create_backend() -> Database:
+    from osler.database.duckdb_client import DuckDB
 
-if _backend_name == "duckdb":
     ROOT = Path(__file__).resolve().parents[2]  # repo root
     DEFAULT_DB = ROOT / "osler_data/databases/tuva_project_demo.duckdb"
 
     _db_path = Path(os.getenv("OSLER_DB_PATH", DEFAULT_DB))
+    # Result cache budget in MB, set to 0 to disable caching
+    _cache_mb = int(os.getenv("OSLER_RESULT_CACHE_MB", "64"))
+    # Default per-query deadline in seconds, set to 0 to disable
+    _query_timeout = float(os.getenv("OSLER_QUERY_TIMEOUT", "60"))
+
+    backend = DuckDB(
+        _db_path,
+        pool_size=_pool_size,
+        cache_bytes=_cache_mb * 1024 * 1024,
+        query_timeout=_query_timeout or None,
+    )
+    metrics.instrument(
+        backend,
+        (
+            "execute_query",
+            "fetch_more",
+            "profile_query",
+            "get_schema",
+            "get_table_info",
+            "get_table_profile",
+        ),
+    )
+    return backend
+
+
+def get_backend() -> Database:
+    """Return the backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _create_backend()
+    return _backend
+
+
+def _backend_call(method: str, *args, **kwargs):
+    # Runs on the executor, so creating the backend never blocks the event loop
+    return getattr(get_backend(), method)(*args, **kwargs)
+
+
+# Backend work runs on a bounded thread pool so slow queries don't block the server.
+# By default there is one worker per pooled connection.
+executor = BackendExecutor(
+    max_workers=int(os.getenv("OSLER_MAX_WORKERS", str(_pool_size))),
+    max_queued=int(os.getenv("OSLER_MAX_QUEUED", "32")),
+)
+
+# How tabular results are rendered as text, see osler.formatting.OUTPUT_FORMATS
+DEFAULT_OUTPUT_FORMAT = os.getenv("OSLER_OUTPUT_FORMAT", "csv")
+
+
+class OslerMCP(FastMCP):
+    """FastMCP that sends a query tool's rendered `result` as its only text content.
+
+    FastMCP would otherwise also serialize the whole structured content, every row
+    included, into the text block, so the model would read each result twice.
+    """
 
-    backend = DuckDB(_db_path)
-else:
-    raise ValueError(f"Unsupported backend: {_backend_name}")
+    text_result_tools = frozenset({"execute_query"})
 
-mcp = FastMCP("osler")
+    async def call_tool(self, name: str, arguments: dict):
+        result = await super().call_tool(name, arguments)
+        if name in self.text_result_tools and isinstance(result, tuple):
+            _, structured = result
+            return [TextContent(type="text", text=structured["result"])], structured
+        return result
+
+
+mcp = OslerMCP("osler")
+
+# ---------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------
+# Per-tool, per-phase and per-backend-method latency histograms. Set OSLER_METRICS=0
+# to turn instrumentation off entirely.
+metrics = Metrics(enabled=os.getenv("OSLER_METRICS", "1") != "0")
+
+
+def _backend_gauges() -> dict[str, float]:
+    gauges = {"executor_pending": executor.pending}
+    # Scraping metrics shouldn't be what creates the backend
+    backend = _backend
+    if backend is None:
+        return gauges
+    gauges["interrupted_queries_total"] = backend.interrupted_queries
+    cache = getattr(backend, "result_cache", None)
+    if cache is not None:
+        stats = cache.stats()
+        gauges.update(
+            {
+                "result_cache_hits_total": stats["hits"],
+                "result_cache_misses_total": stats["misses"],
+                "result_cache_evictions_total": stats["evictions"],
+                "result_cache_entries": stats["entries"],
+                "result_cache_bytes": stats["bytes"],
+            }
+        )
+    return gauges
+
+
+metrics.add_collector(_backend_gauges)
+
+# Optionally mirror the metrics to a Prometheus text file (e.g. for node_exporter)
+if _metrics_file := os.getenv("OSLER_METRICS_FILE"):
+    metrics.start_file_export(_metrics_file, float(os.getenv("OSLER_METRICS_INTERVAL", "15")))
+
+# Per-fingerprint execute_query statistics and slow-query log. Set OSLER_QUERY_STATS=0
+# to disable; queries slower than OSLER_SLOW_QUERY_MS are kept in the slow log.
+query_stats = QueryStats(
+    enabled=os.getenv("OSLER_QUERY_STATS", "1") != "0",
+    slow_query_ms=float(os.getenv("OSLER_SLOW_QUERY_MS", "1000")),
+)
+QUERY_STATS_DIR = get_project_root() / "osler_data" / "query_stats"
 
 # ---------------------------------------------------------
 # Security validation
@@ -31,97 +165,9 @@ mcp = FastMCP("osler")
 
 def _is_safe_query(sql_query: str, internal_tool: bool = False) -> tuple[bool, str]:
     """Secure SQL validation - blocks injection attacks, allows legitimate queries."""
-    try:
-        if not sql_query or not sql_query.strip():
-            return False, "Empty query"
-
-        # Parse SQL to validate structure
-        parsed = sqlparse.parse(sql_query.strip())
-        if not parsed:
-            return False, "Invalid SQL syntax"
-
-        # Block multiple statements (main injection vector)
-        if len(parsed) > 1:
-            return False, "Multiple statements not allowed"
-
-        statement = parsed[0]
-        statement_type = statement.get_type()
-
-        # Allow SELECT and PRAGMA (PRAGMA is needed for schema exploration)
-        if statement_type not in ("SELECT"):
-            return False, "Only SELECT queries allowed"
-
-        sql_upper = sql_query.strip().upper()
-
-        # For SELECT statements, block dangerous injection patterns
-        if statement_type == "SELECT":
-            # Block dangerous write operations within SELECT
-            dangerous_keywords = {
-                "INSERT",
-                "UPDATE",
-                "DELETE",
-                "DROP",
-                "CREATE",
-                "ALTER",
-                "TRUNCATE",
-                "REPLACE",
-                "MERGE",
-                "EXEC",
-                "EXECUTE",
-            }
-
-            for keyword in dangerous_keywords:
-                if f" {keyword} " in f" {sql_upper} ":
-                    return False, f"Write operation not allowed: {keyword}"
-
-            # Block common injection patterns that are rarely used in legitimate analytics
-            injection_patterns = [
-                # Classic SQL injection patterns
-                ("1=1", "Classic injection pattern"),
-                ("OR 1=1", "Boolean injection pattern"),
-                ("AND 1=1", "Boolean injection pattern"),
-                ("OR '1'='1'", "String injection pattern"),
-                ("AND '1'='1'", "String injection pattern"),
-                ("WAITFOR", "Time-based injection"),
-                ("SLEEP(", "Time-based injection"),
-                ("BENCHMARK(", "Time-based injection"),
-                ("LOAD_FILE(", "File access injection"),
-                ("INTO OUTFILE", "File write injection"),
-                ("INTO DUMPFILE", "File write injection"),
-            ]
-
-            for pattern, description in injection_patterns:
-                if pattern in sql_upper:
-                    return False, f"Injection pattern detected: {description}"
-
-            # Context-aware protection: Block suspicious table/column names not in medical databases
-            suspicious_names = [
-                "PASSWORD",
-                "ADMIN",
-                "USER",
-                "LOGIN",
-                "AUTH",
-                "TOKEN",
-                "CREDENTIAL",
-                "SECRET",
-                "KEY",
-                "HASH",
-                "SALT",
-                "SESSION",
-                "COOKIE",
-            ]
-
-            for name in suspicious_names:
-                if name in sql_upper:
-                    return (
-                        False,
-                        f"Suspicious identifier detected: {name} (not medical data)",
-                    )
-
-        return True, "Safe"
+    from osler.validation import is_safe_query
 
-    except Exception as e:
-        return False, f"Validation error: {e}"
+    return is_safe_query(sql_query)
 
 
 # ==========================================
@@ -132,13 +178,66 @@ def _is_safe_query(sql_query: str, internal_tool: bool = False) -> tuple[bool, s
 # from calling other MCP tools, which violates the MCP protocol.
 
 
-def _execute_query_internal(sql_query: str) -> str:
+def _timeout_error(e: QueryTimeoutError) -> str:
+    return f"""❌ **Query Timed Out:** {e}
+
+⏱️ **Limit:** {e.timeout:g} seconds
+
+💡 **How to fix this:**
+   - Filter early with `WHERE` and aggregate before joining large tables
+   - Check your join keys - a missing join condition creates a cross join
+   - Use `profile_query` on a smaller version of the query to find the slow step
+   - `timeout_seconds` can only lower the server limit, not raise it"""
+
+
+def _invalid_timeout(timeout: float | None) -> str | None:
+    if timeout is not None and timeout <= 0:
+        return f"❌ **Invalid timeout_seconds:** {timeout:g}\n\n💡 **Tip:** Use a positive number of seconds, or leave it out to use the server limit."
+    return None
+
+
+def _execute_query_internal(
+    sql_query: str,
+    continuation_token: str | None = None,
+    timeout: float | None = None,
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+) -> QueryOutput:
     """Internal query execution function that handles backend routing."""
+    if output_format not in OUTPUT_FORMATS:
+        return error_output(
+            f"❌ **Invalid output_format:** {output_format}\n\n💡 **Tip:** Use one of {', '.join(OUTPUT_FORMATS)}."
+        )
+
+    if timeout_message := _invalid_timeout(timeout):
+        return error_output(timeout_message)
+
+    if continuation_token:
+        try:
+            start = time.perf_counter()
+            with metrics.timer("phase", "execute"):
+                result = get_backend().fetch_more(continuation_token, timeout=timeout)
+            query_stats.record_page(
+                continuation_token,
+                time.perf_counter() - start,
+                len(result.rows),
+                result.continuation_token,
+            )
+            with metrics.timer("phase", "render"):
+                return to_query_output(result, output_format)
+        except KeyError as e:
+            return error_output(
+                f"❌ **Pagination Error:** {e.args[0]}\n\n💡 **Tip:** Re-run the query to get a fresh continuation token."
+            )
+        except QueryTimeoutError as e:
+            return error_output(_timeout_error(e))
+
     # Security check
-    is_safe, message = _is_safe_query(sql_query)
+    with metrics.timer("phase", "validate"):
+        is_safe, message = _is_safe_query(sql_query)
     if not is_safe:
+        metrics.increment("validator_rejections")
         if "describe" in sql_query.lower() or "show" in sql_query.lower():
-            return f"""❌ **Security Error:** {message}
+            return error_output(f"""❌ **Security Error:** {message}
 
         🔍 **For table structure:** Use `get_table_info('table_name')` instead of DESCRIBE
         📋 **Why this is better:** Shows columns, types, AND sample data to understand the actual data
@@ -146,18 +245,42 @@ def _execute_query_internal(sql_query: str) -> str:
         💡 **Recommended workflow:**
         1. `get_database_schema()` ← See available tables
         2. `get_table_info('table_name')` ← Explore structure
-        3. `execute_query('SELECT ...')` ← Run your analysis"""
+        3. `execute_query('SELECT ...')` ← Run your analysis""")
 
-        return f"❌ **Security Error:** {message}\n\n💡 **Tip:** Only SELECT statements are allowed for data analysis."
+        return error_output(
+            f"❌ **Security Error:** {message}\n\n💡 **Tip:** Only SELECT statements are allowed for data analysis."
+        )
 
+    start = time.perf_counter()
     try:
-        return backend.execute_query(sql_query)
+        with metrics.timer("phase", "execute"):
+            result = get_backend().execute_query(sql_query, timeout=timeout)
+        query_stats.record(
+            sql_query,
+            time.perf_counter() - start,
+            rows=len(result.rows),
+            continuation_token=result.continuation_token,
+        )
+        with metrics.timer("phase", "render"):
+            return to_query_output(result, output_format)
+    except QueryTimeoutError as e:
+        query_stats.record(sql_query, time.perf_counter() - start, error=True)
+        return error_output(_timeout_error(e))
     except Exception as e:
+        query_stats.record(sql_query, time.perf_counter() - start, error=True)
         error_msg = str(e).lower()
 
         suggestions = []
 
-        if "no such table" in error_msg or "table not found" in error_msg:
+        hint = _did_you_mean(str(e), sql_query)
+        if hint:
+            suggestions.append(f"🎯 **{hint}**")
+
+        if (
+            "no such table" in error_msg
+            or "table not found" in error_msg
+            or ("table with name" in error_msg and "does not exist" in error_msg)
+        ):
             suggestions.append(
                 "🔍 **Table name issue:** Use `get_database_schema()` to see exact table names"
             )
@@ -168,7 +291,12 @@ def _execute_query_internal(sql_query: str) -> str:
                 "💡 **Quick fix:** Check if the table name matches exactly (case-sensitive)"
             )
 
-        if "no such column" in error_msg or "column not found" in error_msg:
+        if (
+            "no such column" in error_msg
+            or "column not found" in error_msg
+            or ("column" in error_msg and "not found" in error_msg)
+            or "does not have a column named" in error_msg
+        ):
             suggestions.append(
                 "🔍 **Column name issue:** Use `get_table_info('table_name')` to see available columns"
             )
@@ -202,7 +330,7 @@ def _execute_query_internal(sql_query: str) -> str:
 
         suggestion_text = "\n".join(f"   {s}" for s in suggestions)
 
-        return f"""❌ **Query Failed:** {e}
+        return error_output(f"""❌ **Query Failed:** {e}
 
 🛠️ **How to fix this:**
 {suggestion_text}
@@ -212,7 +340,86 @@ def _execute_query_internal(sql_query: str) -> str:
 2. `get_table_info('your_table')` ← Check exact column names
 3. Retry your query with correct names
 
-📚 **Current Backend:** {_backend_name} - table names and syntax are backend-specific"""
+📚 **Current Backend:** {_backend_name} - table names and syntax are backend-specific""")
+
+
+def _profile_query_internal(sql_query: str, timeout: float | None = None, top_n: int = 5) -> str:
+    """Run a validated query under the profiler and render the operator breakdown."""
+    is_safe, message = _is_safe_query(sql_query)
+    if not is_safe:
+        metrics.increment("validator_rejections")
+        return f"❌ **Security Error:** {message}\n\n💡 **Tip:** Only SELECT statements can be profiled."
+    if timeout_message := _invalid_timeout(timeout):
+        return timeout_message
+
+    from osler.database.profiling import render_profile
+
+    try:
+        profile = get_backend().profile_query(sql_query, timeout=timeout)
+    except QueryTimeoutError as e:
+        return _timeout_error(e)
+    except Exception as e:
+        return f"❌ **Profiling Failed:** {e}\n\n💡 **Tip:** Make sure the query runs with `execute_query` first."
+    return render_profile(profile, top_n=top_n)
+
+
+def _model_lineage_internal(table_name: str, direction: str, depth: int) -> str:
+    # The dbt helpers pull in typer and yaml, which the other tools don't need
+    from osler.dbt.utils import get_dbt_model_lineage
+
+    return get_dbt_model_lineage(table_name, direction, depth)
+
+
+def _did_you_mean(error: str, sql_query: str) -> str | None:
+    """Closest real table/column names for an unknown identifier in `error`, if any."""
+    from osler.search import did_you_mean, missing_identifier
+
+    if missing_identifier(error) is None:
+        return None
+    try:
+        return did_you_mean(error, get_backend().catalog(), sql_query)
+    except Exception as e:  # a hint must never hide the original error
+        logger.debug(f"No name suggestions: {e}")
+        return None
+
+
+def _search_internal(query: str, limit: int) -> str:
+    from osler.dbt.utils import dbt_manifest_path
+    from osler.search import load_search_index, render_search
+
+    manifest_path = dbt_manifest_path()
+    index = load_search_index(
+        get_backend().catalog(), manifest_path, manifest_path.with_name("catalog.json")
+    )
+    return render_search(query, index.search(query, limit=limit))
+
+
+def _query_stats_internal(order_by: str, limit: int, include_slow_queries: bool) -> str:
+    if not query_stats.enabled:
+        return "Query statistics are disabled (OSLER_QUERY_STATS=0)."
+    try:
+        entries = query_stats.top(limit=limit, order_by=order_by)
+    except ValueError as e:
+        return f"❌ **Invalid order_by:** {e}"
+
+    # The raw example query is left out of the listing to keep it compact
+    columns = STAT_COLUMNS[:7] + ["query"]
+    stats = QueryResult(
+        columns=columns,
+        rows=[row[:7] + (row[9],) for row in query_stats.stat_rows(entries)],
+    )
+    text = f"Query fingerprints by {order_by}:\n{render_result(stats, DEFAULT_OUTPUT_FORMAT)}"
+
+    if include_slow_queries:
+        slow = QueryResult(
+            columns=SLOW_COLUMNS,
+            rows=query_stats.slow_rows(query_stats.slow_queries()),
+        )
+        text += (
+            f"\n\nSlow queries (>= {query_stats.slow_query_ms:g} ms):\n"
+            f"{render_result(slow, DEFAULT_OUTPUT_FORMAT)}"
+        )
+    return text
 
 
 # ==========================================
@@ -223,19 +430,65 @@ def _execute_query_internal(sql_query: str) -> str:
 
 
 @mcp.tool()
-def get_database_schema() -> str:
-    tables = backend.get_schema()
+@metrics.tool
+async def get_database_schema() -> str:
+    tables = await executor.run(_backend_call, "get_schema")
 
     return f"{_backend_name}\n📋 **Available Tables (query-ready names):**\n{'\n'.join(tables)}\n\n💡 **Copy-paste ready:** These table names can be used directly in your SQL queries!"
 
 
 @mcp.tool()
-def get_table_info(table_name: str, show_sample: bool = True) -> str:
-    return backend.get_table_info(table_name, show_sample=show_sample)
+@metrics.tool
+async def search_tables(query: str, limit: int = 10) -> str:
+    """🔎 Find tables by keyword instead of listing the whole schema.
+
+    Matches table names, column names and the dbt model/column descriptions, tolerating
+    partial words and typos, and returns the best tables with their matching columns.
+
+    Args:
+        query: Keywords, e.g. 'readmission' or 'hcc risk score'
+        limit: Maximum number of tables to return
+    """
+    return await executor.run(_search_internal, query, limit)
+
+
+@mcp.tool()
+@metrics.tool
+async def get_table_info(table_name: str, show_sample: bool = True) -> str:
+    return await executor.run(
+        _backend_call,
+        "get_table_info",
+        table_name,
+        show_sample=show_sample,
+        output_format=DEFAULT_OUTPUT_FORMAT,
+    )
+
+
+@mcp.tool()
+@metrics.tool
+async def get_table_profile(table_name: str) -> str:
+    """📊 Column statistics for a table, without scanning it.
+
+    For every column: null rate, approximate distinct count, min, max, average and the
+    most frequent values (for columns that aren't near-unique). Use this instead of
+    exploratory `COUNT(DISTINCT ...)` / `MIN` / `MAX` queries.
+
+    Args:
+        table_name: Table to describe, e.g. 'core.patient'
+    """
+    return await executor.run(
+        _backend_call, "get_table_profile", table_name, output_format=DEFAULT_OUTPUT_FORMAT
+    )
 
 
 @mcp.tool()
-def execute_query(sql_query: str) -> str:
+@metrics.tool
+async def execute_query(
+    sql_query: str = "",
+    continuation_token: str | None = None,
+    timeout_seconds: float | None = None,
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+) -> QueryOutput:
     """🚀 Execute SQL queries to analyze data.
 
     **💡 Pro tip:** For best results, explore the database structure first!
@@ -249,17 +502,28 @@ def execute_query(sql_query: str) -> str:
     - Column names may be unexpected (e.g., age might be 'anchor_age')
     - Sample data shows actual formats and constraints
 
+    **Large results:** Only the first 50 rows are returned. If more rows are available,
+    the response includes a `continuation_token`; call `execute_query` again with just
+    that token to fetch the next page without re-running the query.
+
     Args:
         sql_query: Your SQL SELECT query (must be SELECT only)
+        continuation_token: Token from a previous page of results to fetch the next page
+        timeout_seconds: Optional shorter time limit for this query (capped at the server limit)
+        output_format: How rows are rendered in `result`: 'csv' (default), 'tsv',
+            'markdown', 'json' or 'table'. Typed `columns` and `rows` are always included.
 
     Returns:
         Query results or helpful error messages with next steps
     """
-    return _execute_query_internal(sql_query)
+    return await executor.run(
+        _execute_query_internal, sql_query, continuation_token, timeout_seconds, output_format
+    )
 
 
 @mcp.tool()
-def get_model_lineage(table_name: str, direction: str, depth: int) -> str:
+@metrics.tool
+async def get_model_lineage(table_name: str, direction: str, depth: int) -> str:
     """🔍 Explore dbt model lineage to understand data transformations.
 
     **What it does:**
@@ -284,12 +548,104 @@ def get_model_lineage(table_name: str, direction: str, depth: int) -> str:
     Returns:
         Newline-separated list of related dbt models in the dependency chain
     """
-    lineage = get_dbt_model_lineage(table_name, direction, depth)
+    lineage = await executor.run(_model_lineage_internal, table_name, direction, depth)
     return lineage
 
 
+@mcp.tool()
+@metrics.tool
+async def profile_query(
+    sql_query: str, timeout_seconds: float | None = None, top_n: int = 5
+) -> str:
+    """⏱️ Profile a slow SELECT query to see where the time goes.
+
+    **What it does:**
+    Runs the query to completion under DuckDB's profiler (EXPLAIN ANALYZE) and returns
+    the operator tree with per-operator time and row counts, the hottest operators, and
+    operators whose row estimates were far off.
+
+    **💡 Use cases:**
+    - Find the join or aggregation that dominates a slow query
+    - Spot joins that explode row counts (missing or wrong join keys)
+    - Check that filters are applied in the scans on large `core` tables
+
+    Args:
+        sql_query: The SQL SELECT query to profile (it is executed in full)
+        timeout_seconds: Optional shorter time limit (capped at the server limit)
+        top_n: How many of the most expensive operators to list
+
+    Returns:
+        A compact profile: total time, hottest operators, misestimates and operator tree
+    """
+    return await executor.run(_profile_query_internal, sql_query, timeout_seconds, top_n)
+
+
+@mcp.tool()
+@metrics.tool
+async def get_query_stats(
+    order_by: str = "total_ms", limit: int = 10, include_slow_queries: bool = True
+) -> str:
+    """📈 Show which query shapes run most often or take the most time.
+
+    Queries are grouped by fingerprint (literals replaced with `?`), with call count,
+    error count, rows returned and total/mean/max time per shape, plus a log of the
+    slowest individual executions.
+
+    Args:
+        order_by: One of 'total_ms' (default), 'mean_ms', 'max_ms', 'calls', 'errors', 'rows'
+        limit: Number of fingerprints to list
+        include_slow_queries: Also list the slow-query log
+
+    Returns:
+        Fingerprint statistics and slow queries
+    """
+    return await executor.run(_query_stats_internal, order_by, limit, include_slow_queries)
+
+
+@mcp.tool()
+@metrics.tool
+async def export_query_stats() -> str:
+    """💾 Export query fingerprint statistics and the slow-query log to Parquet files.
+
+    Returns:
+        Paths of the written Parquet files
+    """
+    stats_path, slow_path = await executor.run(query_stats.export_parquet, QUERY_STATS_DIR)
+    return f"Query statistics written to:\n{stats_path}\n{slow_path}"
+
+
+# ==========================================
+# MCP RESOURCES
+# ==========================================
+
+
+@mcp.resource("osler://metrics", mime_type="application/json")
+def get_metrics() -> str:
+    """Call counts, error counts and latency histograms per tool, phase and backend method."""
+    return metrics.to_json()
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint, served when running over an HTTP transport."""
+    return PlainTextResponse(metrics.to_prometheus(), media_type="text/plain; version=0.0.4")
+
+
+def _warm_up() -> None:
+    try:
+        get_backend().get_schema()  # opens a pooled connection and loads the catalog
+        _is_safe_query("SELECT 1")
+    except Exception as e:
+        logger.warning(f"Backend warm-up failed: {e}")
+
+
 def main():
     """Main entry point for MCP server."""
+    setup_logging()
+    # OSLER_WARMUP=1 prepares the backend in the background while the host connects,
+    # so the first tool call doesn't pay for it
+    if os.getenv("OSLER_WARMUP", "0") != "0":
+        threading.Thread(target=_warm_up, name="osler-warmup", daemon=True).start()
     # Run the FastMCP server
     mcp.run()
 
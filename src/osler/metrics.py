@@ -0,0 +1,252 @@
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
+
+from osler.config import logger
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# kind -> (Prometheus metric prefix, label name, help text)
+_FAMILIES = {
+    "tool": ("osler_tool", "tool", "MCP tool calls"),
+    "phase": ("osler_phase", "phase", "execute_query phases (validate, execute, render)"),
+    "backend": ("osler_backend", "method", "Database backend method calls"),
+}
+
+_DISABLED_TIMER = nullcontext()
+
+
+class _Series:
+    """Call count, error count and latency histogram for one tool/phase/method."""
+
+    __slots__ = ("buckets", "count", "errors", "total")
+
+    def __init__(self, n_buckets: int):
+        self.buckets = [0] * (n_buckets + 1)  # last slot is +Inf
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+
+
+class _Timer:
+    __slots__ = ("error", "kind", "metrics", "name", "start")
+
+    def __init__(self, metrics: "Metrics", kind: str, name: str):
+        self.metrics = metrics
+        self.kind = kind
+        self.name = name
+        self.error = False
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.metrics.observe(self.kind, self.name, elapsed, self.error or exc_type is not None)
+
+
+class Metrics:
+    """In-process call counts, error counts and latency histograms.
+
+    Series are grouped by kind: "tool" (MCP tools), "phase" (steps of execute_query)
+    and "backend" (Database methods). When disabled, timers and decorators are no-ops.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._counters: dict[str, int] = {}
+        self._collectors: list[Callable[[], dict[str, float]]] = []
+        self._exporter: threading.Thread | None = None
+
+    # -------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------
+    def observe(self, kind: str, name: str, seconds: float, error: bool = False) -> None:
+        if not self.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = self._series[(kind, name)] = _Series(len(self.buckets))
+            series.buckets[index] += 1
+            series.count += 1
+            series.errors += error
+            series.total += seconds
+
+    def timer(self, kind: str, name: str):
+        """Context manager timing a block; set `.error = True` on it to count a soft error."""
+        if not self.enabled:
+            return _DISABLED_TIMER
+        return _Timer(self, kind, name)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def add_collector(self, collector: Callable[[], dict[str, float]]) -> None:
+        """Register a callable whose {name: value} gauges are read at export time.
+
+        Names ending in `_total` are monotonic counts kept elsewhere (e.g. cache hits)
+        and are exported as Prometheus counters.
+        """
+        self._collectors.append(collector)
+
+    def tool(self, func):
+        """Decorate an async MCP tool. Results with a truthy "error" key count as errors."""
+        if not self.enabled:
+            return func
+
+        name = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = True
+            try:
+                result = await func(*args, **kwargs)
+                error = isinstance(result, dict) and bool(result.get("error"))
+                return result
+            finally:
+                self.observe("tool", name, time.perf_counter() - start, error)
+
+        return wrapper
+
+    def instrument(self, obj, methods: tuple[str, ...], kind: str = "backend") -> None:
+        """Time calls to the given methods of `obj` (e.g. a Database backend)."""
+        if not self.enabled:
+            return
+
+        for method_name in methods:
+            method = getattr(obj, method_name)
+
+            @functools.wraps(method)
+            def wrapper(*args, _method=method, _name=method_name, **kwargs):
+                with _Timer(self, kind, _name):
+                    return _method(*args, **kwargs)
+
+            setattr(obj, method_name, wrapper)
+
+    # -------------------------------------------------------
+    # Export
+    # -------------------------------------------------------
+    def _copy(self) -> tuple[dict[tuple[str, str], tuple[int, int, float, list[int]]], dict]:
+        with self._lock:
+            series = {
+                key: (s.count, s.errors, s.total, list(s.buckets))
+                for key, s in self._series.items()
+            }
+            return series, dict(self._counters)
+
+    def _percentile_ms(self, buckets: list[int], count: int, pct: float) -> float | None:
+        """Upper bound of the bucket holding the pct-th percentile, or None if unbounded."""
+        rank = pct / 100 * count
+        seen = 0
+        for bound, n in zip(self.buckets, buckets, strict=False):
+            seen += n
+            if seen >= rank:
+                return bound * 1000
+        return None
+
+    def gauges(self) -> dict[str, float]:
+        values: dict[str, float] = {}
+        for collector in self._collectors:
+            values.update(collector())
+        return values
+
+    def snapshot(self) -> dict:
+        """JSON-friendly summary of every series, counter and gauge."""
+        series, counters = self._copy()
+
+        summary: dict = {"enabled": self.enabled, **{kind: {} for kind in _FAMILIES}}
+        for (kind, name), (count, errors, total, buckets) in sorted(series.items()):
+            summary.setdefault(kind, {})[name] = {
+                "count": count,
+                "errors": errors,
+                "total_ms": round(total * 1000, 3),
+                "mean_ms": round(total / count * 1000, 3),
+                # Estimated from the histogram buckets (upper bounds)
+                "p50_ms": self._percentile_ms(buckets, count, 50),
+                "p95_ms": self._percentile_ms(buckets, count, 95),
+                "p99_ms": self._percentile_ms(buckets, count, 99),
+            }
+        summary["counters"] = counters
+        summary["gauges"] = self.gauges()
+        return summary
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        series, counters = self._copy()
+
+        lines = []
+        for kind, (prefix, label, help_text) in _FAMILIES.items():
+            rows = sorted((name, v) for (k, name), v in series.items() if k == kind)
+            if not rows:
+                continue
+
+            lines.append(f"# HELP {prefix}_duration_seconds Latency of {help_text}.")
+            lines.append(f"# TYPE {prefix}_duration_seconds histogram")
+            for name, (count, _, total, buckets) in rows:
+                cumulative = 0
+                for bound, n in zip((*self.buckets, "+Inf"), buckets, strict=False):
+                    cumulative += n
+                    lines.append(
+                        f'{prefix}_duration_seconds_bucket{{{label}="{name}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'{prefix}_duration_seconds_sum{{{label}="{name}"}} {total}')
+                lines.append(f'{prefix}_duration_seconds_count{{{label}="{name}"}} {count}')
+
+            lines.append(f"# HELP {prefix}_errors_total Failed {help_text}.")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for name, (_, errors, _, _) in rows:
+                lines.append(f'{prefix}_errors_total{{{label}="{name}"}} {errors}')
+
+        for name, value in sorted(counters.items()):
+            lines.append(f"# TYPE osler_{name}_total counter")
+            lines.append(f"osler_{name}_total {value}")
+
+        for name, value in sorted(self.gauges().items()):
+            metric_type = "counter" if name.endswith("_total") else "gauge"
+            lines.append(f"# TYPE osler_{name} {metric_type}")
+            lines.append(f"osler_{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically write the Prometheus text to `path` (node_exporter textfile style)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def start_file_export(self, path: str, interval: float = 15.0) -> None:
+        """Rewrite the Prometheus text file every `interval` seconds from a daemon thread."""
+        if not self.enabled or self._exporter is not None:
+            return
+
+        def loop():
+            while True:
+                time.sleep(interval)
+                # A failed write (full disk, a collector raising) must not stop the export
+                try:
+                    self.write_prometheus(path)
+                except Exception as e:
+                    logger.warning(f"Could not write metrics to {path}: {e}")
+
+        self._exporter = threading.Thread(target=loop, name="osler-metrics-export", daemon=True)
+        self._exporter.start()
@@ -0,0 +1,288 @@
+import hashlib
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+# Longest query text kept as an example / in the slow-query log
+_MAX_SQL_CHARS = 2000
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_sql(sql_query: str) -> tuple[str, str]:
+    """Return `(fingerprint_id, normalized_text)` for a query.
+
+    Builds on the result cache's normalization (comments and whitespace dropped,
+    keywords/identifiers lowercased); in addition every literal and placeholder
+    becomes `?`. Literal lists inside `IN (...)` and `VALUES (...)` collapse to one,
+    as do repeated VALUES rows, so `IN (1, 2, 3)` and `IN (4)` share a fingerprint
+    while `SELECT 1, 2` and `SELECT 1` do not.
+    """
+    from sqlparse import tokens as T
+
+    from osler.database.cache import normalized_tokens
+
+    parts: list[str] = []
+    # One entry per open parenthesis: [is a literal list, is a VALUES row, start index].
+    # IN (...) and VALUES (...) hold a literal list until anything but `?` or `,` shows up
+    open_parens: list[list] = []
+    last_row: tuple[int, int] | None = None  # (start, end) of the last VALUES row
+    for ttype, value in normalized_tokens(sql_query):
+        if ttype in T.Punctuation and value == "(":
+            previous = parts[-1] if parts else None
+            is_row = previous == "values" or (
+                previous == "," and last_row is not None and last_row[1] == len(parts) - 1
+            )
+            open_parens.append([is_row or previous == "in", is_row, len(parts)])
+        elif ttype in T.Punctuation and value == ")" and open_parens:
+            _, is_row, start = open_parens.pop()
+            parts.append(value)
+            if is_row:
+                # `(?) , (?)` -> `(?)`
+                previous_row = last_row is not None and last_row[1] == start - 1
+                if previous_row and parts[last_row[0] : start - 1] == parts[start:]:
+                    del parts[start - 1 :]
+                    last_row = (last_row[0], len(parts))
+                else:
+                    last_row = (start, len(parts))
+            continue
+        elif (ttype in T.Literal and ttype not in T.String.Symbol) or ttype in T.Name.Placeholder:
+            value = "?"
+            # `? , ?` -> `?`
+            if open_parens and open_parens[-1][0] and parts[-2:] == ["?", ","]:
+                parts.pop()
+                continue
+        elif open_parens and value != ",":
+            open_parens[-1][0] = False
+        parts.append(value)
+
+    normalized = " ".join(parts)
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16], normalized
+
+
+@dataclass
+class FingerprintStats:
+    fingerprint: str
+    query: str  # normalized text
+    example: str  # first raw query seen with this shape
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    first_seen: datetime = field(default_factory=datetime.now)
+    last_seen: datetime = field(default_factory=datetime.now)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass
+class SlowQuery:
+    duration_ms: float
+    timestamp: datetime
+    fingerprint: str
+    sql: str
+    rows: int
+    error: bool
+
+
+STAT_COLUMNS = [
+    "fingerprint",
+    "calls",
+    "errors",
+    "rows",
+    "total_ms",
+    "mean_ms",
+    "max_ms",
+    "first_seen",
+    "last_seen",
+    "query",
+    "example",
+]
+SLOW_COLUMNS = ["duration_ms", "timestamp", "fingerprint", "rows", "error", "sql"]
+ORDER_BY = ("total_ms", "mean_ms", "max_ms", "calls", "errors", "rows")
+
+
+class QueryStats:
+    """Running per-fingerprint aggregates and a bounded slow-query log.
+
+    A `pg_stat_statements` equivalent for execute_query. At most `max_fingerprints`
+    shapes are tracked; when full, the least-called shape is dropped. The slow log
+    keeps the `slow_log_size` slowest executions that took at least `slow_query_ms`.
+    """
+
+    def __init__(
+        self,
+        max_fingerprints: int = 1000,
+        slow_query_ms: float = 1000.0,
+        slow_log_size: int = 50,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.max_fingerprints = max_fingerprints
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_size = slow_log_size
+        self._lock = threading.Lock()
+        self._stats: dict[str, FingerprintStats] = {}
+        self._slow: list[tuple[float, int, SlowQuery]] = []  # min-heap on duration
+        self._sequence = itertools.count()
+        # continuation token -> fingerprint, so later pages count towards their query
+        self._pages: dict[str, str] = {}
+
+    def record(
+        self,
+        sql_query: str,
+        seconds: float,
+        rows: int = 0,
+        error: bool = False,
+        continuation_token: str | None = None,
+    ) -> None:
+        """Record one execution of `sql_query`."""
+        if not self.enabled:
+            return
+        fingerprint, normalized = fingerprint_sql(sql_query)
+        duration_ms = seconds * 1000
+        now = datetime.now()
+
+        with self._lock:
+            entry = self._stats.get(fingerprint)
+            if entry is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    least_called = min(self._stats.values(), key=lambda s: s.calls)
+                    del self._stats[least_called.fingerprint]
+                entry = self._stats[fingerprint] = FingerprintStats(
+                    fingerprint, normalized, sql_query[:_MAX_SQL_CHARS], first_seen=now
+                )
+            entry.calls += 1
+            entry.errors += error
+            self._add(entry, duration_ms, rows, now)
+
+            if continuation_token:
+                self._track_page(continuation_token, fingerprint)
+            if duration_ms >= self.slow_query_ms:
+                slow = SlowQuery(
+                    duration_ms, now, fingerprint, sql_query[:_MAX_SQL_CHARS], rows, error
+                )
+                item = (duration_ms, next(self._sequence), slow)
+                if len(self._slow) < self.slow_log_size:
+                    heapq.heappush(self._slow, item)
+                elif duration_ms > self._slow[0][0]:
+                    heapq.heapreplace(self._slow, item)
+
+    def record_page(
+        self, continuation_token: str, seconds: float, rows: int, next_token: str | None = None
+    ) -> None:
+        """Add a later page of results to the query that produced `continuation_token`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            fingerprint = self._pages.pop(continuation_token, None)
+            entry = self._stats.get(fingerprint) if fingerprint else None
+            if entry is None:
+                return
+            self._add(entry, seconds * 1000, rows, datetime.now())
+            if next_token:
+                self._track_page(next_token, fingerprint)
+
+    def _add(self, entry: FingerprintStats, duration_ms: float, rows: int, now: datetime):
+        entry.rows += rows
+        entry.total_ms += duration_ms
+        entry.max_ms = max(entry.max_ms, duration_ms)
+        entry.last_seen = now
+
+    def _track_page(self, token: str, fingerprint: str) -> None:
+        self._pages[token] = fingerprint
+        # Tokens that are never fetched again are forgotten oldest-first
+        while len(self._pages) > 1024:
+            self._pages.pop(next(iter(self._pages)))
+
+    def top(self, limit: int = 10, order_by: str = "total_ms") -> list[FingerprintStats]:
+        if order_by not in ORDER_BY:
+            raise ValueError(f"order_by must be one of {', '.join(ORDER_BY)}, got {order_by!r}")
+        with self._lock:
+            entries = list(self._stats.values())
+        return sorted(entries, key=lambda s: getattr(s, order_by), reverse=True)[:limit]
+
+    def slow_queries(self) -> list[SlowQuery]:
+        """Slow-query log, slowest first."""
+        with self._lock:
+            return [slow for _, _, slow in sorted(self._slow, reverse=True)]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+            self._pages.clear()
+
+    def stat_rows(self, entries: list[FingerprintStats]) -> list[tuple]:
+        return [
+            (
+                s.fingerprint,
+                s.calls,
+                s.errors,
+                s.rows,
+                round(s.total_ms, 3),
+                round(s.mean_ms, 3),
+                round(s.max_ms, 3),
+                s.first_seen,
+                s.last_seen,
+                s.query,
+                s.example,
+            )
+            for s in entries
+        ]
+
+    def slow_rows(self, entries: list[SlowQuery]) -> list[tuple]:
+        return [
+            (round(q.duration_ms, 3), q.timestamp, q.fingerprint, q.rows, q.error, q.sql)
+            for q in entries
+        ]
+
+    def export_parquet(self, directory: str | Path) -> tuple[Path, Path]:
+        """Write the fingerprint stats and slow-query log as Parquet files via DuckDB COPY."""
+        import duckdb
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        stats_path = directory / f"query_stats_{stamp}.parquet"
+        slow_path = directory / f"slow_queries_{stamp}.parquet"
+
+        with duckdb.connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE query_stats (
+                    fingerprint VARCHAR, calls BIGINT, errors BIGINT, rows BIGINT,
+                    total_ms DOUBLE, mean_ms DOUBLE, max_ms DOUBLE,
+                    first_seen TIMESTAMP, last_seen TIMESTAMP, query VARCHAR, example VARCHAR
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE slow_queries (
+                    duration_ms DOUBLE, timestamp TIMESTAMP, fingerprint VARCHAR,
+                    rows BIGINT, error BOOLEAN, sql VARCHAR
+                )
+                """
+            )
+            stat_rows = self.stat_rows(self.top(limit=self.max_fingerprints))
+            slow_rows = self.slow_rows(self.slow_queries())
+            if stat_rows:
+                conn.executemany(
+                    f"INSERT INTO query_stats VALUES ({', '.join('?' * 11)})", stat_rows
+                )
+            if slow_rows:
+                conn.executemany(
+                    f"INSERT INTO slow_queries VALUES ({', '.join('?' * 6)})", slow_rows
+                )
+            for table, path in (("query_stats", stats_path), ("slow_queries", slow_path)):
+                quoted_path = str(path).replace("'", "''")
+                conn.execute(f"COPY {table} TO '{quoted_path}' (FORMAT PARQUET)")
+        return stats_path, slow_path
@@ -0,0 +1,382 @@
+import json
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from osler.database.catalog import Catalog
+from osler.database.pool import file_version
+
+# Words too common in dbt descriptions to help rank anything
+_STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the this to was with".split()
+)
+_MIN_FUZZY_SIMILARITY = 0.4
+_MAX_DESCRIPTION_CHARS = 120
+_MAX_SUGGESTIONS = 5
+
+# Score per query word, by where and how it matched
+_EXACT_NAME = 3.0
+_PARTIAL_NAME = 2.0
+_DESCRIPTION = 1.0
+# Bonus when a table's or column's whole name is the query ("patient" -> core.patient)
+_WHOLE_NAME = 2.0
+# Share of a matching column's score that counts towards its table
+_COLUMN_WEIGHT = 0.5
+
+
+def words(text: str) -> list[str]:
+    """Lowercase word tokens; identifiers split on `_`, `.` and other punctuation."""
+    return [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in _STOP_WORDS]
+
+
+def trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta and tb else 0.0
+
+
+@dataclass
+class SearchDocument:
+    table: str  # schema.table
+    column: str | None = None  # None for the table itself
+    description: str = ""
+
+
+@dataclass
+class SearchHit:
+    table: str
+    score: float
+    description: str = ""
+    columns: list[tuple[str, str]] = field(default_factory=list)  # (column, description)
+
+
+class SearchIndex:
+    """Inverted index over table/column names and descriptions, plus a trigram index
+    over the name vocabulary for partial and misspelled words.
+    """
+
+    def __init__(self, documents: list[SearchDocument]):
+        self.documents = documents
+        self._name_postings: dict[str, set[int]] = defaultdict(set)
+        self._description_postings: dict[str, set[int]] = defaultdict(set)
+        self._vocabulary_trigrams: dict[str, set[str]] = defaultdict(set)
+        self._table_descriptions: dict[str, str] = {}
+        self._whole_names: dict[str, set[int]] = defaultdict(set)
+
+        for doc_id, doc in enumerate(documents):
+            if doc.column is None:
+                self._table_descriptions[doc.table] = doc.description
+            name = doc.column if doc.column is not None else doc.table.rsplit(".", 1)[-1]
+            self._whole_names[" ".join(words(name))].add(doc_id)
+            for word in words(doc.column if doc.column is not None else doc.table):
+                self._name_postings[word].add(doc_id)
+            for word in words(doc.description):
+                self._description_postings[word].add(doc_id)
+        for word in self._name_postings:
+            for trigram in trigrams(word):
+                self._vocabulary_trigrams[trigram].add(word)
+
+    def _similar_words(self, term: str) -> dict[str, float]:
+        """Name words containing `term` or close to it, with a score for each."""
+        candidates: set[str] = set()
+        for trigram in trigrams(term):
+            candidates |= self._vocabulary_trigrams.get(trigram, set())
+
+        matches = {}
+        for word in candidates:
+            if word == term:
+                matches[word] = _EXACT_NAME
+            elif len(term) >= 3 and term in word:
+                matches[word] = _PARTIAL_NAME
+            else:
+                similarity = trigram_similarity(term, word)
+                if similarity >= _MIN_FUZZY_SIMILARITY:
+                    matches[word] = _PARTIAL_NAME * similarity
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """Tables ranked by how well they, their columns and descriptions match `query`."""
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(words(query)):
+            term_scores: dict[int, float] = defaultdict(float)
+            for word, score in self._similar_words(term).items():
+                for doc_id in self._name_postings[word]:
+                    term_scores[doc_id] = max(term_scores[doc_id], score)
+            # Descriptions match whole words, or words starting with the term ("readmit")
+            description_words = (
+                [term]
+                if len(term) < 4
+                else [w for w in self._description_postings if w.startswith(term)]
+            )
+            for word in description_words:
+                for doc_id in self._description_postings.get(word, ()):
+                    term_scores[doc_id] += _DESCRIPTION
+            for doc_id, score in term_scores.items():
+                scores[doc_id] += score
+        for doc_id in self._whole_names.get(" ".join(words(query)), ()):
+            scores[doc_id] += _WHOLE_NAME
+
+        hits: dict[str, SearchHit] = {}
+        for doc_id, score in sorted(scores.items(), key=lambda item: -item[1]):
+            doc = self.documents[doc_id]
+            hit = hits.get(doc.table)
+            if hit is None:
+                hit = hits[doc.table] = SearchHit(
+                    doc.table, 0.0, self._table_descriptions.get(doc.table, "")
+                )
+            if doc.column is None:
+                hit.score += score
+            else:
+                hit.score += score * _COLUMN_WEIGHT
+                hit.columns.append((doc.column, doc.description))
+
+        return sorted(hits.values(), key=lambda h: (-h.score, h.table))[:limit]
+
+
+def _dbt_descriptions(manifest_path: Path | None, catalog_path: Path | None) -> dict:
+    """`{(schema, table): (description, {column: description})}` from dbt artifacts."""
+    descriptions: dict[tuple[str, str], tuple[str, dict[str, str]]] = {}
+
+    def add(schema, table, description, columns):
+        key = (schema.lower(), table.lower())
+        old_description, old_columns = descriptions.get(key, ("", {}))
+        merged = dict(old_columns)
+        for column, text in columns.items():
+            if text and not merged.get(column.lower()):
+                merged[column.lower()] = text
+        descriptions[key] = (old_description or description or "", merged)
+
+    for path in (manifest_path, catalog_path):
+        if path is None or not Path(path).exists():
+            continue
+        with open(path, encoding="utf-8") as f:
+            artifact = json.load(f)
+        for node in artifact.get("nodes", {}).values():
+            if "metadata" in node:  # catalog.json
+                meta = node["metadata"]
+                columns = {c["name"]: c.get("comment") or "" for c in node["columns"].values()}
+                add(meta["schema"], meta["name"], meta.get("comment") or "", columns)
+            elif node.get("resource_type") in ("model", "seed", "snapshot") and node.get("schema"):
+                columns = {
+                    name: column.get("description", "")
+                    for name, column in node.get("columns", {}).items()
+                }
+                table = node.get("alias") or node["name"]
+                add(node["schema"], table, node.get("description", ""), columns)
+    return descriptions
+
+
+def build_search_index(
+    catalog: Catalog, manifest_path: Path | None = None, catalog_path: Path | None = None
+) -> SearchIndex:
+    """Index every table and column in `catalog`, with descriptions from dbt's
+    manifest.json and catalog.json when they are available."""
+    descriptions = _dbt_descriptions(manifest_path, catalog_path)
+    documents = []
+    for table in catalog.tables:
+        description, column_descriptions = descriptions.get(
+            (table.schema.lower(), table.name.lower()), ("", {})
+        )
+        documents.append(SearchDocument(table.qualified_name, None, description))
+        for column in table.columns:
+            documents.append(
+                SearchDocument(
+                    table.qualified_name,
+                    column.name,
+                    column_descriptions.get(column.name.lower(), ""),
+                )
+            )
+    return SearchIndex(documents)
+
+
+_cached_index: tuple[Catalog, tuple, SearchIndex] | None = None
+_index_lock = threading.Lock()
+
+
+def load_search_index(
+    catalog: Catalog, manifest_path: Path | None = None, catalog_path: Path | None = None
+) -> SearchIndex:
+    """Build the index once per catalog and dbt artifact version."""
+    global _cached_index
+    versions = (
+        file_version(manifest_path) if manifest_path else None,
+        file_version(catalog_path) if catalog_path else None,
+    )
+    with _index_lock:
+        if _cached_index is not None:
+            cached_catalog, cached_versions, index = _cached_index
+            if cached_catalog is catalog and cached_versions == versions:
+                return index
+        index = build_search_index(catalog, manifest_path, catalog_path)
+        _cached_index = (catalog, versions, index)
+        return index
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between `a` and `b`."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+# Unknown identifiers in DuckDB catalog and binder errors
+_MISSING_NAME_PATTERNS = [
+    ("table", re.compile(r'Table with name "?([\w.]+)"? does not exist', re.IGNORECASE)),
+    ("column", re.compile(r'Referenced column "?(\w+)"? not found', re.IGNORECASE)),
+    ("column", re.compile(r'does not have a column named "?(\w+)"?', re.IGNORECASE)),
+    ("column", re.compile(r'Column with name "?(\w+)"? does not exist', re.IGNORECASE)),
+]
+
+
+def missing_identifier(error: str) -> tuple[str, str] | None:
+    """`("table" | "column", name)` for an error about an unknown table or column."""
+    for kind, pattern in _MISSING_NAME_PATTERNS:
+        match = pattern.search(error)
+        if match:
+            return kind, match.group(1)
+    return None
+
+
+class NameIndex:
+    """Trigram index over table and column names for "did you mean" suggestions."""
+
+    def __init__(self, catalog: Catalog):
+        # Lowercase name -> real names: bare table names map to their qualified names
+        self._tables: dict[str, set[str]] = defaultdict(set)
+        self._columns: dict[str, set[tuple[str, str]]] = defaultdict(set)  # (column, table)
+        for table in catalog.tables:
+            self._tables[table.qualified_name.lower()].add(table.qualified_name)
+            self._tables[table.name.lower()].add(table.qualified_name)
+            for column in table.columns:
+                self._columns[column.name.lower()].add((column.name, table.qualified_name))
+        self._table_trigrams = self._trigram_index(self._tables)
+        self._column_trigrams = self._trigram_index(self._columns)
+
+    @staticmethod
+    def _trigram_index(names) -> dict[str, set[str]]:
+        index: dict[str, set[str]] = defaultdict(set)
+        for name in names:
+            for trigram in trigrams(name):
+                index[trigram].add(name)
+        return index
+
+    @staticmethod
+    def _closest(name: str, index: dict[str, set[str]]) -> list[str]:
+        """Indexed names close to `name`, closest first."""
+        name = name.lower()
+        candidates: set[str] = set()
+        for trigram in trigrams(name):
+            candidates |= index.get(trigram, set())
+        max_distance = max(2, len(name) // 3)
+        scored = []
+        for candidate in candidates:
+            distance = edit_distance(name, candidate)
+            similarity = trigram_similarity(name, candidate)
+            if distance <= max_distance or similarity >= _MIN_FUZZY_SIMILARITY:
+                scored.append((distance, -similarity, candidate))
+        return [candidate for *_, candidate in sorted(scored)]
+
+    def similar_tables(self, name: str, limit: int = _MAX_SUGGESTIONS) -> list[str]:
+        """Qualified names of the tables closest to `name`."""
+        suggestions: list[str] = []
+        for match in self._closest(name, self._table_trigrams):
+            for table in sorted(self._tables[match]):
+                if table not in suggestions:
+                    suggestions.append(table)
+        return suggestions[:limit]
+
+    def similar_columns(
+        self, name: str, tables: list[str] | None = None, limit: int = _MAX_SUGGESTIONS
+    ) -> list[tuple[str, list[str]]]:
+        """`(column, [tables that have it])` for the columns closest to `name`.
+
+        When `tables` is given (e.g. the tables a query reads), columns of those tables
+        are suggested first.
+        """
+        wanted = {t.lower() for t in tables or ()}
+        suggestions = []
+        for match in self._closest(name, self._column_trigrams):
+            by_column: dict[str, list[str]] = defaultdict(list)
+            for column, table in sorted(self._columns[match]):
+                by_column[column].append(table)
+            suggestions.extend(by_column.items())
+        if wanted:
+            # Stable sort: within each group the closest names stay first
+            suggestions.sort(
+                key=lambda s: not any(
+                    t.lower() in wanted or t.lower().rsplit(".", 1)[-1] in wanted for t in s[1]
+                )
+            )
+        return suggestions[:limit]
+
+
+_cached_names: tuple[Catalog, NameIndex] | None = None
+
+
+def load_name_index(catalog: Catalog) -> NameIndex:
+    """Build the name index once per catalog."""
+    global _cached_names
+    with _index_lock:
+        if _cached_names is None or _cached_names[0] is not catalog:
+            _cached_names = (catalog, NameIndex(catalog))
+        return _cached_names[1]
+
+
+def did_you_mean(error: str, catalog: Catalog, sql: str = "") -> str | None:
+    """A "Did you mean" hint naming the real tables or columns closest to the unknown
+    identifier in a query `error`, or None if there is no such identifier or match."""
+    missing = missing_identifier(error)
+    if missing is None:
+        return None
+    kind, name = missing
+    index = load_name_index(catalog)
+    if kind == "table":
+        tables = index.similar_tables(name)
+        if not tables:
+            return None
+        return f"Did you mean table {', '.join(f'`{t}`' for t in tables)}?"
+
+    query_words = set(re.findall(r"[\w.]+", sql.lower()))
+    columns = index.similar_columns(name, tables=list(query_words))
+    if not columns:
+        return None
+    options = []
+    for column, tables in columns:
+        shown = ", ".join(tables[:3]) + (f" +{len(tables) - 3} more" if len(tables) > 3 else "")
+        options.append(f"`{column}` (in {shown})")
+    return f"Did you mean column {', '.join(options)}?"
+
+
+def _shorten(text: str) -> str:
+    text = " ".join(text.split())
+    if len(text) > _MAX_DESCRIPTION_CHARS:
+        text = text[: _MAX_DESCRIPTION_CHARS - 3] + "..."
+    return text
+
+
+def render_search(query: str, hits: list[SearchHit], max_columns: int = 5) -> str:
+    if not hits:
+        return f"No tables or columns match '{query}'."
+    lines = [f"Tables matching '{query}', best first:"]
+    for rank, hit in enumerate(hits, 1):
+        line = f"{rank}. {hit.table}"
+        if hit.description:
+            line += f" - {_shorten(hit.description)}"
+        lines.append(line)
+        for column, description in hit.columns[:max_columns]:
+            lines.append(f"   - {column}" + (f": {_shorten(description)}" if description else ""))
+        if len(hit.columns) > max_columns:
+            lines.append(f"   - ... {len(hit.columns) - max_columns} more matching columns")
+    return "\n".join(lines)
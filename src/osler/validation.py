@@ -0,0 +1,234 @@
+import re
+from functools import lru_cache
+
+from sqlparse import lexer
+from sqlparse import tokens as T
+from sqlparse.engine import grouping
+from sqlparse.engine.statement_splitter import StatementSplitter
+
+# Block dangerous write operations within SELECT
+DANGEROUS_KEYWORDS = (
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "DROP",
+    "CREATE",
+    "ALTER",
+    "TRUNCATE",
+    "REPLACE",
+    "MERGE",
+    "EXEC",
+    "EXECUTE",
+)
+
+# Block common injection patterns that are rarely used in legitimate analytics
+INJECTION_PATTERNS = (
+    # Classic SQL injection patterns
+    ("1=1", "Classic injection pattern"),
+    ("OR 1=1", "Boolean injection pattern"),
+    ("AND 1=1", "Boolean injection pattern"),
+    ("OR '1'='1'", "String injection pattern"),
+    ("AND '1'='1'", "String injection pattern"),
+    ("WAITFOR", "Time-based injection"),
+    ("SLEEP(", "Time-based injection"),
+    ("BENCHMARK(", "Time-based injection"),
+    ("LOAD_FILE(", "File access injection"),
+    ("INTO OUTFILE", "File write injection"),
+    ("INTO DUMPFILE", "File write injection"),
+)
+
+# Context-aware protection: Block suspicious table/column names not in medical databases
+SUSPICIOUS_NAMES = (
+    "PASSWORD",
+    "ADMIN",
+    "USER",
+    "LOGIN",
+    "AUTH",
+    "TOKEN",
+    "CREDENTIAL",
+    "SECRET",
+    "KEY",
+    "HASH",
+    "SALT",
+    "SESSION",
+    "COOKIE",
+)
+
+# A keyword only counts as a write operation when delimited by spaces (or the ends
+# of the query), e.g. "DROP TABLE" but not "DROPPED" or "DROP\nTABLE".
+_DANGEROUS_RE = re.compile(
+    "|".join(rf"(?<![^ ]){re.escape(keyword)}(?![^ ])" for keyword in DANGEROUS_KEYWORDS)
+)
+
+# Every blocked substring in one alternation, so clean queries are scanned once
+_BLOCKED_RE = re.compile(
+    "|".join(
+        [_DANGEROUS_RE.pattern]
+        + [re.escape(pattern) for pattern, _ in INJECTION_PATTERNS]
+        + [re.escape(name) for name in SUSPICIOUS_NAMES]
+    )
+)
+
+# sqlparse's grouping recurses once per bracket level; past this depth defer to it
+# so pathological queries fail (or pass) exactly as they always have.
+_MAX_FAST_PATH_DEPTH = 32
+
+
+def _skip_parenthesis(tokens, idx: int) -> int | None:
+    """Return the index just past the parenthesis opening at `idx`, if balanced."""
+    depth = 0
+    for i in range(idx, len(tokens)):
+        if tokens[i].ttype is T.Punctuation:
+            if tokens[i].value == "(":
+                depth += 1
+            elif tokens[i].value == ")":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+    return None
+
+
+def _cte_statement_type(tokens) -> str | None:
+    """Classify `WITH [RECURSIVE] name [(cols)] AS (...), ... <DML>` without grouping.
+
+    Only the canonical shape, with nothing but whitespace between its parts, is
+    recognised; sqlparse groups it into an Identifier/IdentifierList followed by
+    the DML keyword. Anything else returns None so the caller falls back to sqlparse.
+    """
+    tokens = [tk for tk in tokens if not tk.is_whitespace]
+    idx = 1  # tokens[0] is WITH
+    if (
+        idx < len(tokens)
+        and tokens[idx].ttype is T.Keyword
+        and tokens[idx].normalized == "RECURSIVE"
+    ):
+        idx += 1
+
+    while idx < len(tokens):
+        if tokens[idx].ttype not in (T.Name, T.Literal.String.Symbol):
+            return None
+        is_name = tokens[idx].ttype is T.Name
+        idx += 1
+        if is_name and idx < len(tokens) and tokens[idx].match(T.Punctuation, "("):
+            idx = _skip_parenthesis(tokens, idx)
+            if idx is None:
+                return None
+        if not (
+            idx < len(tokens) and tokens[idx].ttype is T.Keyword and tokens[idx].normalized == "AS"
+        ):
+            return None
+        idx += 1
+        if not (idx < len(tokens) and tokens[idx].match(T.Punctuation, "(")):
+            return None
+        idx = _skip_parenthesis(tokens, idx)
+        if idx is None or idx >= len(tokens):
+            return None
+
+        if tokens[idx].match(T.Punctuation, ","):
+            idx += 1
+        elif tokens[idx].ttype == T.Keyword.DML:
+            return tokens[idx].normalized
+        else:
+            return None
+    return None
+
+
+def _statement_type(statement, max_depth: int) -> str:
+    """Equivalent of `Statement.get_type()` that avoids sqlparse's grouping pass.
+
+    Grouping is the expensive part of parsing. The first non-comment token decides
+    the type of plain statements, and canonical CTEs are classified from the flat
+    token stream; only unusual CTEs or pathologically nested statements are grouped.
+    """
+    tokens = statement.tokens
+    first_idx = next(
+        (i for i, tk in enumerate(tokens) if not (tk.is_whitespace or tk.ttype in T.Comment)),
+        None,
+    )
+    if first_idx is None:
+        return "UNKNOWN"
+    first = tokens[first_idx]
+    if max_depth > _MAX_FAST_PATH_DEPTH:
+        return grouping.group(statement).get_type()
+    if first.ttype in (T.Keyword.DML, T.Keyword.DDL):
+        # sqlparse groups a keyword followed by `::` or `.` (`SELECT::x`, `SELECT .x`)
+        # into an identifier; anything but whitespace right after it is left to sqlparse
+        rest = tokens[first_idx + 1 :]
+        following = next(
+            (tk for tk in rest if not (tk.is_whitespace or tk.ttype in T.Comment)), None
+        )
+        glued = bool(rest) and not rest[0].is_whitespace
+        qualified = following is not None and following.match(T.Punctuation, ("::", "."))
+        if glued or qualified:
+            return grouping.group(statement).get_type()
+        return first.normalized
+    if first.ttype == T.Keyword.CTE:
+        # Leading comments are grouped on their own and do not affect the CTE
+        cte_type = _cte_statement_type(tokens[first_idx:])
+        return cte_type or grouping.group(statement).get_type()
+    return "UNKNOWN"
+
+
+def _blocked_reason(sql_upper: str) -> str | None:
+    if _BLOCKED_RE.search(sql_upper) is None:
+        return None
+
+    match = _DANGEROUS_RE.search(sql_upper)
+    if match:
+        return f"Write operation not allowed: {match.group()}"
+
+    for pattern, description in INJECTION_PATTERNS:
+        if pattern in sql_upper:
+            return f"Injection pattern detected: {description}"
+
+    for name in SUSPICIOUS_NAMES:
+        if name in sql_upper:
+            return f"Suspicious identifier detected: {name} (not medical data)"
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def is_safe_query(sql_query: str) -> tuple[bool, str]:
+    """Secure SQL validation - blocks injection attacks, allows legitimate queries.
+
+    The query is tokenized once; statement splitting and type detection run over
+    that token stream and all blocked patterns are matched with one precompiled
+    regex. Verdicts are memoized per query string.
+    """
+    try:
+        if not sql_query or not sql_query.strip():
+            return False, "Empty query"
+
+        sql_stripped = sql_query.strip()
+
+        max_depth = depth = 0
+        stream = []
+        for ttype, value in lexer.tokenize(sql_stripped):
+            if ttype is T.Punctuation:
+                if value in ("(", "["):
+                    depth += 1
+                    max_depth = max(max_depth, depth)
+                elif value in (")", "]"):
+                    depth -= 1
+            stream.append((ttype, value))
+
+        statements = list(StatementSplitter().process(iter(stream)))
+        if not statements:
+            return False, "Invalid SQL syntax"
+
+        # Block multiple statements (main injection vector)
+        if len(statements) > 1:
+            return False, "Multiple statements not allowed"
+
+        if _statement_type(statements[0], max_depth) != "SELECT":
+            return False, "Only SELECT queries allowed"
+
+        reason = _blocked_reason(sql_stripped.upper())
+        if reason is not None:
+            return False, reason
+
+        return True, "Safe"
+
+    except Exception as e:
+        return False, f"Validation error: {e}"
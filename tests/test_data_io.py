@@ -0,0 +1,201 @@
+import json
+import os
+
+import duckdb
+import pytest
+import yaml
+
+from osler import data_io
+from osler.dbt import utils as dbt_utils
+
+PROFILES = """
+tuva-project-demo:
+  outputs:
+    default:
+      type: duckdb
+      path: ../../osler_data/databases/tuva_project_demo.duckdb
+      database: tuva_project_demo
+"""
+
+
+@pytest.fixture
+def dataset_env(tmp_path, monkeypatch):
+    """Point the dataset at tmp_path and record dbt commands instead of running them."""
+    databases_dir = tmp_path / "databases"
+    project_root = tmp_path / "dbt_projects"
+    (project_root / "tuva-project-demo" / "target").mkdir(parents=True)
+    (project_root / "profiles.yml").write_text(PROFILES)
+    monkeypatch.setattr(data_io, "DEFAULT_DATABASES_DIR", databases_dir)
+    monkeypatch.setattr("osler.config.DEFAULT_DATABASES_DIR", databases_dir)
+    monkeypatch.setattr(dbt_utils, "_DBT_PROJECT_ROOT", project_root)
+    monkeypatch.setattr(dbt_utils, "_DBT_STATE_ROOT", project_root / ".state")
+    monkeypatch.setattr(dbt_utils, "_DBT_PROFILES_DIR", project_root / ".profiles")
+
+    commands = []
+
+    def run_dbt_command(cmd, cwd, name, profiles_dir=None):
+        commands.append(cmd)
+        if cmd[1] == "build":
+            # Stand in for dbt: write to wherever the generated profile points
+            profile = yaml.safe_load((profiles_dir / "profiles.yml").read_text())
+            with open(profile[name]["outputs"]["default"]["path"], "ab") as f:
+                f.write(b"+build")
+
+    project_path = project_root / "tuva-project-demo"
+    monkeypatch.setattr(data_io, "run_dbt_command", run_dbt_command)
+    monkeypatch.setattr(
+        data_io, "install_dbt_packages", lambda cwd, name: commands.append(["dbt", "deps"])
+    )
+    monkeypatch.setattr(data_io, "clone_dbt_project", lambda repo, name: project_path)
+    monkeypatch.setattr(data_io, "update_dbt_project", lambda repo, name: project_path)
+    return databases_dir, project_path, commands
+
+
+def _previous_build(databases_dir, project_path):
+    databases_dir.mkdir()
+    (databases_dir / "tuva_project_demo.duckdb").write_bytes(b"db")
+    state_path = project_path.parent / ".state" / "tuva-project-demo"
+    state_path.mkdir(parents=True)
+    (state_path / "manifest.json").write_text('{"nodes": {}}')
+
+
+def test_first_init_is_a_full_build(dataset_env):
+    databases_dir, _, commands = dataset_env
+    assert data_io.initialize_dataset("tuva-project-demo")
+    assert ["dbt", "build"] in commands
+    db_path = databases_dir / "tuva_project_demo.duckdb"
+    assert db_path.is_symlink()
+    assert db_path.read_bytes() == b"+build"
+
+
+def test_rebuilds_only_modified_models(dataset_env):
+    databases_dir, project_path, commands = dataset_env
+    _previous_build(databases_dir, project_path)
+
+    assert data_io.initialize_dataset("tuva-project-demo")
+
+    state_path = project_path.parent / ".state" / "tuva-project-demo"
+    assert ["dbt", "build", "--select", "state:modified+", "--state", str(state_path)] in commands
+    # The build ran on a copy of the previous database
+    assert (databases_dir / "tuva_project_demo.duckdb").read_bytes() == b"db+build"
+
+
+def test_full_refresh_starts_from_an_empty_database(dataset_env):
+    databases_dir, project_path, commands = dataset_env
+    _previous_build(databases_dir, project_path)
+
+    assert data_io.initialize_dataset("tuva-project-demo", full_refresh=True)
+    assert ["dbt", "build"] in commands
+    assert (databases_dir / "tuva_project_demo.duckdb").read_bytes() == b"+build"
+
+
+def test_failed_build_keeps_the_current_snapshot(dataset_env, monkeypatch):
+    databases_dir, project_path, _ = dataset_env
+    _previous_build(databases_dir, project_path)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("dbt failed")
+
+    monkeypatch.setattr(data_io, "run_dbt_command", fail)
+    with pytest.raises(RuntimeError):
+        data_io.initialize_dataset("tuva-project-demo")
+    assert (databases_dir / "tuva_project_demo.duckdb").read_bytes() == b"db"
+    assert os.listdir(databases_dir / "snapshots") == []
+
+
+def test_published_build_becomes_the_next_state(dataset_env):
+    databases_dir, project_path, _ = dataset_env
+    _previous_build(databases_dir, project_path)
+    (project_path / "target" / "manifest.json").write_text('{"nodes": {"new": {}}}')
+
+    assert data_io.initialize_dataset("tuva-project-demo")
+    state_manifest = project_path.parent / ".state" / "tuva-project-demo" / "manifest.json"
+    assert state_manifest.read_text() == '{"nodes": {"new": {}}}'
+
+
+def test_failed_build_is_retried_by_the_next_init(dataset_env, monkeypatch):
+    databases_dir, project_path, commands = dataset_env
+    _previous_build(databases_dir, project_path)
+    run_dbt_command = data_io.run_dbt_command
+
+    def fail_after_parsing(cmd, cwd, name, profiles_dir=None):
+        # dbt writes the new manifest while parsing, before any model fails
+        (project_path / "target" / "manifest.json").write_text('{"nodes": {"changed": {}}}')
+        raise RuntimeError("dbt failed")
+
+    monkeypatch.setattr(data_io, "run_dbt_command", fail_after_parsing)
+    with pytest.raises(RuntimeError):
+        data_io.initialize_dataset("tuva-project-demo")
+
+    state_path = project_path.parent / ".state" / "tuva-project-demo"
+    compared_against = []
+
+    def build(cmd, cwd, name, profiles_dir=None):
+        if cmd[1] == "build":
+            compared_against.append((state_path / "manifest.json").read_text())
+        run_dbt_command(cmd, cwd, name, profiles_dir)
+
+    monkeypatch.setattr(data_io, "run_dbt_command", build)
+    assert data_io.initialize_dataset("tuva-project-demo")
+    assert ["dbt", "build", "--select", "state:modified+", "--state", str(state_path)] in commands
+    # Compared against the last published build, so the changed models are selected
+    assert compared_against == ['{"nodes": {}}']
+    assert (databases_dir / "tuva_project_demo.duckdb").read_bytes() == b"db+build"
+    assert (state_path / "manifest.json").read_text() == '{"nodes": {"changed": {}}}'
+
+
+def test_old_snapshots_are_garbage_collected(dataset_env):
+    databases_dir, _, _ = dataset_env
+    for _ in range(4):
+        assert data_io.initialize_dataset("tuva-project-demo", full_refresh=True)
+    assert len(os.listdir(databases_dir / "snapshots")) == 2
+
+
+@pytest.fixture
+def built_db(tmp_path):
+    path = tmp_path / "built.duckdb"
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE SCHEMA core")
+    conn.execute("CREATE TABLE core.patient AS SELECT range AS person_id FROM range(1000)")
+    conn.execute("CREATE VIEW core.first_ten AS SELECT * FROM core.patient WHERE person_id < 10")
+    # Sorts before the view it reads
+    conn.execute("CREATE VIEW core.first_five AS SELECT * FROM core.first_ten WHERE person_id < 5")
+    conn.execute(
+        "CREATE TABLE core.typed AS SELECT 1::HUGEINT AS big, 'ok'::ENUM('ok', 'bad') AS status"
+    )
+    conn.close()
+    return path
+
+
+@pytest.mark.parametrize("as_views", [False, True])
+def test_snapshot_round_trip(dataset_env, built_db, tmp_path, as_views):
+    databases_dir, _, _ = dataset_env
+    manifest_path = data_io.export_snapshot(
+        "tuva-project-demo", tmp_path / "export", db_path=built_db
+    )
+    manifest = json.loads(manifest_path.read_text())
+    assert [(t["schema"], t["name"], t["rows"]) for t in manifest["tables"]] == [
+        ("core", "patient", 1000),
+        ("core", "typed", 1),
+    ]
+
+    db_path = data_io.import_snapshot("tuva-project-demo", tmp_path / "export", as_views=as_views)
+    assert db_path == databases_dir / "tuva_project_demo.duckdb"
+    with duckdb.connect(str(db_path), read_only=True) as conn:
+        assert conn.execute("SELECT count(*) FROM core.patient").fetchone() == (1000,)
+        assert conn.execute("SELECT count(*) FROM core.first_ten").fetchone() == (10,)
+        assert conn.execute("SELECT count(*) FROM core.first_five").fetchone() == (5,)
+        types = conn.execute("SELECT typeof(big), typeof(status) FROM core.typed").fetchone()
+        assert types == ("HUGEINT", "ENUM('ok', 'bad')")
+
+
+def test_import_rejects_a_corrupt_snapshot(dataset_env, built_db, tmp_path):
+    manifest_path = data_io.export_snapshot(
+        "tuva-project-demo", tmp_path / "export", db_path=built_db
+    )
+    entry = json.loads(manifest_path.read_text())["tables"][0]["files"][0]
+    with open(tmp_path / "export" / entry["path"], "ab") as f:
+        f.write(b"garbage")
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        data_io.import_snapshot("tuva-project-demo", tmp_path / "export")
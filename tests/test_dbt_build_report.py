@@ -0,0 +1,96 @@
+import json
+
+import yaml
+
+from osler.dbt import utils as dbt_utils
+from osler.dbt.build_report import BuildLog, render_build_report
+
+
+def _result(unique_id, seconds, index, total=4, status="success"):
+    return json.dumps(
+        {
+            "info": {"name": "LogModelResult", "level": "info", "msg": ""},
+            "data": {
+                "execution_time": seconds,
+                "index": index,
+                "total": total,
+                "status": status,
+                "node_info": {
+                    "unique_id": unique_id,
+                    "node_name": unique_id.rsplit(".", 1)[-1],
+                    "resource_type": "model",
+                },
+            },
+        }
+    )
+
+
+#   a (1s) -> b (5s) -> d (1s)
+#   a (1s) -> c (2s) -> d
+PARENTS = {
+    "model.p.a": [],
+    "model.p.b": ["model.p.a"],
+    "model.p.c": ["model.p.a"],
+    "model.p.d": ["model.p.b", "model.p.c", "source.p.raw"],
+}
+
+
+def _build_log():
+    log = BuildLog()
+    lines = [
+        '{"info": {"name": "MainReportVersion", "level": "info", "msg": "Running dbt"}}',
+        _result("model.p.a", 1.0, 1),
+        _result("model.p.c", 2.0, 2),
+        _result("model.p.b", 5.0, 3),
+        _result("model.p.d", 1.0, 4),
+    ]
+    return log, [log.feed(line) for line in lines]
+
+
+def test_progress_and_timings():
+    log, progress = _build_log()
+    assert progress[0] is None
+    assert progress[3] == "[3/4] SUCCESS model b (5.00s)"
+    assert [n.name for n in log.slowest(2)] == ["b", "c"]
+
+
+def test_critical_path():
+    log, _ = _build_log()
+    path, length = log.critical_path(PARENTS)
+    assert [n.name for n in path] == ["a", "b", "d"]
+    assert length == 7.0
+
+
+def test_errors_are_kept_without_buffering_the_log():
+    log = BuildLog()
+    log.feed('{"info": {"level": "error", "msg": "Compilation Error in model x"}}')
+    log.feed("Traceback (most recent call last):")
+    assert list(log.errors) == [
+        "Compilation Error in model x",
+        "Traceback (most recent call last):",
+    ]
+
+
+def test_render_build_report():
+    log, _ = _build_log()
+    report = render_build_report(log, PARENTS, top_n=1)
+    assert "4 nodes, 9.0s" in report
+    assert "1. b (model) 5.00s" in report
+    assert "Critical path (7.0s, 3 nodes)" in report
+
+
+def test_write_dbt_profile(tmp_path, monkeypatch):
+    (tmp_path / "profiles.yml").write_text(
+        "demo:\n  outputs:\n    default:\n      type: duckdb\n      path: demo.duckdb\n"
+    )
+    monkeypatch.setattr(dbt_utils, "_DBT_PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(dbt_utils, "_DBT_PROFILES_DIR", tmp_path / ".profiles")
+
+    profiles_dir = dbt_utils.write_dbt_profile("demo", threads=8, memory_limit="4GB")
+    output = yaml.safe_load((profiles_dir / "profiles.yml").read_text())["demo"]["outputs"]
+    assert output["default"] == {
+        "type": "duckdb",
+        "path": "demo.duckdb",
+        "threads": 8,
+        "settings": {"memory_limit": "4GB"},
+    }
@@ -0,0 +1,74 @@
+import subprocess
+
+import pytest
+
+from osler.dbt import mirror
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(mirror, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def _git(*args, cwd):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    repo = tmp_path / "upstream"
+    repo.mkdir()
+    _git("init", "-q", cwd=repo)
+    _git("config", "user.email", "dev@example.com", cwd=repo)
+    _git("config", "user.name", "dev", cwd=repo)
+    (repo / "dbt_project.yml").write_text("name: demo\n")
+    _git("add", ".", cwd=repo)
+    _git("commit", "-qm", "init", cwd=repo)
+    return repo
+
+
+def test_mirror_is_created_then_reused_offline(cache_dir, upstream):
+    mirror_path = mirror.ensure_git_mirror(str(upstream))
+    assert mirror_path.parent == cache_dir / "git"
+    assert (mirror_path / "HEAD").exists()
+
+    # Upstream disappearing (e.g. no network) falls back to the cached mirror
+    upstream.rename(upstream.with_name("gone"))
+    assert mirror.ensure_git_mirror(str(upstream)) == mirror_path
+
+
+def test_mirror_picks_up_new_commits(cache_dir, upstream):
+    mirror_path = mirror.ensure_git_mirror(str(upstream))
+    (upstream / "model.sql").write_text("select 1")
+    _git("add", ".", cwd=upstream)
+    _git("commit", "-qm", "model", cwd=upstream)
+
+    mirror.ensure_git_mirror(str(upstream))
+    log = subprocess.run(
+        ["git", "log", "--oneline", "--all"], cwd=mirror_path, capture_output=True, text=True
+    )
+    assert len(log.stdout.splitlines()) == 2
+
+
+def test_packages_are_cached_by_spec(cache_dir, tmp_path):
+    project = tmp_path / "project"
+    (project / "dbt_packages" / "dbt_utils").mkdir(parents=True)
+    (project / "dbt_packages" / "dbt_utils" / "macro.sql").write_text("{{ x }}")
+    assert mirror.packages_cache_key(project) is None
+
+    (project / "packages.yml").write_text("packages:\n  - package: dbt-labs/dbt_utils\n")
+    key = mirror.packages_cache_key(project)
+    assert not mirror.restore_dbt_packages(project, key)
+    mirror.store_dbt_packages(project, key)
+
+    clean = tmp_path / "clean"
+    clean.mkdir()
+    (clean / "packages.yml").write_text((project / "packages.yml").read_text())
+    assert mirror.packages_cache_key(clean) == key
+    assert mirror.restore_dbt_packages(clean, key)
+    assert (clean / "dbt_packages" / "dbt_utils" / "macro.sql").read_text() == "{{ x }}"
+
+    (clean / "packages.yml").write_text("packages: []\n")
+    assert mirror.packages_cache_key(clean) != key
@@ -0,0 +1,304 @@
+import os
+import time
+
+import duckdb
+import pytest
+
+from osler.database.base import QueryTimeoutError
+from osler.database.column_stats import load_column_stats, stats_path, write_column_stats
+from osler.database.duckdb_client import DuckDB
+from osler.database.pool import ConnectionPool
+from osler.database.profiling import render_profile
+from osler.database.snapshots import gc_snapshots, new_snapshot, publish_snapshot
+
+
+def _build_db(path, value=1):
+    conn = duckdb.connect(str(path))
+    conn.execute("CREATE SCHEMA core")
+    conn.execute(
+        f"CREATE TABLE core.patient AS SELECT range AS person_id, {value} AS version "
+        "FROM range(120)"
+    )
+    conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "test.duckdb"
+    _build_db(path)
+    return path
+
+
+class TestConnectionPool:
+    def test_reuses_connections(self, db_path):
+        pool = ConnectionPool(db_path, size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            assert second is first
+        pool.close()
+
+    def test_times_out_when_exhausted(self, db_path):
+        pool = ConnectionPool(db_path, size=1, timeout=0.05)
+        conn = pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+        pool.release(conn)
+        pool.close()
+
+    def test_reopens_after_file_replaced(self, db_path, tmp_path):
+        pool = ConnectionPool(db_path, size=2)
+        with pool.connection() as conn:
+            assert conn.execute("SELECT max(version) FROM core.patient").fetchone() == (1,)
+
+        replacement = tmp_path / "replacement.duckdb"
+        _build_db(replacement, value=2)
+        os.replace(replacement, db_path)
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT max(version) FROM core.patient").fetchone() == (2,)
+        pool.close()
+
+
+class TestDuckDB:
+    def test_execute_query(self, db_path):
+        backend = DuckDB(db_path)
+        result = backend.execute_query("SELECT count(*) AS n FROM core.patient")
+        assert result.columns == ["n"]
+        assert result.rows == [(120,)]
+        assert not result.has_more
+        backend.close()
+
+    def test_execute_query_pages_through_results(self, db_path):
+        backend = DuckDB(db_path)
+        page = backend.execute_query("SELECT person_id FROM core.patient ORDER BY 1")
+        assert len(page.rows) == 50
+        assert page.has_more
+        assert page.column_types == ["BIGINT"]
+
+        seen = list(page.rows)
+        while page.has_more:
+            page = backend.fetch_more(page.continuation_token)
+            seen.extend(page.rows)
+        assert [row[0] for row in seen] == list(range(120))
+        assert page.offset == 100
+
+        with pytest.raises(KeyError):
+            backend.fetch_more("not-a-token")
+        backend.close()
+
+    def test_result_cache(self, db_path, tmp_path):
+        backend = DuckDB(db_path)
+        sql = "SELECT max(version) AS v FROM core.patient"
+        assert backend.execute_query(sql).rows == [(1,)]
+        cached = backend.execute_query("select MAX(version) as v\nfrom core.patient -- again;")
+        assert cached.rows == [(1,)]
+        assert backend.result_cache.hits == 1
+
+        replacement = tmp_path / "replacement.duckdb"
+        _build_db(replacement, value=2)
+        os.replace(replacement, db_path)
+        assert backend.execute_query(sql).rows == [(2,)]
+        assert backend.result_cache.hits == 1
+        backend.close()
+
+    def test_volatile_queries_are_not_cached(self, db_path):
+        backend = DuckDB(db_path)
+        for sql in (
+            "SELECT random() AS r",
+            "SELECT now() AS t",
+            "SELECT current_date AS d",
+            "SELECT uuid() AS u",
+            "SELECT * FROM core.patient USING SAMPLE 1",
+        ):
+            backend.execute_query(sql)
+            backend.execute_query(sql)
+        assert backend.result_cache.stats()["entries"] == 0
+        assert backend.execute_query("SELECT random() AS r").rows != (
+            backend.execute_query("SELECT random() AS r").rows
+        )
+        backend.close()
+
+    def test_cached_results_are_copies(self, db_path):
+        backend = DuckDB(db_path)
+        sql = "SELECT max(version) AS v FROM core.patient"
+        first = backend.execute_query(sql)
+        first.rows.append((99,))
+        first.columns[0] = "changed"
+
+        cached = backend.execute_query(sql)
+        assert cached.rows == [(1,)]
+        assert cached.columns == ["v"]
+        cached.rows.clear()
+        assert backend.execute_query(sql).rows == [(1,)]
+        assert backend.result_cache.hits == 2
+        backend.close()
+
+    def test_result_cache_disabled(self, db_path):
+        backend = DuckDB(db_path, cache_bytes=0)
+        backend.execute_query("SELECT 1")
+        backend.execute_query("SELECT 1")
+        assert backend.result_cache.stats()["hits"] == 0
+        backend.close()
+
+    def test_query_timeout_interrupts_and_recovers(self, db_path):
+        backend = DuckDB(db_path, pool_size=1, query_timeout=0.2)
+        with pytest.raises(QueryTimeoutError):
+            backend.execute_query("SELECT count(*) FROM range(100000000000)")
+        assert backend.interrupted_queries == 1
+
+        # The connection goes back to the pool and is usable again
+        assert backend.execute_query("SELECT 1 AS one", timeout=5).rows == [(1,)]
+        backend.close()
+
+    def test_per_call_timeout_cannot_exceed_the_server_limit(self, db_path):
+        backend = DuckDB(db_path, pool_size=1, query_timeout=0.2)
+        start = time.perf_counter()
+        with pytest.raises(QueryTimeoutError) as e:
+            backend.execute_query("SELECT count(*) FROM range(100000000000)", timeout=3600)
+        assert e.value.timeout == 0.2
+        assert time.perf_counter() - start < 5
+        assert backend.effective_timeout(0.1) == 0.1
+        assert backend.effective_timeout(None) == 0.2
+        backend.close()
+
+    @pytest.mark.parametrize("timeout", [0, -1])
+    def test_non_positive_timeouts_are_rejected(self, db_path, timeout):
+        backend = DuckDB(db_path, query_timeout=0.2)
+        with pytest.raises(ValueError, match="positive"):
+            backend.execute_query("SELECT 1", timeout=timeout)
+        with pytest.raises(ValueError, match="positive"):
+            backend.profile_query("SELECT 1", timeout=timeout)
+        backend.close()
+
+    def test_get_schema(self, db_path):
+        backend = DuckDB(db_path)
+        assert backend.get_schema() == ["core.patient"]
+        backend.close()
+
+    def test_get_table_info(self, db_path):
+        backend = DuckDB(db_path)
+        info = backend.get_table_info("core.patient")
+        assert "person_id" in info
+        assert "version" in info
+        assert "Sample:" in info
+        assert backend.get_table_info("patient", show_sample=False).startswith("Table: patient")
+        with pytest.raises(ValueError):
+            backend.get_table_info("core.missing")
+        backend.close()
+
+    def test_catalog_is_cached_until_file_changes(self, db_path, tmp_path):
+        backend = DuckDB(db_path)
+        catalog = backend.catalog()
+        assert backend.catalog() is catalog
+
+        replacement = tmp_path / "replacement.duckdb"
+        _build_db(replacement, value=2)
+        os.replace(replacement, db_path)
+        assert backend.catalog() is not catalog
+        backend.close()
+
+    def test_profile_query(self, db_path):
+        backend = DuckDB(db_path)
+        profile = backend.profile_query(
+            "SELECT a.version, COUNT(*) FROM core.patient a "
+            "JOIN core.patient b ON a.person_id = b.person_id GROUP BY 1"
+        )
+        operators = [node.name for root in profile.plan for node in root.walk()]
+        assert "HASH_JOIN" in operators
+        assert "EXPLAIN_ANALYZE" not in operators
+
+        text = render_profile(profile, top_n=2)
+        assert "Hottest operators" in text
+        assert "Conditions: person_id = person_id" in text
+        assert "\n3. " not in text
+        backend.close()
+
+
+class TestSnapshots:
+    def test_swap_moves_new_queries_to_the_new_snapshot(self, tmp_path):
+        db_path = tmp_path / "test.duckdb"
+        first = new_snapshot(db_path)
+        _build_db(first, value=1)
+        publish_snapshot(db_path, first)
+
+        backend = DuckDB(db_path, pool_size=2, cache_bytes=0)
+        in_flight = backend.execute_query("SELECT person_id FROM core.patient", max_rows=10)
+        assert in_flight.has_more
+
+        second = new_snapshot(db_path)
+        _build_db(second, value=2)
+        publish_snapshot(db_path, second)
+
+        # New queries don't wait for the open cursor on the old snapshot ...
+        result = backend.execute_query("SELECT max(version) FROM core.patient")
+        assert result.rows == [(2,)]
+        # ... which can still be paged to the end
+        page = backend.fetch_more(in_flight.continuation_token, max_rows=200)
+        assert len(page.rows) == 110
+        backend.close()
+
+    def test_gc_keeps_current_and_newest(self, tmp_path):
+        db_path = tmp_path / "test.duckdb"
+        snapshots = []
+        for value in range(4):
+            snapshot = new_snapshot(db_path)
+            _build_db(snapshot, value=value)
+            snapshots.append(snapshot)
+        publish_snapshot(db_path, snapshots[0])
+
+        removed = gc_snapshots(db_path, keep=2)
+        assert sorted(removed) == [snapshots[1]]
+        assert [s.exists() for s in snapshots] == [True, False, True, True]
+
+
+class TestColumnStats:
+    @pytest.fixture
+    def stats_db(self, tmp_path):
+        path = tmp_path / "stats.duckdb"
+        conn = duckdb.connect(str(path))
+        conn.execute("CREATE SCHEMA core")
+        conn.execute(
+            "CREATE TABLE core.patient AS SELECT range AS person_id, "
+            "CASE WHEN range % 4 = 0 THEN NULL ELSE ['F', 'M'][range % 2 + 1] END AS sex "
+            "FROM range(1000)"
+        )
+        conn.close()
+        return path
+
+    def test_sidecar_stats(self, stats_db):
+        path = write_column_stats(stats_db, top_k=2)
+        assert path == stats_path(stats_db)
+
+        rows = {r[2]: r for r in load_column_stats(path)["core.patient"]}
+        person_id, sex = rows["person_id"], rows["sex"]
+        assert person_id[4] == 1000
+        assert (person_id[7], person_id[8]) == ("0", "999")
+        assert person_id[10] is None  # near-unique, no top values
+        assert sex[5] == 0.25
+        assert sex[6] == 2
+        assert sex[10] == ["M", "F"]
+
+    def test_table_profile_uses_the_sidecar(self, stats_db):
+        backend = DuckDB(stats_db)
+        live = backend.get_table_profile("patient")
+        assert "Computed now" in live
+
+        write_column_stats(stats_db)
+        profile = backend.get_table_profile("core.patient")
+        assert "Computed now" not in profile
+        assert "core.patient (1,000 rows)" in profile
+        assert "sex,VARCHAR,0.25,2," in profile
+        backend.close()
+
+    def test_live_profile_is_held_to_the_query_time_limit(self, tmp_path):
+        path = tmp_path / "large.duckdb"
+        with duckdb.connect(str(path)) as conn:
+            conn.execute("CREATE VIEW big AS SELECT range AS id FROM range(100000000000)")
+        backend = DuckDB(path, pool_size=1, query_timeout=0.2)
+        profile = backend.get_table_profile("big")
+        assert "No precomputed statistics" in profile
+        assert "osler stats" in profile
+        assert backend.interrupted_queries == 1
+        assert backend.execute_query("SELECT 1 AS one").rows == [(1,)]
+        backend.close()
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from osler.executor import BackendExecutor, ServerBusyError
+
+
+class TestBackendExecutor:
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_concurrently(self):
+        executor = BackendExecutor(max_workers=4)
+        loop_thread = threading.get_ident()
+
+        def work():
+            time.sleep(0.1)
+            return threading.get_ident()
+
+        start = time.perf_counter()
+        threads = await asyncio.gather(*(executor.run(work) for _ in range(4)))
+        assert time.perf_counter() - start < 0.3
+        assert loop_thread not in threads
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        executor = BackendExecutor(max_workers=1, max_queued=1)
+        results = await asyncio.gather(
+            *(executor.run(time.sleep, 0.05) for _ in range(3)), return_exceptions=True
+        )
+        assert sum(isinstance(r, ServerBusyError) for r in results) == 1
+        assert executor.pending == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_count_until_their_work_finishes(self):
+        executor = BackendExecutor(max_workers=1, max_queued=0)
+        started, release = threading.Event(), threading.Event()
+
+        def work():
+            started.set()
+            release.wait(5)
+
+        task = asyncio.create_task(executor.run(work))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The worker is still busy, so there is no room for another call
+        assert executor.pending == 1
+        with pytest.raises(ServerBusyError):
+            await executor.run(time.sleep, 0)
+
+        release.set()
+        for _ in range(100):
+            if executor.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.pending == 0
+        assert await executor.run(lambda: "ok") == "ok"
+        executor.shutdown()
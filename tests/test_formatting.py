@@ -0,0 +1,62 @@
+import datetime
+import decimal
+import json
+
+import pytest
+
+from osler.database.base import QueryResult
+from osler.formatting import render_result, to_query_output
+
+RESULT = QueryResult(
+    columns=["person_id", "condition", "paid"],
+    rows=[
+        (1, "Type 2 Diabetes", decimal.Decimal("10.50")),
+        (2, "Heart | Failure", None),
+    ],
+    column_types=["BIGINT", "VARCHAR", "DECIMAL(18,2)"],
+)
+
+
+class TestRenderResult:
+    def test_csv(self):
+        assert render_result(RESULT, "csv") == (
+            "person_id,condition,paid\n1,Type 2 Diabetes,10.50\n2,Heart | Failure,"
+        )
+
+    def test_tsv(self):
+        assert render_result(RESULT, "tsv").splitlines()[1] == "1\tType 2 Diabetes\t10.50"
+
+    def test_markdown_escapes_pipes(self):
+        lines = render_result(RESULT, "markdown").splitlines()
+        assert lines[0] == "| person_id | condition | paid |"
+        assert lines[3] == "| 2 | Heart \\| Failure | NULL |"
+
+    def test_json(self):
+        assert json.loads(render_result(RESULT, "json"))[0] == {
+            "person_id": 1,
+            "condition": "Type 2 Diabetes",
+            "paid": 10.5,
+        }
+
+    def test_table(self):
+        assert render_result(RESULT, "table").splitlines()[0] == "person_id       condition  paid"
+
+    def test_empty_and_unknown_format(self):
+        assert render_result(QueryResult(columns=["a"]), "csv") == "No results found"
+        with pytest.raises(ValueError):
+            render_result(RESULT, "xml")
+
+    def test_pagination_note(self):
+        page = QueryResult(columns=["a"], rows=[(1,)], has_more=True, continuation_token="tok")
+        assert "continuation_token='tok'" in render_result(page, "csv")
+
+
+def test_structured_output_has_typed_columns():
+    result = QueryResult(
+        columns=["day"], rows=[(datetime.date(2024, 1, 31),)], column_types=["DATE"]
+    )
+    output = to_query_output(result, "csv")
+    assert output["columns"] == [{"name": "day", "type": "DATE"}]
+    assert output["rows"] == [["2024-01-31"]]
+    assert output["row_count"] == 1
+    assert not output["error"]
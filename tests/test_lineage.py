@@ -0,0 +1,96 @@
+import json
+import os
+
+import pytest
+
+from osler.dbt.lineage import LineageIndex, load_lineage_index
+
+MANIFEST = {
+    "nodes": {
+        "model.tuva.stg_condition": {
+            "name": "stg_condition",
+            "resource_type": "model",
+            "fqn": ["tuva", "core", "stg_condition"],
+        },
+        "model.tuva.condition": {
+            "name": "condition",
+            "resource_type": "model",
+            "fqn": ["tuva", "core", "condition"],
+        },
+        "model.tuva.chronic_conditions": {
+            "name": "chronic_conditions",
+            "resource_type": "model",
+            "fqn": ["tuva", "chronic_conditions", "chronic_conditions"],
+        },
+        "test.tuva.not_null_condition_id": {
+            "name": "not_null_condition_id",
+            "resource_type": "test",
+            "fqn": ["tuva", "core", "not_null_condition_id"],
+            "depends_on": {"nodes": ["model.tuva.condition"]},
+        },
+    },
+    "sources": {
+        "source.tuva.raw.condition": {
+            "name": "condition",
+            "resource_type": "source",
+            "fqn": ["tuva", "raw", "condition"],
+        }
+    },
+    "parent_map": {
+        "source.tuva.raw.condition": [],
+        "model.tuva.stg_condition": ["source.tuva.raw.condition"],
+        "model.tuva.condition": ["model.tuva.stg_condition"],
+        "model.tuva.chronic_conditions": ["model.tuva.condition"],
+        "test.tuva.not_null_condition_id": ["model.tuva.condition"],
+    },
+    "child_map": {
+        "source.tuva.raw.condition": ["model.tuva.stg_condition"],
+        "model.tuva.stg_condition": ["model.tuva.condition"],
+        "model.tuva.condition": [
+            "model.tuva.chronic_conditions",
+            "test.tuva.not_null_condition_id",
+        ],
+        "model.tuva.chronic_conditions": [],
+        "test.tuva.not_null_condition_id": [],
+    },
+}
+
+
+class TestLineageIndex:
+    def test_parent_lineage_respects_depth(self):
+        index = LineageIndex(MANIFEST)
+        assert index.lineage("chronic_conditions", "parent", 1) == [
+            "tuva.chronic_conditions.chronic_conditions",
+            "tuva.core.condition",
+            "tuva.core.not_null_condition_id",
+        ]
+        assert "source:tuva.raw.condition" in index.lineage("chronic_conditions", "parent", 3)
+
+    def test_children_lineage(self):
+        index = LineageIndex(MANIFEST)
+        assert index.lineage("stg_condition", "children", 1) == [
+            "tuva.core.condition",
+            "tuva.core.not_null_condition_id",
+            "tuva.core.stg_condition",
+        ]
+
+    def test_unknown_model_and_direction(self):
+        index = LineageIndex(MANIFEST)
+        assert index.lineage("missing", "parent", 2) == []
+        with pytest.raises(ValueError):
+            index.lineage("condition", "sideways", 1)
+
+    def test_reloads_when_manifest_changes(self, tmp_path):
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(MANIFEST))
+        index = load_lineage_index(manifest_path)
+        assert load_lineage_index(manifest_path) is index
+
+        updated = dict(MANIFEST, nodes={})
+        manifest_path.write_text(json.dumps(updated))
+        os.utime(manifest_path, ns=(0, 0))
+        assert load_lineage_index(manifest_path) is not index
+
+    def test_missing_manifest(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_lineage_index(tmp_path / "manifest.json")
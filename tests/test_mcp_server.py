@@ -1,6 +1,9 @@
+import duckdb
 import pytest
 from fastmcp import Client
 
+from osler import mcp_server
+from osler.database.duckdb_client import DuckDB
 from osler.mcp_server import mcp
 
 
@@ -55,3 +58,29 @@ class TestMCPTools:
             )
             result_text = str(result.structured_content)
             assert "tuva_chronic_conditions__stg_core__condition" in result_text
+
+
+@pytest.fixture
+def fake_backend(tmp_path, monkeypatch):
+    """A small database behind the server instead of the Tuva demo data."""
+    path = tmp_path / "fake.duckdb"
+    with duckdb.connect(str(path)) as conn:
+        conn.execute("CREATE TABLE patient AS SELECT range AS person_id FROM range(3)")
+    backend = DuckDB(path)
+    monkeypatch.setattr(mcp_server, "_backend", backend)
+    yield backend
+    backend.close()
+
+
+class TestQueryOutput:
+    @pytest.mark.asyncio
+    async def test_rows_are_sent_once_as_text(self, fake_backend):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "execute_query", {"sql_query": "SELECT person_id FROM patient ORDER BY 1"}
+            )
+
+        [text] = result.content
+        assert text.text == "person_id\n0\n1\n2"
+        assert result.structured_content["rows"] == [[0], [1], [2]]
+        assert result.structured_content["columns"] == [{"name": "person_id", "type": "BIGINT"}]
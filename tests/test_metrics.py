@@ -0,0 +1,122 @@
+import time
+
+import duckdb
+import pytest
+
+from osler.database.duckdb_client import DuckDB
+from osler.metrics import Metrics
+
+
+class _Backend:
+    def get_schema(self):
+        return ["core.patient"]
+
+    def get_table_info(self, table_name):
+        raise ValueError(f"Table not found: {table_name}")
+
+
+class TestMetrics:
+    def test_timer_records_counts_errors_and_buckets(self):
+        metrics = Metrics(buckets=(0.01, 0.1))
+        metrics.observe("phase", "execute", 0.005)
+        metrics.observe("phase", "execute", 0.05, error=True)
+        with pytest.raises(RuntimeError), metrics.timer("phase", "render"):
+            raise RuntimeError("boom")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["phase"]["execute"]["count"] == 2
+        assert snapshot["phase"]["execute"]["errors"] == 1
+        assert snapshot["phase"]["execute"]["p50_ms"] == 10.0
+        assert snapshot["phase"]["render"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_decorator_counts_error_outputs(self):
+        metrics = Metrics()
+
+        @metrics.tool
+        async def execute_query(fail: bool):
+            return {"result": "", "error": fail}
+
+        await execute_query(False)
+        await execute_query(True)
+        assert execute_query.__name__ == "execute_query"
+        assert metrics.snapshot()["tool"]["execute_query"]["errors"] == 1
+
+    def test_instrument_backend_methods(self):
+        metrics = Metrics()
+        backend = _Backend()
+        metrics.instrument(backend, ("get_schema", "get_table_info"))
+
+        assert backend.get_schema() == ["core.patient"]
+        with pytest.raises(ValueError):
+            backend.get_table_info("nope")
+
+        backend_stats = metrics.snapshot()["backend"]
+        assert backend_stats["get_schema"]["errors"] == 0
+        assert backend_stats["get_table_info"]["errors"] == 1
+
+    def test_table_info_sample_is_not_an_execute_query_call(self, tmp_path):
+        path = tmp_path / "metrics.duckdb"
+        with duckdb.connect(str(path)) as conn:
+            conn.execute("CREATE TABLE patient AS SELECT 1 AS person_id")
+        backend = DuckDB(path)
+        metrics = Metrics()
+        metrics.instrument(backend, ("get_table_info", "execute_query"))
+
+        assert "Sample:" in backend.get_table_info("patient")
+        backend_stats = metrics.snapshot()["backend"]
+        assert backend_stats["get_table_info"]["count"] == 1
+        assert "execute_query" not in backend_stats
+        backend.close()
+
+    def test_prometheus_text(self):
+        metrics = Metrics(buckets=(0.01,))
+        metrics.observe("tool", "get_database_schema", 0.002)
+        metrics.increment("validator_rejections")
+        metrics.add_collector(lambda: {"result_cache_entries": 3, "result_cache_hits_total": 5})
+
+        lines = metrics.to_prometheus().splitlines()
+        assert 'osler_tool_duration_seconds_bucket{tool="get_database_schema",le="0.01"} 1' in lines
+        assert 'osler_tool_duration_seconds_bucket{tool="get_database_schema",le="+Inf"} 1' in lines
+        assert 'osler_tool_errors_total{tool="get_database_schema"} 0' in lines
+        assert "osler_validator_rejections_total 1" in lines
+        assert "# TYPE osler_result_cache_entries gauge" in lines
+        assert "osler_result_cache_entries 3" in lines
+        assert "# TYPE osler_result_cache_hits_total counter" in lines
+        assert "osler_result_cache_hits_total 5" in lines
+
+    def test_file_export_survives_failed_writes(self, tmp_path, caplog):
+        metrics = Metrics()
+        path = tmp_path / "missing_dir" / "osler.prom"
+        metrics.start_file_export(str(path), interval=0.01)
+
+        for _ in range(200):
+            if "Could not write metrics" in caplog.text:
+                break
+            time.sleep(0.01)
+        assert "Could not write metrics" in caplog.text
+
+        path.parent.mkdir()
+        for _ in range(200):
+            if path.exists():
+                break
+            time.sleep(0.01)
+        assert path.exists()
+
+    def test_disabled_is_a_no_op(self):
+        metrics = Metrics(enabled=False)
+
+        async def tool():
+            return "ok"
+
+        backend = _Backend()
+        get_schema = backend.get_schema
+        metrics.instrument(backend, ("get_schema",))
+
+        assert metrics.tool(tool) is tool
+        assert backend.get_schema == get_schema
+        with metrics.timer("phase", "validate"):
+            pass
+        metrics.increment("validator_rejections")
+        assert metrics.snapshot()["phase"] == {}
+        assert metrics.snapshot()["counters"] == {}
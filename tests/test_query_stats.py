@@ -0,0 +1,90 @@
+import duckdb
+
+from osler.query_stats import QueryStats, fingerprint_sql
+
+
+class TestFingerprint:
+    def test_literals_and_formatting_share_a_fingerprint(self):
+        a = fingerprint_sql("SELECT * FROM core.patient WHERE person_id = 1")
+        b = fingerprint_sql("select *\nfrom core.patient -- lookup\nwhere person_id = 42;")
+        assert a == b
+        assert a[1] == "select * from core . patient where person_id = ?"
+
+    def test_in_lists_collapse(self):
+        a = fingerprint_sql("SELECT 1 FROM t WHERE x IN (1, 2, 3) AND y = 'a'")
+        b = fingerprint_sql("SELECT 2 FROM t WHERE x IN (7) AND y = 'bb'")
+        assert a == b
+
+    def test_values_rows_collapse(self):
+        a = fingerprint_sql("INSERT INTO t VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+        b = fingerprint_sql("INSERT INTO t VALUES (4, 'd')")
+        assert a == b
+        assert a[1] == "insert into t values ( ? )"
+
+    def test_select_lists_do_not_collapse(self):
+        assert fingerprint_sql("SELECT 1, 2 FROM t")[0] != fingerprint_sql("SELECT 1 FROM t")[0]
+        assert fingerprint_sql("SELECT coalesce(a, 1, 2) FROM t")[1] == (
+            "select coalesce ( a , ? , ? ) from t"
+        )
+        # A subquery inside IN (...) keeps its select list
+        assert fingerprint_sql("SELECT * FROM t WHERE x IN (SELECT 1, 2)")[1] == (
+            "select * from t where x in ( select ? , ? )"
+        )
+
+    def test_structure_and_quoted_identifiers_are_kept(self):
+        assert fingerprint_sql('SELECT "A" FROM t')[0] != fingerprint_sql('SELECT "B" FROM t')[0]
+        assert fingerprint_sql("SELECT a FROM t")[0] != fingerprint_sql("SELECT b FROM t")[0]
+
+
+class TestQueryStats:
+    def test_aggregates_per_fingerprint(self):
+        stats = QueryStats()
+        stats.record("SELECT * FROM t WHERE id = 1", 0.010, rows=1)
+        stats.record("SELECT * FROM t WHERE id = 2", 0.030, rows=1)
+        stats.record("SELECT * FROM t WHERE id = 'x'", 0.002, error=True)
+        stats.record("SELECT count(*) FROM t", 0.001, rows=1)
+
+        top = stats.top(order_by="total_ms")
+        assert len(top) == 2
+        assert top[0].calls == 3
+        assert top[0].errors == 1
+        assert top[0].rows == 2
+        assert round(top[0].total_ms) == 42
+        assert round(top[0].max_ms) == 30
+        assert top[0].example == "SELECT * FROM t WHERE id = 1"
+
+    def test_pages_count_towards_the_original_query(self):
+        stats = QueryStats()
+        stats.record("SELECT * FROM t", 0.01, rows=50, continuation_token="tok")
+        stats.record_page("tok", 0.01, rows=50, next_token="tok")
+        stats.record_page("tok", 0.01, rows=20)
+        stats.record_page("tok", 0.01, rows=99)  # already exhausted
+
+        [entry] = stats.top()
+        assert entry.calls == 1
+        assert entry.rows == 120
+
+    def test_slow_log_keeps_the_slowest(self):
+        stats = QueryStats(slow_query_ms=100, slow_log_size=2)
+        for ms in (50, 150, 400, 200):
+            stats.record(f"SELECT {ms}", ms / 1000)
+        assert [round(q.duration_ms) for q in stats.slow_queries()] == [400, 200]
+
+    def test_fingerprints_are_bounded(self):
+        stats = QueryStats(max_fingerprints=2)
+        stats.record("SELECT a FROM t", 0.001)
+        stats.record("SELECT a FROM t", 0.001)
+        stats.record("SELECT b FROM t", 0.001)
+        stats.record("SELECT c FROM t", 0.001)
+        assert {s.query for s in stats.top()} == {"select a from t", "select c from t"}
+
+    def test_export_parquet(self, tmp_path):
+        stats = QueryStats(slow_query_ms=0)
+        stats.record("SELECT * FROM t WHERE id = 1", 0.01, rows=1)
+        stats_path, slow_path = stats.export_parquet(tmp_path)
+
+        conn = duckdb.connect()
+        assert conn.sql(f"SELECT calls, query FROM '{stats_path}'").fetchall() == [
+            (1, "select * from t where id = ?")
+        ]
+        assert conn.sql(f"SELECT count(*) FROM '{slow_path}'").fetchone() == (1,)
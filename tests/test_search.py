@@ -0,0 +1,135 @@
+import json
+
+from osler.database.catalog import Catalog, Column, Table
+from osler.search import (
+    build_search_index,
+    did_you_mean,
+    edit_distance,
+    load_search_index,
+    missing_identifier,
+    render_search,
+)
+
+CATALOG = Catalog(
+    [
+        Table("core", "patient", [Column("person_id", "VARCHAR"), Column("birth_date", "DATE")]),
+        Table("core", "encounter", [Column("encounter_id", "VARCHAR"), Column("paid", "DOUBLE")]),
+        Table(
+            "readmissions",
+            "readmission_summary",
+            [Column("encounter_id", "VARCHAR"), Column("unplanned_flag", "INTEGER")],
+        ),
+        Table("cms_hcc", "patient_risk_scores", [Column("raf_score", "DOUBLE")]),
+    ]
+)
+
+
+def _write_artifacts(tmp_path):
+    manifest = {
+        "nodes": {
+            "model.tuva.cms_hcc__patient_risk_scores": {
+                "resource_type": "model",
+                "name": "cms_hcc__patient_risk_scores",
+                "alias": "patient_risk_scores",
+                "schema": "cms_hcc",
+                "description": "Risk adjustment factor per patient and payment year.",
+                "columns": {"raf_score": {"description": "Normalized risk score"}},
+            },
+            "test.tuva.not_null": {"resource_type": "test", "name": "not_null"},
+        }
+    }
+    catalog = {
+        "nodes": {
+            "model.tuva.core__encounter": {
+                "metadata": {"schema": "core", "name": "encounter", "comment": None},
+                "columns": {"PAID": {"name": "paid", "comment": "Amount paid by the plan"}},
+            }
+        }
+    }
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(catalog))
+    return manifest_path, catalog_path
+
+
+def test_names_rank_above_columns():
+    index = build_search_index(CATALOG)
+    hits = index.search("readmission")
+    assert hits[0].table == "readmissions.readmission_summary"
+    assert [h.table for h in index.search("patient")][:2] == [
+        "core.patient",
+        "cms_hcc.patient_risk_scores",
+    ]
+
+
+def test_partial_words_and_typos():
+    index = build_search_index(CATALOG)
+    assert index.search("readmision")[0].table == "readmissions.readmission_summary"
+    assert index.search("unplan")[0].columns == [("unplanned_flag", "")]
+    assert index.search("zzzz") == []
+
+
+def test_dbt_descriptions_are_searchable(tmp_path):
+    manifest_path, catalog_path = _write_artifacts(tmp_path)
+    index = build_search_index(CATALOG, manifest_path, catalog_path)
+
+    [hit] = index.search("adjustment")
+    assert hit.table == "cms_hcc.patient_risk_scores"
+    assert hit.description.startswith("Risk adjustment factor")
+
+    hits = index.search("amount")
+    assert hits[0].table == "core.encounter"
+    assert hits[0].columns == [("paid", "Amount paid by the plan")]
+    assert "   - paid: Amount paid by the plan" in render_search("amount", hits)
+
+
+def test_index_is_cached_per_catalog_and_artifacts(tmp_path):
+    manifest_path, catalog_path = _write_artifacts(tmp_path)
+    index = load_search_index(CATALOG, manifest_path, catalog_path)
+    assert load_search_index(CATALOG, manifest_path, catalog_path) is index
+
+    manifest_path.write_text('{"nodes": {}}')
+    assert load_search_index(CATALOG, manifest_path, catalog_path) is not index
+
+
+def test_edit_distance():
+    assert edit_distance("patient", "patient") == 0
+    assert edit_distance("patent", "patient") == 1
+    assert edit_distance("encounter_id", "encountr_idd") == 2
+    assert edit_distance("", "abc") == 3
+
+
+def test_missing_identifier_from_duckdb_errors():
+    assert missing_identifier(
+        'Catalog Error: Table with name patent does not exist!\nDid you mean "patient"?'
+    ) == ("table", "patent")
+    assert missing_identifier(
+        'Binder Error: Referenced column "encountr_id" not found in FROM clause!'
+    ) == ("column", "encountr_id")
+    assert missing_identifier('Binder Error: Table "p" does not have a column named "paied"') == (
+        "column",
+        "paied",
+    )
+    assert missing_identifier("Parser Error: syntax error at end of input") is None
+
+
+def test_did_you_mean_tables():
+    hint = did_you_mean(
+        "Catalog Error: Table with name readmision_summary does not exist!", CATALOG
+    )
+    assert hint == "Did you mean table `readmissions.readmission_summary`?"
+    assert did_you_mean("Catalog Error: Table with name xyz does not exist!", CATALOG) is None
+
+
+def test_did_you_mean_columns_prefers_tables_in_the_query():
+    error = 'Binder Error: Referenced column "encountr_id" not found in FROM clause!'
+    hint = did_you_mean(error, CATALOG, "SELECT encountr_id FROM core.encounter")
+    assert (
+        hint
+        == "Did you mean column `encounter_id` (in core.encounter, readmissions.readmission_summary)?"
+    )
+
+    error = 'Binder Error: Table "p" does not have a column named "person"'
+    hint = did_you_mean(error, CATALOG, "SELECT p.person FROM core.patient p")
+    assert hint.startswith("Did you mean column `person_id` (in core.patient)")
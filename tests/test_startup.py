@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+
+def test_importing_the_server_is_side_effect_free(tmp_path):
+    """The server module must not open the database, write logs or load DuckDB on import."""
+    code = (
+        "import sys, osler.mcp_server as s; "
+        "assert s._backend is None; "
+        "assert 'duckdb' not in sys.modules, 'duckdb imported eagerly'; "
+        "assert 'osler.dbt.utils' not in sys.modules, 'dbt helpers imported eagerly'"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={"OSLER_DB_PATH": str(tmp_path / "missing.duckdb"), "PATH": ""},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == ""
+    assert not (tmp_path / "osler.log").exists()
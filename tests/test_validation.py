@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks.validation_corpus import (
+    GOLDEN_QUERY_DIR,
+    HANDWRITTEN,
+    corpus,
+    legacy_is_safe_query,
+)
+from osler.validation import is_safe_query
+
+
+def _assert_equivalent(sql_query: str) -> None:
+    expected = legacy_is_safe_query(sql_query)
+    actual = is_safe_query(sql_query)
+    assert actual[0] == expected[0], sql_query
+
+    # The legacy validator reports write keywords in set iteration order, so when
+    # several match only the category of the message is stable.
+    if expected[1].startswith("Write operation not allowed"):
+        keyword = actual[1].rsplit(": ", 1)[1]
+        assert actual[1].startswith("Write operation not allowed"), sql_query
+        assert f" {keyword} " in f" {sql_query.strip().upper()} ", sql_query
+    else:
+        assert actual[1] == expected[1], sql_query
+
+
+class TestIsSafeQuery:
+    @pytest.mark.parametrize("sql_query", HANDWRITTEN)
+    def test_matches_legacy_validator(self, sql_query):
+        _assert_equivalent(sql_query)
+
+    def test_matches_legacy_validator_on_corpus(self):
+        for sql_query in corpus():
+            _assert_equivalent(sql_query)
+
+    def test_golden_queries_are_allowed(self):
+        for path in sorted(GOLDEN_QUERY_DIR.glob("*.sql")):
+            assert is_safe_query(path.read_text())[0], path.name